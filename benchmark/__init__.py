@@ -0,0 +1,14 @@
+from rx.observable import Observable
+from rx.scheduler import DefaultScheduler
+
+
+class TimerCountingScheduler(DefaultScheduler):
+  """A DefaultScheduler that counts the timers it creates."""
+
+  def __init__(self):
+    super(TimerCountingScheduler, self).__init__()
+    self.timerCount = 0
+
+  def _scheduleRelativeCore(self, state, dueTime, action):
+    self.timerCount += 1
+    return super(TimerCountingScheduler, self)._scheduleRelativeCore(state, dueTime, action)
@@ -0,0 +1,48 @@
+"""Throughput of collecting a hot source that is fed by several
+threads with collect and collectParallel.
+
+Run with ``python -m benchmark.collect``."""
+
+from rx.observable import Observable
+from rx.subject import Subject
+from threading import Thread
+import time
+
+def add(acc, value):
+  return acc + value
+
+def measure(name, threads, count, collect):
+  subject = Subject()
+  it = iter(collect(subject))
+
+  def produce():
+    for i in range(count):
+      subject.onNext(i)
+
+  producers = [Thread(target=produce) for i in range(threads)]
+
+  start = time.time()
+
+  for producer in producers:
+    producer.start()
+
+  for producer in producers:
+    producer.join()
+
+  elapsed = time.time() - start
+  subject.onCompleted()
+
+  total = sum(it)
+  n = threads * count
+
+  assert total == threads * sum(range(count))
+
+  print("%-24s %2d threads %9d values %8.3fs %12.0f values/s" % (name, threads, n, elapsed, n / elapsed))
+
+def run(count=250000):
+  for threads in [1, 4]:
+    measure("collect", threads, count, lambda o: o.collect(lambda: 0, add, lambda _: 0))
+    measure("collectParallel", threads, count, lambda o: o.collectParallel(None, lambda: 0, add, add))
+
+if __name__ == '__main__':
+  run()
@@ -0,0 +1,43 @@
+"""Timer usage of delayRelative on the default scheduler.
+
+Run with ``python -m benchmark.delay``."""
+
+from benchmark import TimerCountingScheduler
+from rx.subject import Subject
+from threading import Event
+import time
+
+def measure(count, dueTime, batches):
+  scheduler = TimerCountingScheduler()
+  subject = Subject()
+  done = Event()
+  received = [0]
+
+  def onNext(value):
+    received[0] += 1
+
+  subject.delayRelative(dueTime, scheduler).subscribe(onNext, onComplete=done.set)
+
+  start = time.time()
+
+  for i in range(count):
+    subject.onNext(i)
+
+    if i % (count // batches) == 0:
+      time.sleep(dueTime / 2.0)
+
+  subject.onCompleted()
+  done.wait()
+
+  elapsed = time.time() - start
+
+  print("%8d values %8.3fs %12.0f values/s %8d timers %10.0f timers/s" % (
+    received[0], elapsed, received[0] / elapsed, scheduler.timerCount, scheduler.timerCount / elapsed
+  ))
+
+def run(count=100000):
+  for batches in (1, 10, 100):
+    measure(count, 0.01, batches)
+
+if __name__ == '__main__':
+  run()
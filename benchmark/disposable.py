@@ -0,0 +1,43 @@
+"""Throughput of CompositeDisposable with many members.
+
+Run with ``python -m benchmark.disposable``."""
+
+from rx.disposable import BooleanDisposable, CompositeDisposable
+import random
+import time
+
+def measure(name, count, action):
+  start = time.time()
+  action()
+  elapsed = time.time() - start
+
+  print("%-32s %8d ops %8.3fs %12.0f ops/s" % (name, count, elapsed, count / max(elapsed, 1e-9)))
+
+def run(count=10**5):
+  disposables = [BooleanDisposable() for _ in range(count)]
+  group = CompositeDisposable()
+
+  def add():
+    for d in disposables:
+      group.add(d)
+
+  def contains():
+    for d in disposables:
+      group.contains(d)
+
+  shuffled = list(disposables)
+  random.shuffle(shuffled)
+
+  def remove():
+    for d in shuffled:
+      group.remove(d)
+
+  measure("add", count, add)
+  measure("contains", count, contains)
+  measure("remove (random order)", count, remove)
+
+  group = CompositeDisposable([BooleanDisposable() for _ in range(count)])
+  measure("dispose", count, group.dispose)
+
+if __name__ == '__main__':
+  run()
@@ -0,0 +1,51 @@
+"""Ingest throughput of a log file through fromIterable over the file
+object compared with fromFile.
+
+Run with ``python -m benchmark.fromFile``."""
+
+from rx.observable import Observable
+from rx.scheduler import Scheduler
+import os
+import tempfile
+import time
+
+def measure(name, path, create):
+  received = [0]
+
+  def onNext(value):
+    received[0] += 1
+
+  start = time.time()
+
+  create(path).subscribe(onNext)
+
+  elapsed = time.time() - start
+  size = os.path.getsize(path)
+
+  print("%-24s %9d values %8.3fs %8.1f MB/s" % (
+    name, received[0], elapsed, size / elapsed / 1e6
+  ))
+
+def run(lines=500000):
+  fd, path = tempfile.mkstemp()
+
+  try:
+    line = b"2016-01-01 12:00:00 INFO request handled in 12ms\n"
+    os.write(fd, line * lines)
+    os.close(fd)
+
+    scheduler = Scheduler.currentThread
+
+    measure("fromIterable(open())", path,
+      lambda path: Observable.fromIterable(open(path, 'rb'), scheduler))
+    measure("fromFile lines", path,
+      lambda path: Observable.fromFile(path, scheduler=scheduler))
+    measure("fromFile chunks", path,
+      lambda path: Observable.fromFile(path, 'chunks', scheduler=scheduler))
+    measure("fromFile records", path,
+      lambda path: Observable.fromFile(path, 'records', recordSize=len(line), scheduler=scheduler))
+  finally:
+    os.remove(path)
+
+if __name__ == '__main__':
+  run()
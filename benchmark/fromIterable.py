@@ -0,0 +1,39 @@
+"""Wall-clock time of fromIterable for an iterator and an observer that
+both block, read in series compared with read ahead.
+
+Run with ``python -m benchmark.fromIterable``."""
+
+from rx.observable import Observable
+from rx.scheduler import Scheduler
+import time
+
+def slowIterator(count, delay):
+  for i in range(count):
+    time.sleep(delay)
+    yield i
+
+def measure(name, count, delay, **kwargs):
+  received = [0]
+
+  def onNext(value):
+    time.sleep(delay)
+    received[0] += 1
+
+  start = time.time()
+
+  Observable.fromIterable(slowIterator(count, delay), Scheduler.currentThread, **kwargs).subscribe(onNext)
+
+  elapsed = time.time() - start
+
+  print("%-24s %6d values %8.3fs %10.0f values/s" % (
+    name, received[0], elapsed, received[0] / elapsed
+  ))
+
+def run(count=1000, delay=0.001):
+  measure("in series", count, delay)
+
+  for prefetch in [1, 16, 256]:
+    measure("prefetch=%d" % prefetch, count, delay, prefetch=prefetch)
+
+if __name__ == '__main__':
+  run()
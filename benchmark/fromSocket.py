@@ -0,0 +1,58 @@
+"""Throughput of many socket connections served by the one thread of
+Scheduler.ioLoop: every connection echoes its received bytes through
+fromSocket and a SocketSink.
+
+Run with ``python -m benchmark.fromSocket``."""
+
+from rx.observable import Observable
+from rx.linq.fromSocket import SocketSink
+from threading import Event
+import socket
+import time
+
+def measure(connections, messages, size):
+  pairs = [socket.socketpair() for _ in range(connections)]
+  done = Event()
+  completed = [0]
+  payload = b"x" * size
+
+  def onCompleted():
+    completed[0] += 1
+
+    if completed[0] == connections:
+      done.set()
+
+  for server, client in pairs:
+    Observable.fromSocket(server).subscribe(SocketSink(server, closeOnCompleted=True))
+
+  writers = []
+
+  for server, client in pairs:
+    Observable.fromSocket(client).subscribe(lambda data: None, onComplete=onCompleted)
+    writers.append(SocketSink(client))
+
+  start = time.time()
+
+  for i in range(messages):
+    for writer in writers:
+      writer.onNext(payload)
+
+  for writer in writers:
+    writer.onCompleted()
+
+  done.wait()
+
+  elapsed = time.time() - start
+  total = connections * messages * size
+
+  print("%6d connections %8.3fs %10.1f MB/s echoed" % (connections, elapsed, total / elapsed / 1e6))
+
+  for server, client in pairs:
+    client.close()
+
+def run(total=20 * 10**6, size=1024):
+  for connections in [10, 100, 1000]:
+    measure(connections, max(total // (connections * size), 1), size)
+
+if __name__ == '__main__':
+  run()
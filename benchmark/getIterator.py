@@ -0,0 +1,43 @@
+"""Throughput of iterating an Observable that is fed by a fast hot
+source on another thread.
+
+Run with ``python -m benchmark.getIterator``."""
+
+from rx.observable import Observable
+from rx.subject import Subject
+from threading import Thread
+import time
+
+def measure(name, count, **kwargs):
+  subject = Subject()
+  it = subject.getIterator(**kwargs)
+
+  def produce():
+    for i in range(count):
+      subject.onNext(i)
+
+    subject.onCompleted()
+
+  producer = Thread(target=produce)
+
+  start = time.time()
+  producer.start()
+
+  n = 0
+
+  for value in it:
+    n += 1
+
+  elapsed = time.time() - start
+  producer.join()
+
+  print("%-24s %9d values %8.3fs %12.0f values/s" % (name, n, elapsed, n / elapsed))
+
+def run(count=10**6):
+  measure("unbounded", count)
+
+  for maxBuffered in [64, 1024, 65536]:
+    measure("maxBuffered=%d" % maxBuffered, count, maxBuffered=maxBuffered)
+
+if __name__ == '__main__':
+  run()
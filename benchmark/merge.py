@@ -0,0 +1,51 @@
+"""Throughput of merge with the shared lock compared with the
+queue-drain mode for many concurrent producers.
+
+Run with ``python -m benchmark.merge``."""
+
+from rx.observable import Observable
+from rx.scheduler import Scheduler
+from rx.subject import Subject
+from threading import Event, Thread
+import time
+
+def measure(name, producers, count, **kwargs):
+  subjects = [Subject() for _ in range(producers)]
+  done = Event()
+
+  Observable.fromIterable(subjects, Scheduler.immediate).merge(**kwargs).subscribe(lambda x: None, onComplete=done.set)
+
+  def produce(subject):
+    for i in range(count):
+      subject.onNext(i)
+
+    subject.onCompleted()
+
+  threads = [Thread(target=produce, args=(s,)) for s in subjects]
+
+  start = time.time()
+
+  for t in threads:
+    t.start()
+  for t in threads:
+    t.join()
+
+  done.wait()
+
+  elapsed = time.time() - start
+  total = producers * count
+
+  print("%-20s %3d producers %8.3fs %12.0f msgs/s" % (name, producers, elapsed, total / max(elapsed, 1e-9)))
+
+def run(values=200000):
+  producers = 1
+
+  while producers <= 64:
+    count = max(values // producers, 1)
+    measure("merge", producers, count)
+    measure("merge drain", producers, count, drain=True)
+    measure("merge drain prefetch", producers, count, drain=True, prefetch=128, batchSize=16)
+    producers *= 2
+
+if __name__ == '__main__':
+  run()
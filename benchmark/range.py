@@ -0,0 +1,41 @@
+"""Per-value cost of range and fromIterable on the current thread
+scheduler for one value per scheduling turn compared with chunks.
+
+Run with ``python -m benchmark.range``."""
+
+from rx.observable import Observable
+from rx.scheduler import Scheduler
+import time
+
+def measure(name, count, create):
+  received = [0]
+
+  def onNext(value):
+    received[0] += 1
+
+  start = time.time()
+
+  create(count).subscribe(onNext)
+
+  elapsed = time.time() - start
+
+  print("%-28s %9d values %8.3fs %10.2f us/value" % (
+    name, received[0], elapsed, elapsed * 1e6 / count
+  ))
+
+def run(count=10**6):
+  scheduler = Scheduler.currentThread
+
+  for chunkSize in [1, 16, 128, 1024]:
+    n = count // 10 if chunkSize == 1 else count
+
+    measure("range chunkSize=%d" % chunkSize, n,
+      lambda n: Observable.range(0, n, scheduler, chunkSize=chunkSize))
+    measure("fromIterable chunkSize=%d" % chunkSize, n,
+      lambda n: Observable.fromIterable(range(n), scheduler, chunkSize=chunkSize))
+
+  measure("range timeBudget=0.01", count,
+    lambda n: Observable.range(0, n, scheduler, timeBudget=0.01))
+
+if __name__ == '__main__':
+  run()
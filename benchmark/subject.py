@@ -0,0 +1,39 @@
+"""Multi-producer throughput of ConcurrentSubject compared with
+Subject.synchronize.
+
+Run with ``python -m benchmark.subject``."""
+
+from rx.observable import Observable
+from rx.subject import ConcurrentSubject, Subject
+from threading import Thread
+import time
+
+def measure(name, producers, count, factory):
+  subject = factory()
+  subject.subscribe(lambda x: None)
+
+  def produce():
+    for i in range(count):
+      subject.onNext(i)
+
+  threads = [Thread(target=produce) for _ in range(producers)]
+
+  start = time.time()
+
+  for t in threads:
+    t.start()
+  for t in threads:
+    t.join()
+
+  elapsed = time.time() - start
+  total = producers * count
+
+  print("%-24s %3d producers %8.3fs %12.0f msgs/s" % (name, producers, elapsed, total / max(elapsed, 1e-9)))
+
+def run(count=20000):
+  for producers in (2, 4, 8, 16):
+    measure("Subject.synchronize", producers, count, lambda: Subject.synchronize(Subject()))
+    measure("ConcurrentSubject", producers, count, ConcurrentSubject)
+
+if __name__ == '__main__':
+  run()
@@ -0,0 +1,44 @@
+"""Per-value cost of the time-windowed tail operators for a chatty
+source with the clock read on every value and every 64 values.
+
+Run with ``python -m benchmark.takeLast``."""
+
+from rx.scheduler import Scheduler
+from rx.subject import Subject
+import time
+
+def measure(name, count, create):
+  subject = Subject()
+  received = [0]
+
+  def onNext(value):
+    received[0] += 1
+
+  create(subject).subscribe(onNext)
+
+  start = time.time()
+
+  for i in range(count):
+    subject.onNext(i)
+
+  subject.onCompleted()
+
+  elapsed = time.time() - start
+
+  print("%-28s %8d values %8.3fs %10.2f us/value %8d yielded" % (
+    name, count, elapsed, elapsed * 1e6 / count, received[0]
+  ))
+
+def run(count=500000):
+  scheduler = Scheduler.immediate
+
+  for sampleEvery in [1, 64]:
+    measure("takeLastWithTime %d" % sampleEvery, count,
+      lambda o: o.takeLastWithTime(0.01, scheduler, sampleEvery))
+    measure("skipLastWithTime %d" % sampleEvery, count,
+      lambda o: o.skipLastWithTime(0.01, scheduler, sampleEvery))
+    measure("takeLastBufferWithTime %d" % sampleEvery, count,
+      lambda o: o.takeLastBufferWithTime(0.01, scheduler, sampleEvery))
+
+if __name__ == '__main__':
+  run()
@@ -0,0 +1,43 @@
+"""Timer usage of throttle for a chatty source on the default
+scheduler.
+
+Run with ``python -m benchmark.throttle``."""
+
+from benchmark import TimerCountingScheduler
+from rx.subject import Subject
+from threading import Event
+import time
+
+def measure(name, count, dueTime, **kwargs):
+  scheduler = TimerCountingScheduler()
+  subject = Subject()
+  done = Event()
+  received = [0]
+
+  def onNext(value):
+    received[0] += 1
+
+  subject.throttle(dueTime, scheduler, **kwargs).subscribe(onNext, onComplete=done.set)
+
+  start = time.time()
+
+  for i in range(count):
+    subject.onNext(i)
+
+  time.sleep(dueTime * 2)
+  subject.onCompleted()
+  done.wait()
+
+  elapsed = time.time() - start
+
+  print("%-16s %8d values %8.3fs %12.0f values/s %6d yielded %6d timers" % (
+    name, count, elapsed, count / elapsed, received[0], scheduler.timerCount
+  ))
+
+def run(count=50000):
+  measure("trailing", count, 0.05)
+  measure("leading", count, 0.05, leading=True, trailing=False)
+  measure("maxWait", count, 0.05, maxWait=0.1)
+
+if __name__ == '__main__':
+  run()
@@ -0,0 +1,36 @@
+"""Timer usage of timeoutRelative for many concurrent streams on
+the default scheduler.
+
+Run with ``python -m benchmark.timeout``."""
+
+from benchmark import TimerCountingScheduler
+from rx.subject import Subject
+import time
+
+def measure(streams, values):
+  scheduler = TimerCountingScheduler()
+  subjects = [Subject() for _ in range(streams)]
+  subscriptions = [s.timeoutRelative(5.0, scheduler=scheduler).subscribe(lambda x: None) for s in subjects]
+
+  start = time.time()
+
+  for i in range(values):
+    for s in subjects:
+      s.onNext(i)
+
+  elapsed = time.time() - start
+  total = streams * values
+
+  for d in subscriptions:
+    d.dispose()
+
+  print("%8d streams %8d values %8.3fs %12.0f values/s %6d timers %10.1f timers/s" % (
+    streams, total, elapsed, total / elapsed, scheduler.timerCount, scheduler.timerCount / elapsed
+  ))
+
+def run():
+  for streams in (100, 1000, 10000, 100000):
+    measure(streams, max(2 * 10**5 // streams, 1))
+
+if __name__ == '__main__':
+  run()
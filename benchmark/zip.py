@@ -0,0 +1,35 @@
+"""Per-value cost of zip and combineLatest for a growing number
+of sources.
+
+Run with ``python -m benchmark.zip``."""
+
+from rx.observable import Observable
+from rx.subject import Subject
+import time
+
+def measure(name, n, rounds, combine):
+  subjects = [Subject() for _ in range(n)]
+  combine(subjects).subscribe(lambda x: None)
+
+  start = time.time()
+
+  for i in range(rounds):
+    for s in subjects:
+      s.onNext(i)
+
+  elapsed = time.time() - start
+  total = n * rounds
+
+  print("%-16s %3d sources %8.3fs %10.2f us/value" % (name, n, elapsed, elapsed * 1e6 / total))
+
+def run(values=200000):
+  n = 2
+
+  while n <= 256:
+    rounds = max(values // n, 1)
+    measure("zip", n, rounds, lambda sources: sources[0].zip(sources[1:]))
+    measure("combineLatest", n, rounds, lambda sources: sources[0].combineLatest(sources[1:]))
+    n *= 2
+
+if __name__ == '__main__':
+  run()
@@ -1,5 +1,5 @@
 from rx.concurrency import Atomic
-from collections import deque
+from collections import deque, OrderedDict
 
 class Disposable(object):
   """Represents a disposable object"""
@@ -74,14 +74,19 @@ class CompositeDisposable(Cancelable):
   def __init__(self, *disposables):
     super(CompositeDisposable, self).__init__()
 
-    if len(disposables) == 0:
-      self.disposables = []
-    elif len(disposables) == 1 and not isinstance(disposables[0], Disposable):
-      self.disposables = [d for d in disposables[0] if d != None]
-    else:
-      self.disposables = [d for d in disposables if d != None]
+    if len(disposables) == 1 and not isinstance(disposables[0], Disposable):
+      disposables = disposables[0]
 
-    self.length = len(self.disposables)
+    # Maps each disposable to the number of times it has been added.
+    # Membership tests, insertion and removal are O(1) and the
+    # insertion order is kept for dispose.
+    self.disposables = OrderedDict()
+    self.length = 0
+
+    for disposable in disposables:
+      if disposable != None:
+        self.disposables[disposable] = self.disposables.get(disposable, 0) + 1
+        self.length += 1
 
   def add(self, disposable):
     shouldDispose = False
@@ -90,7 +95,7 @@ class CompositeDisposable(Cancelable):
       shouldDispose = self.isDisposed
 
       if not shouldDispose:
-        self.disposables.append(disposable)
+        self.disposables[disposable] = self.disposables.get(disposable, 0) + 1
         self.length += 1
 
     if shouldDispose:
@@ -98,40 +103,38 @@ class CompositeDisposable(Cancelable):
 
   def contains(self, disposable):
     with self.lock:
-      return self.disposables.index(disposable) >= 0
+      return disposable in self.disposables
 
   def remove(self, disposable):
-    shouldDispose = False
-
     with self.lock:
       if self.isDisposed:
         return False
 
-      index = self.disposables.index(disposable)
+      count = self.disposables.get(disposable, 0)
 
-      if index < 0:
+      if count == 0:
         return False
 
-      shouldDispose = True
+      if count == 1:
+        del self.disposables[disposable]
+      else:
+        self.disposables[disposable] = count - 1
 
-      self.disposables.remove(disposable)
       self.length -= 1
 
-    if shouldDispose:
-      disposable.dispose()
+    disposable.dispose()
 
-    return shouldDispose
+    return True
 
   def clear(self):
-    disposables = []
-
     with self.lock:
       disposables = self.disposables
-      self.disposables = []
+      self.disposables = OrderedDict()
       self.length = 0
 
-    for disposable in disposables:
-      disposable.dispose()
+    for disposable, count in disposables.items():
+      for _ in range(count):
+        disposable.dispose()
 
   def dispose(self):
     if not self._isDisposed.exchange(True):
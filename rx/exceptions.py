@@ -16,3 +16,8 @@ class DisposedException(Exception):
 class TimeoutException(Exception):
   def __init__(self):
     super(TimeoutException, self).__init__("Operation timed out")
+
+
+class QueueOverflowException(Exception):
+  def __init__(self, capacity):
+    super(QueueOverflowException, self).__init__("Queue exceeded its capacity of %d" % capacity)
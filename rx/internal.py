@@ -26,5 +26,8 @@ class Struct(object):
 
     return self.__dict__ == other.__dict__
 
+  # identity hash like on Python 2, Python 3 drops it when __eq__ is defined
+  __hash__ = object.__hash__
+
   def __repr__(self):
     return repr(self.__dict__)
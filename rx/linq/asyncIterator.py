@@ -0,0 +1,88 @@
+from .getIterator import GetIterator
+from rx.exceptions import DisposedException
+
+try:
+  import asyncio
+except ImportError:
+  asyncio = None
+
+
+class AsyncIterator(GetIterator):
+  """Hands the values over to a coroutine iterating with async for on
+  loop. A coroutine waiting for values is woken up by a single
+  call_soon_threadsafe per burst, the rest of the burst is then taken
+  from the buffer without waking up the loop again.
+
+  With maxBuffered producers on other threads block like they do for
+  GetIterator. The loop thread is never blocked."""
+
+  def __init__(self, loop, maxBuffered=None):
+    super(AsyncIterator, self).__init__(maxBuffered)
+    self.loop = loop
+    self.waiter = None
+    self.isWakeupScheduled = False
+
+  def wakeConsumer(self):
+    if not self.isWakeupScheduled:
+      self.isWakeupScheduled = True
+      self.loop.call_soon_threadsafe(self.wakeup)
+
+  def terminate(self):
+    super(AsyncIterator, self).terminate()
+
+    if self.consumerWaiting:
+      self.wakeConsumer()
+
+  def isReady(self):
+    return len(self.queue) > 0 or self.done or self.disposed
+
+  def wakeup(self):
+    self.isWakeupScheduled = False
+    waiter = self.waiter
+
+    if waiter != None and self.isReady():
+      self.waiter = None
+      self.consumerWaiting = False
+      self.resolve(waiter)
+
+  def __aiter__(self):
+    return self
+
+  def __anext__(self):
+    future = self.loop.create_future()
+
+    if self.isReady():
+      self.resolve(future)
+    else:
+      self.waiter = future
+      self.consumerWaiting = True
+
+      # a value could have arrived before consumerWaiting was set
+      if self.isReady():
+        self.wakeup()
+
+    return future
+
+  def resolve(self, future):
+    if future.done():
+      # the awaiting task was cancelled
+      return
+
+    if self.disposed:
+      future.set_exception(DisposedException())
+      return
+
+    try:
+      value = self.queue.popleft()
+    except IndexError:
+      if self.error != None:
+        future.set_exception(self.error)
+      else:
+        future.set_exception(StopAsyncIteration())
+
+      return
+
+    future.set_result(value)
+
+    if self.producerWaiting:
+      self.wakeProducer()
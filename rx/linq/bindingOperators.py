@@ -1,3 +1,4 @@
+from .cached import ObservableCache
 from .multicast import Multicast
 from .refCount import RefCount
 
@@ -12,6 +13,25 @@ import sys
 #     Binding      #
 ####################
 
+defaultCache = ObservableCache(scheduler=Scheduler.timeBasedOperation)
+
+def cached(key, factory, ttl=None, maxEntries=None, cache=None):
+  assert callable(factory)
+
+  if cache == None:
+    # the default cache is shared by the whole process
+    assert maxEntries == None, "maxEntries requires a cache"
+
+    cache = defaultCache
+
+  assert isinstance(cache, ObservableCache)
+
+  if maxEntries != None:
+    cache.maxEntries = maxEntries
+
+  return cache.get(key, factory, ttl)
+Observable.cached = staticmethod(cached)
+
 def multicast(self, subject):
   assert isinstance(self, Observable)
   assert isinstance(subject, Observable)
@@ -57,10 +77,11 @@ def publishLast(self, selector=None):
     return self.multicastIndividual(lambda: AsyncSubject(), selector)
 Observable.publishLast = publishLast
 
-def refCount(self):
+def refCount(self, gracePeriod=None, scheduler=Scheduler.timeBasedOperation):
   assert isinstance(self, ConnectableObservable)
+  assert isinstance(scheduler, Scheduler)
 
-  return RefCount(self)
+  return RefCount(self, gracePeriod, scheduler)
 Observable.refCount = refCount
 
 def replay(self, bufferSize=sys.maxsize, window=sys.maxsize, selector=None, scheduler=Scheduler.currentThread):
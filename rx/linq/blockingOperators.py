@@ -1,4 +1,4 @@
-from .collect import Collect
+from .collect import Collect, CollectParallel
 from .forEach import ForEach
 from .getIterator import GetIterator
 from .latest import Latest
@@ -31,6 +31,16 @@ def collect(self, getInitialCollector, merge, getNewCollector=None):
     return Collect(self, getInitialCollector, merge, getNewCollector)
 Observable.collect = collect
 
+def collectParallel(self, partitioner, initial, merge, combine):
+  assert isinstance(self, Observable)
+  assert partitioner == None or callable(partitioner)
+  assert callable(initial)
+  assert callable(merge)
+  assert callable(combine)
+
+  return CollectParallel(self, partitioner, initial, merge, combine)
+Observable.collectParallel = collectParallel
+
 def firstOrDefaultInternal(source, throwOnEmpty, default):
   state = Struct(
     value=None,
@@ -116,10 +126,11 @@ def forEachEnumerate(self, onNext):
     raise sink.exception
 Observable.forEachEnumerate = forEachEnumerate
 
-def getIterator(self):
+def getIterator(self, maxBuffered=None):
   assert isinstance(self, Observable)
+  assert maxBuffered == None or maxBuffered > 0
 
-  e = GetIterator()
+  e = GetIterator(maxBuffered)
   return e.run(self)
 Observable.getIterator = getIterator
 Observable.__iter__ = getIterator
@@ -1,13 +1,236 @@
 from rx.disposable import Disposable, CompositeDisposable, SingleAssignmentDisposable, SerialDisposable
+from rx.exceptions import InvalidOperationException
 from rx.internal import Struct
 from rx.observable import Producer
 import rx.linq.sink
+from array import array
 from collections import deque
 from threading import RLock
 
 
+class RingBuffer(object):
+  """Keeps the last capacity values. Every value is stored twice,
+  at index i and i + capacity, so the last n values always form one
+  contiguous slice of the storage."""
+
+  def __init__(self, capacity, typecode=None):
+    self.capacity = capacity
+    self.written = 0
+
+    if typecode == None:
+      self.storage = [None] * (2 * capacity)
+    else:
+      self.storage = array(typecode, [0]) * (2 * capacity)
+
+  def append(self, value):
+    i = self.written % self.capacity
+    self.storage[i] = value
+    self.storage[i + self.capacity] = value
+    self.written += 1
+
+  def view(self, start, end):
+    """Returns a view of the values with the sequence
+    numbers start until end."""
+    return RingBufferView(self, start, end - start)
+
+
+class RingBufferView(object):
+  """A read-only view of a slice of a RingBuffer. The view is only
+  valid until the ring buffer overwrote its first value, use tolist to
+  keep the values."""
+
+  def __init__(self, ring, seq, length):
+    self.ring = ring
+    self.seq = seq
+    self.length = length
+    self.offset = seq % ring.capacity
+
+  @property
+  def isValid(self):
+    return self.ring.written - self.seq <= self.ring.capacity
+
+  def checkValid(self):
+    if not self.isValid:
+      raise InvalidOperationException("Buffer view was overwritten")
+
+  def __len__(self):
+    return self.length
+
+  def __getitem__(self, index):
+    self.checkValid()
+
+    if isinstance(index, slice):
+      return [self[i] for i in range(*index.indices(self.length))]
+
+    if index < 0:
+      index += self.length
+
+    if index < 0 or index >= self.length:
+      raise IndexError("Buffer view index out of range")
+
+    return self.ring.storage[self.offset + index]
+
+  def __iter__(self):
+    self.checkValid()
+
+    for i in range(self.offset, self.offset + self.length):
+      yield self.ring.storage[i]
+
+  def __eq__(self, other):
+    try:
+      return self.tolist() == list(other)
+    except TypeError:
+      return False
+
+  def __ne__(self, other):
+    return not self == other
+
+  def __repr__(self):
+    return "RingBufferView(%r)" % self.tolist()
+
+  def tolist(self):
+    self.checkValid()
+    return list(self.ring.storage[self.offset:self.offset + self.length])
+
+  def memoryview(self):
+    """Returns a memoryview of the values without copying, or a
+    buffer of their bytes on Python 2. Requires a typecode."""
+    self.checkValid()
+    storage = self.ring.storage
+
+    try:
+      view = memoryview(storage)
+    except TypeError:
+      itemsize = storage.itemsize
+      return buffer(storage, self.offset * itemsize, self.length * itemsize)
+
+    return view[self.offset:self.offset + self.length]
+
+
+class ListStorage(object):
+  def __init__(self, count):
+    self.values = []
+
+  def __len__(self):
+    return len(self.values)
+
+  def append(self, value):
+    self.values.append(value)
+
+  def take(self):
+    values = self.values
+    self.values = []
+    return values
+
+
+class ArrayStorage(object):
+  """Collects up to count values in a preallocated array.array."""
+
+  def __init__(self, count, typecode):
+    self.count = count
+    self.typecode = typecode
+    self.allocate()
+
+  def allocate(self):
+    self.values = array(self.typecode, [0]) * self.count
+    self.n = 0
+
+  def __len__(self):
+    return self.n
+
+  def append(self, value):
+    self.values[self.n] = value
+    self.n += 1
+
+  def take(self):
+    values = self.values if self.n == self.count else self.values[:self.n]
+    self.allocate()
+    return values
+
+
+class NdarrayStorage(ArrayStorage):
+  """Collects up to count values in a preallocated numpy.ndarray,
+  a partially filled array is yielded as view."""
+
+  def __init__(self, count, typecode):
+    import numpy
+    self.numpy = numpy
+    super(NdarrayStorage, self).__init__(count, typecode)
+
+  def allocate(self):
+    self.values = self.numpy.empty(self.count, dtype=self.typecode)
+    self.n = 0
+
+
+class ColumnStorage(object):
+  """Collects up to count records, sequences of equal length, as one
+  column per field. typecode is either None for list columns, a single
+  typecode for all columns or one typecode per column."""
+
+  def __init__(self, count, typecode):
+    self.count = count
+    self.typecode = typecode
+    self.width = None
+    self.columns = ()
+    self.n = 0
+
+  def allocate(self):
+    if self.typecode == None:
+      typecodes = [None] * self.width
+    elif len(self.typecode) == 1:
+      typecodes = self.typecode * self.width
+    else:
+      typecodes = self.typecode
+
+    self.columns = tuple(
+      [None] * self.count if t == None else array(t, [0]) * self.count
+      for t in typecodes
+    )
+    self.n = 0
+
+  def __len__(self):
+    return self.n
+
+  def append(self, record):
+    if self.width == None:
+      self.width = len(record)
+      self.allocate()
+
+    n = self.n
+
+    for column, value in zip(self.columns, record):
+      column[n] = value
+
+    self.n = n + 1
+
+  def take(self):
+    if self.width == None:
+      return ()
+
+    if self.n == self.count:
+      columns = self.columns
+    else:
+      columns = tuple(column[:self.n] for column in self.columns)
+
+    self.allocate()
+    return columns
+
+
+def createStorage(into, count, typecode):
+  if into == 'list':
+    return ListStorage(count)
+  elif into == 'array':
+    return ArrayStorage(count, typecode)
+  elif into == 'ndarray':
+    return NdarrayStorage(count, typecode)
+  elif into == 'columns':
+    return ColumnStorage(count, typecode)
+  else:
+    raise ValueError("Unknown buffer storage: %s" % into)
+
+
 class Buffer(Producer):
-  def __init__(self, source, count=0, skip=0, timeSpan=0, timeShift=0, scheduler=None):
+  def __init__(self, source, count=0, skip=0, timeSpan=0, timeShift=0, scheduler=None, view=False, typecode=None, into='list'):
     if skip == 0:
       skip = count
 
@@ -17,9 +240,20 @@ class Buffer(Producer):
     self.timeShift = timeShift
     self.timeSpan = timeSpan
     self.scheduler = scheduler
+    self.view = view # yield views of a ring buffer instead of lists
+    self.typecode = typecode
+    self.into = into # the kind of storage the values are collected in
 
   def run(self, observer, cancel, setSink):
-    if self.scheduler == None:
+    if self.view:
+      sink = self.SinkWithRing(self, observer, cancel)
+      setSink(sink)
+      return self.source.subscribeSafe(sink)
+    elif self.scheduler == None and self.into != 'list':
+      sink = self.SinkWithStorage(self, observer, cancel)
+      setSink(sink)
+      return self.source.subscribeSafe(sink)
+    elif self.scheduler == None:
       sink = self.SinkWithCount(self, observer, cancel)
       setSink(sink)
       return sink.run()
@@ -88,6 +322,81 @@ class Buffer(Producer):
       self.observer.onCompleted()
       self.dispose()
 
+  class SinkWithRing(rx.linq.sink.Sink):
+    """Stores every value once in a ring buffer of count values and
+    yields views of it, so each value costs O(1) no matter how much
+    the buffers overlap."""
+
+    def __init__(self, parent, observer, cancel):
+      super(Buffer.SinkWithRing, self).__init__(observer, cancel)
+      self.parent = parent
+      self.ring = RingBuffer(parent.count, parent.typecode)
+
+    def onNext(self, value):
+      ring = self.ring
+
+      try:
+        ring.append(value)
+      except Exception as e:
+        self.observer.onError(e)
+        self.dispose()
+        return
+
+      start = ring.written - self.parent.count
+
+      if start >= 0 and start % self.parent.skip == 0:
+        self.observer.onNext(ring.view(start, ring.written))
+
+    def onError(self, exception):
+      self.observer.onError(exception)
+      self.dispose()
+
+    def onCompleted(self):
+      ring = self.ring
+      skip = self.parent.skip
+
+      # the buffers that started but did not fill up
+      start = max(ring.written - self.parent.count + 1, 0)
+      start += -start % skip
+
+      while start < ring.written:
+        self.observer.onNext(ring.view(start, ring.written))
+        start += skip
+
+      self.observer.onCompleted()
+      self.dispose()
+
+  class SinkWithStorage(rx.linq.sink.Sink):
+    """Collects buffers of count values that do not overlap
+    directly into typed storage."""
+
+    def __init__(self, parent, observer, cancel):
+      super(Buffer.SinkWithStorage, self).__init__(observer, cancel)
+      self.parent = parent
+      self.storage = createStorage(parent.into, parent.count, parent.typecode)
+
+    def onNext(self, value):
+      try:
+        self.storage.append(value)
+      except Exception as e:
+        self.observer.onError(e)
+        self.dispose()
+        return
+
+      if len(self.storage) == self.parent.count:
+        self.observer.onNext(self.storage.take())
+
+    def onError(self, exception):
+      self.observer.onError(exception)
+      self.dispose()
+
+    def onCompleted(self):
+      if len(self.storage) > 0:
+        self.observer.onNext(self.storage.take())
+
+      self.observer.onCompleted()
+      self.dispose()
+
   class SinkWithTimeSpan(rx.linq.sink.Sink):
     def __init__(self, parent, observer, cancel):
       super(Buffer.SinkWithTimeSpan, self).__init__(observer, cancel)
@@ -222,7 +531,7 @@ class Buffer(Producer):
 
     def run(self):
       self.gate = RLock()
-      self.list = []
+      self.storage = createStorage(self.parent.into, self.parent.count, self.parent.typecode)
       self.n = 0
       self.windowId = 0
 
@@ -256,8 +565,7 @@ class Buffer(Producer):
         self.windowId += 1
         newId = self.windowId
 
-        res = self.list
-        self.list = []
+        res = self.storage.take()
         self.observer.onNext(res)
 
       self.createTimer(newId)
@@ -269,7 +577,13 @@ class Buffer(Producer):
       newId = 0
 
       with self.gate:
-        self.list.append(value)
+        try:
+          self.storage.append(value)
+        except Exception as e:
+          self.observer.onError(e)
+          self.dispose()
+          return
+
         self.n += 1
 
         if self.n == self.parent.count:
@@ -277,8 +591,7 @@ class Buffer(Producer):
           self.windowId += 1
           newId = self.windowId
 
-          res = self.list
-          self.list = []
+          res = self.storage.take()
           self.n = 0
           self.observer.onNext(res)
 
@@ -287,12 +600,11 @@ class Buffer(Producer):
 
     def onError(self, exception):
       with self.gate:
-        self.list.clear()
         self.observer.onError(exception)
         self.dispose()
 
     def onCompleted(self):
       with self.gate:
-        self.observer.onNext(self.list)
+        self.observer.onNext(self.storage.take())
         self.observer.onCompleted()
         self.dispose()
\ No newline at end of file
@@ -0,0 +1,218 @@
+from rx.observable import ConnectableObservable, Producer
+from rx.observer import Observer
+from rx.scheduler import Scheduler
+from rx.subject import ReplaySubject
+import rx.linq.sink
+from collections import OrderedDict
+import heapq
+from threading import RLock
+import sys
+
+
+class Cached(Producer):
+  """A shared observable that connects to its source on the
+  first subscription and replays the results to every
+  later subscriber. Once the entry left the cache its subscribers
+  complete and new subscriptions go to renew(), the current entry
+  for the key."""
+
+  def __init__(self, source, bufferSize, expiresAt, renew=None):
+    self.connectable = ConnectableObservable(source, ReplaySubject(bufferSize))
+    self.expiresAt = expiresAt
+    self.gate = RLock()
+    self.isConnected = False
+    self.isDisconnected = False
+    self.hasFailed = False
+    self.connection = None
+    self.failureSubscription = None
+    self.renew = renew
+
+  def connect(self):
+    with self.gate:
+      if self.isConnected or self.isDisconnected:
+        return
+
+      self.isConnected = True
+      self.failureSubscription = self.connectable.subscribeSafe(self.FailureObserver(self))
+      self.connection = self.connectable.connect()
+
+  def disconnect(self):
+    """Unsubscribes from the source once the entry left the cache
+    and completes the current subscribers."""
+    with self.gate:
+      self.isDisconnected = True
+      connection = self.connection
+      failureSubscription = self.failureSubscription
+      self.connection = None
+      self.failureSubscription = None
+
+    if connection != None:
+      connection.dispose()
+
+    if failureSubscription != None:
+      failureSubscription.dispose()
+
+    self.connectable.subject.onCompleted()
+
+  def run(self, observer, cancel, setSink):
+    if self.isDisconnected and self.renew != None:
+      return self.renew().run(observer, cancel, setSink)
+
+    sink = self.Sink(self, observer, cancel)
+    setSink(sink)
+    return sink.run()
+
+  class FailureObserver(Observer):
+    def __init__(self, parent):
+      self.parent = parent
+
+    def onNext(self, value):
+      pass
+
+    def onError(self, exception):
+      self.parent.hasFailed = True
+
+    def onCompleted(self):
+      pass
+
+  class Sink(rx.linq.sink.Sink):
+    def __init__(self, parent, observer, cancel):
+      super(Cached.Sink, self).__init__(observer, cancel)
+      self.parent = parent
+
+    def run(self):
+      subscription = self.parent.connectable.subscribeSafe(self)
+      self.parent.connect()
+
+      return subscription
+
+    def onNext(self, value):
+      self.observer.onNext(value)
+
+    def onError(self, exception):
+      self.observer.onError(exception)
+      self.dispose()
+
+    def onCompleted(self):
+      self.observer.onCompleted()
+      self.dispose()
+
+
+class ObservableCache(object):
+  """A bounded LRU of shared observables. All requests for the same
+  key share one subscription to the observable returned by the factory
+  until the entry expires, is evicted or has failed. Entries that leave
+  the cache are disconnected from their source.
+
+  Expired entries are removed on the next access of the cache, in the
+  order they expire, or by :meth:`sweep`."""
+
+  def __init__(self, maxEntries=1024, ttl=None, scheduler=Scheduler.timeBasedOperation):
+    self.maxEntries = maxEntries
+    self.ttl = ttl
+    self.scheduler = scheduler
+    self.entries = OrderedDict()
+    # heap of (expiresAt, sequence, key, entry)
+    self.expiries = []
+    self.sequence = 0
+    self.gate = RLock()
+
+    # metrics
+    self.hitCount = 0
+    self.missCount = 0
+    self.evictionCount = 0
+
+  def __len__(self):
+    return len(self.entries)
+
+  def get(self, key, factory, ttl=None, bufferSize=sys.maxsize):
+    if ttl == None:
+      ttl = self.ttl
+
+    with self.gate:
+      now = self.scheduler.now()
+      self.removeExpired(now)
+      entry = self.entries.pop(key, None)
+
+      if entry != None and self.isAlive(entry, now):
+        self.entries[key] = entry
+        self.hitCount += 1
+
+        return entry
+
+      if entry != None:
+        self.evict(entry)
+
+      self.missCount += 1
+
+      expiresAt = None if ttl == None else now + ttl
+      entry = Cached(
+        factory(),
+        bufferSize,
+        expiresAt,
+        lambda: self.get(key, factory, ttl, bufferSize)
+      )
+      self.entries[key] = entry
+
+      if expiresAt != None:
+        self.sequence += 1
+        heapq.heappush(self.expiries, (expiresAt, self.sequence, key, entry))
+
+      while len(self.entries) > self.maxEntries:
+        self.evict(self.entries.popitem(last=False)[1])
+
+      return entry
+
+  def evict(self, entry):
+    self.evictionCount += 1
+    entry.disconnect()
+
+  def removeExpired(self, now):
+    expiries = self.expiries
+
+    while len(expiries) > 0 and expiries[0][0] <= now:
+      expiresAt, sequence, key, entry = heapq.heappop(expiries)
+
+      # the entry could have been replaced or evicted already
+      if self.entries.get(key) is entry:
+        del self.entries[key]
+        self.evict(entry)
+
+    # entries that left the cache early are dropped from the heap
+    # once they are the majority
+    if len(expiries) > 2 * len(self.entries) + 16:
+      self.expiries = [
+        item for item in expiries
+        if self.entries.get(item[2]) is item[3]
+      ]
+      heapq.heapify(self.expiries)
+
+  def sweep(self):
+    """Removes and disconnects all expired entries."""
+    with self.gate:
+      self.removeExpired(self.scheduler.now())
+
+  def invalidate(self, key):
+    with self.gate:
+      entry = self.entries.pop(key, None)
+
+    if entry == None:
+      return False
+
+    entry.disconnect()
+    return True
+
+  def clear(self):
+    with self.gate:
+      entries = list(self.entries.values())
+      self.entries.clear()
+      self.expiries = []
+
+    for entry in entries:
+      entry.disconnect()
+
+  def isAlive(self, entry, now):
+    if entry.hasFailed:
+      return False
+
+    return entry.expiresAt == None or now < entry.expiresAt
@@ -1,6 +1,6 @@
 from rx.observable import PushToPullAdapter
 import rx.linq.sink
-from threading import RLock
+from threading import Lock, RLock, current_thread
 
 
 class Collect(PushToPullAdapter):
@@ -72,3 +72,127 @@ class Collect(PushToPullAdapter):
 
         return True
 
+
+
+class CollectParallel(PushToPullAdapter):
+  """Keeps a collector per partition so producers on different threads
+  never contend for a lock. Every partition has its own lock, which is
+  only contended while tryMoveNext takes its collector.
+
+  The partial collectors are combined when tryMoveNext is called, which
+  also drops their partitions, so partitions of producing threads that
+  ended do not accumulate. With partitioner None the partition is the
+  producing thread, otherwise values of one partition must not be
+  produced concurrently."""
+
+  def __init__(self, source, partitioner, initial, merge, combine):
+    self.source = source
+    self.partitioner = partitioner
+    self.initial = initial
+    self.merge = merge
+    self.combine = combine
+
+  def run(self, subscription):
+    sink = self.Sink(self, subscription)
+    return sink
+
+  class Partition(object):
+    __slots__ = ('lock', 'collector', 'isTaken')
+
+    def __init__(self, collector):
+      self.lock = Lock()
+      self.collector = collector
+      self.isTaken = False
+
+  class Sink(rx.linq.sink.PushToPullSink):
+    def __init__(self, parent, subscription):
+      super(CollectParallel.Sink, self).__init__(subscription)
+      self.parent = parent
+      self.partitions = {}
+      self.error = NotImplementedError
+      self.hasFailed = False
+      self.hasCompleted = False
+      self.done = False
+
+    def onNext(self, value):
+      try:
+        if self.parent.partitioner == None:
+          key = current_thread()
+        else:
+          key = self.parent.partitioner(value)
+
+        while True:
+          partition = self.partitions.get(key)
+
+          if partition == None:
+            # setdefault is atomic, a concurrent producer gets the same partition
+            partition = self.partitions.setdefault(
+              key,
+              CollectParallel.Partition(self.parent.initial())
+            )
+
+          with partition.lock:
+            # a partition taken by tryMoveNext is replaced by a new one
+            if not partition.isTaken:
+              partition.collector = self.parent.merge(partition.collector, value)
+              break
+      except Exception as e:
+        self.error = e
+        self.hasFailed = True
+
+        self.dispose()
+
+    def onError(self, exception):
+      self.dispose()
+
+      self.error = exception
+      self.hasFailed = True
+
+    def onCompleted(self):
+      self.dispose()
+
+      self.hasCompleted = True
+
+    def tryMoveNext(self):
+      if self.hasFailed:
+        self.current = None
+        raise self.error
+
+      # read before combining, all values have been merged once it is set
+      hasCompleted = self.hasCompleted
+
+      if hasCompleted and self.done:
+        self.current = None
+        return False
+
+      try:
+        self.current = self.takeCollectors()
+      except Exception as e:
+        self.dispose()
+        raise e
+
+      if hasCompleted:
+        self.done = True
+
+      return True
+
+    def takeCollectors(self):
+      collector = None
+      isFirst = True
+
+      for key, partition in list(self.partitions.items()):
+        with partition.lock:
+          partial = partition.collector
+          partition.isTaken = True
+          del self.partitions[key]
+
+        if isFirst:
+          collector = partial
+          isFirst = False
+        else:
+          collector = self.parent.combine(collector, partial)
+
+      if isFirst:
+        collector = self.parent.initial()
+
+      return collector
@@ -16,6 +16,9 @@ class CombineLatest(Producer):
     return sink.run()
 
   class Sink(rx.linq.sink.Sink):
+    """Counts the sources that yielded a value and the completed
+    sources, so each value is handled in O(1)."""
+
     def __init__(self, parent, observer, cancel):
       super(CombineLatest.Sink, self).__init__(observer, cancel)
       self.parent = parent
@@ -26,6 +29,8 @@ class CombineLatest(Producer):
 
       self.hasValue = [False]*N
       self.hasValueAll = False
+      self.hasValueCount = 0
+      self.doneCount = 0
       self.values = [None]*N
       self.isDone = [False]*N
       self.subscriptions = [None]*N
@@ -43,9 +48,11 @@ class CombineLatest(Producer):
     def onNext(self, index, value):
       with self.gate:
         self.values[index] = value
-        self.hasValue[index] = True
 
-        self.hasValueAll = self.hasValueAll or all(self.hasValue)
+        if not self.hasValue[index]:
+          self.hasValue[index] = True
+          self.hasValueCount += 1
+          self.hasValueAll = self.hasValueCount == len(self.hasValue)
 
         if self.hasValueAll:
           res = None
@@ -58,7 +65,7 @@ class CombineLatest(Producer):
             return
 
           self.observer.onNext(res)
-        elif all(d for i, d in enumerate(self.isDone) if i != index):
+        elif self.doneCount == len(self.isDone) - 1:
           self.observer.onCompleted()
           self.dispose()
           return
@@ -70,9 +77,11 @@ class CombineLatest(Producer):
 
     def onCompleted(self, index):
       with self.gate:
-        self.isDone[index] = True
+        if not self.isDone[index]:
+          self.isDone[index] = True
+          self.doneCount += 1
 
-        if all(self.isDone):
+        if self.doneCount == len(self.isDone):
           self.observer.onCompleted()
           self.dispose()
           return
@@ -1,3 +1,9 @@
+from .asyncIterator import AsyncIterator, asyncio
+from .toFuture import ToFuture
+
+from rx.observable import Observable
+
+
 ####################
 #   Conversion     #
 ####################
@@ -6,6 +12,33 @@
 
 # To iterable via __iter__ or getIterator
 
+# From async iterable via fromAsyncIterable
+
+def getAsyncIterator(self, maxBuffered=None, loop=None):
+  assert isinstance(self, Observable)
+  assert maxBuffered == None or maxBuffered > 0
+
+  if loop == None:
+    loop = asyncio.get_event_loop()
+
+  e = AsyncIterator(loop, maxBuffered)
+  return e.run(self)
+Observable.getAsyncIterator = getAsyncIterator
+Observable.__aiter__ = getAsyncIterator
+
+def toFuture(self, loop=None):
+  assert isinstance(self, Observable)
+
+  if loop == None:
+    loop = asyncio.get_event_loop()
+
+  return ToFuture(loop).run(self)
+Observable.toFuture = toFuture
+
+def awaitOp(self):
+  return toFuture(self).__await__()
+Observable.__await__ = awaitOp
+
 # To EventSource not possible
 
-# To EventPattern not possible
\ No newline at end of file
+# To EventPattern not possible
@@ -1,28 +1,34 @@
 from .defer import Defer
 from .empty import Empty
+from .fromAsyncIterable import FromAsyncIterable, asyncio
 from .fromEvent import FromEvent
+from .fromFile import FromFile
+from .fromSocket import FromSocket
 from .generate import Generate
 from .never import Never
 from .range import Range
 from .repeat import Repeat
 from .returnOp import Return
 from .throw import Throw
-from .toObservable import ToObservable
+from .toObservable import ReadAhead, ToObservable
 from .using import Using
 
 from rx.disposable import Disposable
 from rx.exceptions import FutureCanceledException
 from rx.observable import AnonymousObservable, Observable
-from rx.scheduler import Scheduler
+from rx.scheduler import IOLoopScheduler, Scheduler
 from rx.subject import AsyncSubject
 
-import collections
+try:
+  from collections.abc import Iterable
+except ImportError:
+  from collections import Iterable
 
 def truePredicate(c): return True
 
 def flattedSequence(items):
   for item in items:
-    isIterable = isinstance(item, collections.Iterable)
+    isIterable = isinstance(item, Iterable)
     isString = isinstance(item, str)
 
     if isinstance(item, Observable):
@@ -66,29 +72,32 @@ def empty(scheduler=Scheduler.constantTimeOperations):
   return Empty(scheduler)
 Observable.empty = staticmethod(empty)
 
-def generate(initialState, condition, iterate, resultSelector, scheduler=Scheduler.iteration):
+def generate(initialState, condition, iterate, resultSelector, scheduler=Scheduler.iteration, chunkSize=128, timeBudget=None):
   assert callable(condition)
   assert callable(iterate)
   assert callable(resultSelector)
   assert isinstance(scheduler, Scheduler)
+  assert chunkSize > 0
 
-  return Generate(initialState, condition, iterate, resultSelector, None, None, scheduler)
+  return Generate(initialState, condition, iterate, resultSelector, None, None, scheduler, chunkSize, timeBudget)
 Observable.generate = staticmethod(generate)
 
 def never():
   return Never()
 Observable.never = staticmethod(never)
 
-def rangeOp(start, count, scheduler=Scheduler.iteration):
+def rangeOp(start, count, scheduler=Scheduler.iteration, chunkSize=128, timeBudget=None):
   assert isinstance(scheduler, Scheduler)
+  assert chunkSize > 0
 
-  return Range(start, count, scheduler)
+  return Range(start, count, scheduler, chunkSize, timeBudget)
 Observable.range = staticmethod(rangeOp)
 
-def repeatValue(value, count=None, scheduler=Scheduler.iteration):
+def repeatValue(value, count=None, scheduler=Scheduler.iteration, chunkSize=128, timeBudget=None):
   assert isinstance(scheduler, Scheduler)
+  assert chunkSize > 0
 
-  return Repeat(value, count, scheduler)
+  return Repeat(value, count, scheduler, chunkSize, timeBudget)
 Observable.repeatValue = staticmethod(repeatValue)
 
 def returnOp(value, scheduler=Scheduler.constantTimeOperations):
@@ -153,6 +162,15 @@ def fromFuture(future):
   return subject
 Observable.fromFuture = staticmethod(fromFuture)
 
+def fromAsyncIterable(iterable, loop=None):
+  assert hasattr(iterable, '__aiter__')
+
+  if loop == None:
+    loop = asyncio.get_event_loop()
+
+  return FromAsyncIterable(iterable, loop)
+Observable.fromAsyncIterable = staticmethod(fromAsyncIterable)
+
 def fromEvent(addHandler, removeHandler, scheduler=Scheduler.default):
   assert callable(addHandler)
   assert callable(removeHandler)
@@ -161,9 +179,35 @@ def fromEvent(addHandler, removeHandler, scheduler=Scheduler.default):
   return FromEvent(addHandler, removeHandler, scheduler)
 Observable.fromEvent = staticmethod(fromEvent)
 
-def fromIterable(iterable, scheduler=Scheduler.default):
-  assert isinstance(iterable, collections.Iterable)
+def fromFile(path, mode='lines', chunkSize=64 * 1024, offset=0, tail=False, pollInterval=0.1, recordSize=None, scheduler=Scheduler.default):
+  assert mode in ('lines', 'chunks', 'records')
+  assert chunkSize > 0
+  assert offset >= 0
+  assert mode != 'records' or recordSize > 0
   assert isinstance(scheduler, Scheduler)
 
-  return ToObservable(iterable, scheduler)
+  return FromFile(path, mode, chunkSize, offset, tail, pollInterval, recordSize, scheduler)
+Observable.fromFile = staticmethod(fromFile)
+
+def fromSocket(sock, bufferSize=64 * 1024, scheduler=None):
+  assert bufferSize > 0
+
+  if scheduler == None:
+    scheduler = Scheduler.ioLoop
+
+  assert isinstance(scheduler, IOLoopScheduler)
+
+  return FromSocket(sock, bufferSize, scheduler)
+Observable.fromSocket = staticmethod(fromSocket)
+
+def fromIterable(iterable, scheduler=Scheduler.default, chunkSize=128, timeBudget=None, prefetch=None):
+  assert isinstance(iterable, Iterable)
+  assert isinstance(scheduler, Scheduler)
+  assert chunkSize > 0
+  assert prefetch == None or prefetch > 0
+
+  if prefetch == None:
+    return ToObservable(iterable, scheduler, chunkSize, timeBudget)
+  else:
+    return ReadAhead(iterable, scheduler, chunkSize, timeBudget, prefetch)
 Observable.fromIterable = staticmethod(fromIterable)
@@ -1,374 +1,151 @@
 from rx.disposable import CompositeDisposable, Disposable, SerialDisposable, SingleAssignmentDisposable
+from rx.exceptions import QueueOverflowException
 from rx.observable import Producer
 from rx.observer import Observer
-from rx.internal import Struct
 from rx.scheduler import Scheduler
 import rx.linq.sink
 from collections import deque
-from threading import Event, RLock, Semaphore
+from threading import RLock
 
 
 class DelayTime(Producer):
-  def __init__(self, source, dueTime, isAbsolute, scheduler):
+  def __init__(self, source, dueTime, isAbsolute, scheduler, maxQueued=None):
     self.source = source
     self.dueTime = dueTime
     self.isAbsolute = isAbsolute
     self.scheduler = scheduler
+    self.maxQueued = maxQueued
 
   def run(self, observer, cancel, setSink):
-    if self.scheduler.isLongRunning:
-      sink = self.LongrunningSink(self, observer, cancel)
-      setSink(sink)
-      return sink.run()
-    else:
-      sink = self.Sink(self, observer, cancel)
-      setSink(sink)
-      return sink.run()
+    sink = self.Sink(self, observer, cancel)
+    setSink(sink)
+    return sink.run()
 
-  def eval(self):
-    return self.observableFactory()
 
+  class Sink(rx.linq.sink.Sink):
+    """Every value is delayed by the same time, so the due times in the
+    queue are ascending and one timer for the first value suffices.
+    When the timer fires all due values are yielded at once and the
+    timer is armed again for the next value."""
 
-  class LongrunningSink(rx.linq.sink.Sink):
     def __init__(self, parent, observer, cancel):
-      super(DelayTime.LongrunningSink, self).__init__(observer, cancel)
+      super(DelayTime.Sink, self).__init__(observer, cancel)
       self.parent = parent
 
     def run(self):
       self.scheduler = self.parent.scheduler
 
-      self.cancelTimer = SerialDisposable()
+      self.timer = SerialDisposable()
 
       self.gate = RLock()
-      self.evt = Semaphore(0)
-      self.stopped = False
-      self.stop = Event()
-      self.queue = deque()
+      self.queue = deque() # (due, value)
+      self.isArmed = False
+      self.running = False # while due values are yielded
       self.hasCompleted = False
       self.completeAt = 0
       self.hasFailed = False
       self.exception = None
 
-      self.delay = 0
-      self.startTime = self.scheduler.now()
-
       if self.parent.isAbsolute:
-        self.cancelTimer.disposable = self.scheduler.scheduleAbsolute(
-          self.parent.dueTime,
-          self.start
-        )
+        # values are delayed by the time until dueTime
+        self.delay = Scheduler.normalize(self.parent.dueTime - self.scheduler.now())
       else:
         self.delay = Scheduler.normalize(self.parent.dueTime)
-        self.scheduleDrain()
 
       self.sourceSubscription = SingleAssignmentDisposable()
       self.sourceSubscription.disposable = self.parent.source.subscribeSafe(self)
 
-      return CompositeDisposable(self.sourceSubscription, self.cancelTimer)
-
-    def elapsed(self):
-      return self.scheduler.now() - self.startTime
-
-    def start(self):
-      with self.gate:
-        self.delay = self.elapsed()
-
-        for item in self.queue:
-          item.interval += self.delay
-
-      self.scheduleDrain()
-
-    def scheduleDrain(self):
-      def cancel():
-        self.stopped = True
-        self.stop.set()
-        self.evt.release()
+      return CompositeDisposable(self.sourceSubscription, self.timer)
 
-      self.stop.clear()
-      self.cancelTimer.disposable = Disposable.create(cancel)
-      self.scheduler.scheduleLongRunning(self.drainQueue)
+    def arm(self, dueTime):
+      self.timer.disposable = self.scheduler.scheduleWithRelative(dueTime, self.tick)
 
     def onNext(self, value):
-      next = self.elapsed() + self.delay
-
       with self.gate:
-        self.queue.append(Struct(value=value, interval=next))
-        self.evt.release()
-
-    def onError(self, exception):
-      self.sourceSubscription.dispose()
-
-      with self.gate:
-        self.queue.clear()
+        maxQueued = self.parent.maxQueued
 
-        self.exception = exception
-        self.hasFailed = True
-
-        self.evt.release()
-
-    def onCompleted(self):
-      self.sourceSubscription.dispose()
-
-      next = self.elapsed() + self.delay
-
-      with self.gate:
-        self.completeAt = next
-        self.hasCompleted = True
-
-        self.evt.release()
-
-    def drainQueue(self, cancel):
-      while True:
-        self.evt.acquire()
-        if self.stopped:
-          return
-
-        hasFailed = False
-        error = NotImplementedError
-
-        hasValue = False
-        value = NotImplementedError
-        hasCompleted = False
-
-        shouldWait = False
-        waitTime = 0
-
-        with self.gate:
-          if self.hasFailed:
-            error = self.exception
-            hasFailed = True
-          else:
-            now = self.elapsed()
-
-            if len(self.queue) > 0:
-              next = self.queue.popleft()
-
-              hasValue = True
-              value = next.value
-
-              nextDue = next.interval
-              if nextDue > now:
-                shouldWait = True
-                waitTime = Scheduler.normalize(nextDue - now)
-            elif self.hasCompleted:
-              hasCompleted = True
-
-              if self.completeAt > now:
-                shouldWait = True
-                waitTime = Scheduler.normalize(self.completeAt - now)
-        # end with self.gate
-
-        if shouldWait:
-          timer = Event()
-          self.scheduler.scheduleWithRelative(waitTime, lambda: timer.set())
-          timer.wait()
-
-        if hasValue:
-          self.observer.onNext(value)
+        if maxQueued != None and len(self.queue) >= maxQueued:
+          overflow = QueueOverflowException(maxQueued)
         else:
-          if hasCompleted:
-            self.observer.onCompleted()
-            self.dispose()
-          elif hasFailed:
-            self.observer.onError(error)
-            self.dispose()
-
-          return
-      #end while
-    # end Sink
+          overflow = None
+          self.queue.append((self.scheduler.now() + self.delay, value))
 
+          if not self.isArmed:
+            self.isArmed = True
+            self.arm(self.delay)
 
-  class Sink(rx.linq.sink.Sink):
-    def __init__(self, parent, observer, cancel):
-      super(DelayTime.Sink, self).__init__(observer, cancel)
-      self.parent = parent
-
-    def run(self):
-      self.scheduler = self.parent.scheduler
-
-      self.cancelTimer = SerialDisposable()
-
-      self.gate = RLock()
-      self.active = False # as soon as a value arrived
-      self.running = False # on relative: True, on absolute: True after absolute time
-      self.queue = deque()
-      self.hasCompleted = False
-      self.completeAt = 0
-      self.hasFailed = False
-      self.exception = None
-
-      self.delay = 0
-      self.startTime = self.scheduler.now()
-
-      if self.parent.isAbsolute:
-        self.ready = False
-        self.cancelTimer.disposable = self.scheduler.scheduleWithAbsolute(
-          self.parent.dueTime,
-          self.start
-        )
-      else:
-        self.ready = True
-        self.delay = Scheduler.normalize(self.parent.dueTime)
-
-      self.sourceSubscription = SingleAssignmentDisposable()
-      self.sourceSubscription.disposable = self.parent.source.subscribeSafe(self)
-
-      return CompositeDisposable(self.sourceSubscription, self.cancelTimer)
-
-    def elapsed(self):
-      return self.scheduler.now() - self.startTime
-
-    def start(self):
-      next = 0
-      shouldRun = False
-
-      with self.gate:
-        self.delay = self.elapsed()
-
-        if len(self.queue) > 0:
-          next = self.queue[0].interval
-
-          for item in self.queue:
-            item.interval += self.delay
-
-          shouldRun = True
-          self.active = True
-
-        self.ready = True
-
-      if shouldRun:
-        self.cancelTimer.disposable = self.scheduler.scheduleRecursiveWithRelative(
-          next,
-          self.drainQueue
-        )
-
-    def onNext(self, value):
-      next = self.elapsed() + self.delay
-      shouldRun = False
-
-      with self.gate:
-        self.queue.append(Struct(value=value, interval=next))
-        shouldRun = self.ready and (not self.active)
-        self.active = True
-
-      if shouldRun:
-        self.cancelTimer.disposable = self.scheduler.scheduleRecursiveWithRelative(
-          self.delay,
-          self.drainQueue
-        )
+      if overflow != None:
+        self.onError(overflow)
 
     def onError(self, exception):
       self.sourceSubscription.dispose()
 
-      shouldRun = False
-
       with self.gate:
         self.queue.clear()
 
-        self.exception = exception
-        self.hasFailed = True
-
-        shouldRun = not self.running
+        if self.running:
+          # the running tick yields the error
+          self.exception = exception
+          self.hasFailed = True
+          return
 
-      if shouldRun:
         self.observer.onError(exception)
         self.dispose()
 
     def onCompleted(self):
       self.sourceSubscription.dispose()
 
-      next = self.elapsed() + self.delay
-      shouldRun = False
-
       with self.gate:
-        self.completeAt = next
-        self.hasCompleted = True
+        now = self.scheduler.now()
 
-        shouldRun = self.ready and (not self.active)
-        self.active = True
+        if self.parent.isAbsolute and now < self.parent.dueTime:
+          # completing before dueTime only waits for the queued values
+          self.completeAt = now
+        else:
+          self.completeAt = now + self.delay
 
-      if shouldRun:
-        self.cancelTimer.disposable = self.scheduler.scheduleRecursiveWithRelative(
-          self.delay,
-          self.drainQueue
-        )
+        self.hasCompleted = True
 
-    def drainQueue(self, recurse):
-      with self.gate:
-        if self.hasFailed:
-          return
-        self.running = True
+        if not self.isArmed:
+          self.isArmed = True
+          self.arm(self.completeAt - now)
 
+    def tick(self):
+      with self.gate:
+        now = self.scheduler.now()
+        queue = self.queue
+        due = []
 
-      #
-      # The shouldYield flag was added to address TFS 487881: "Delay can be unfair". In the old
-      # implementation, the loop below kept running while there was work for immediate dispatch,
-      # potentially causing a long running work item on the target scheduler. With the addition
-      # of long-running scheduling in Rx v2.0, we can check whether the scheduler supports this
-      # interface and perform different processing (see LongRunningSink). To reduce the code churn in the old
-      # loop code here, we set the shouldYield flag to true after the first dispatch iteration,
-      # in order to break from the loop and enter the recursive scheduling path.
+        while len(queue) > 0 and queue[0][0] <= now:
+          due.append(queue.popleft()[1])
 
-      shouldYield = False
+        self.running = True
 
-      while True:
-        hasFailed = False
-        error = None
+      for value in due:
+        self.observer.onNext(value)
 
-        value = None
-        hasValue = False
+      with self.gate:
+        self.running = False
 
-        hasCompleted = False
+        if self.hasFailed:
+          self.observer.onError(self.exception)
+          self.dispose()
+          return Disposable.empty()
 
-        shouldRecurse = False
-        recurseDueTime = 0
+        now = self.scheduler.now()
 
-        with self.gate:
-          if self.hasFailed:
-            error = self.exception
-            hasFailed = True
-            self.running = False
-          else:
-            now = self.elapsed()
-
-            if len(self.queue) > 0:
-              nextDue = self.queue[0].interval
-
-              if nextDue <= now and not shouldYield:
-                value = self.queue.popleft().value
-                hasValue = True
-              else:
-                shouldRecurse = True
-                recurseDueTime = Scheduler.normalize(nextDue - now)
-                self.running = False
-            elif self.hasCompleted:
-              if self.completeAt <= now and not shouldYield:
-                hasCompleted = True
-              else:
-                shouldRecurse = True
-                recurseDueTime = Scheduler.normalize(self.completeAt - now)
-                self.running = False
-            else:
-              self.running = False
-              self.active = False
-        # end with self.gate
-
-        if hasValue:
-          self.observer.onNext(value)
-          shouldYield = True
-        else:
-          if hasCompleted:
+        if len(self.queue) > 0:
+          self.arm(Scheduler.normalize(self.queue[0][0] - now))
+        elif self.hasCompleted:
+          if self.completeAt <= now:
             self.observer.onCompleted()
             self.dispose()
-          elif hasFailed:
-            self.observer.onError(error)
-            self.dispose()
-          elif shouldRecurse:
-            recurse(recurseDueTime)
+          else:
+            self.arm(self.completeAt - now)
+        else:
+          self.isArmed = False
 
-          return
-      #end while
-    # end Sink
+      return Disposable.empty()
 
 
 class DelayObservable(Producer):
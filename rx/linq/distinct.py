@@ -1,34 +1,55 @@
 from rx.observable import Producer
 import rx.linq.sink
+from collections import deque, OrderedDict
+from threading import RLock
+import math
+import sys
 
 
 class Distinct(Producer):
-  def __init__(self, source, keySelector):
+  def __init__(self, source, keySelector, keySetFactory=None):
     self.source = source
     self.keySelector = keySelector
+    self.keySetFactory = ExactKeySet if keySetFactory == None else keySetFactory
+    self.gate = RLock()
+    # the key sets of the active subscriptions, in subscription order
+    self.keySets = []
 
   def run(self, observer, cancel, setSink):
     sink = self.Sink(self, observer, cancel)
     setSink(sink)
+
+    with self.gate:
+      self.keySets.append(sink.keySet)
+
     return self.source.subscribeSafe(sink)
 
+  def release(self, keySet):
+    with self.gate:
+      for i, current in enumerate(self.keySets):
+        if current is keySet:
+          del self.keySets[i]
+          return
+
   class Sink(rx.linq.sink.Sink):
     def __init__(self, parent, observer, cancel):
       super(Distinct.Sink, self).__init__(observer, cancel)
       self.parent = parent
-      self.hashSet = set()
+      self.keySet = parent.keySetFactory()
+
+    def dispose(self):
+      super(Distinct.Sink, self).dispose()
+      self.parent.release(self.keySet)
 
     def onNext(self, value):
       try:
         key = self.parent.keySelector(value)
+        isNew = self.keySet.add(key)
       except Exception as e:
         self.observer.onError(e)
         self.dispose()
       else:
-        if key in self.hashSet:
-          return
-        else:
-          self.hashSet.add(key)
+        if isNew:
           self.observer.onNext(value)
 
     def onError(self, exception):
@@ -37,4 +58,179 @@ class Distinct(Producer):
 
     def onCompleted(self):
       self.observer.onCompleted()
-      self.dispose()
\ No newline at end of file
+      self.dispose()
+
+
+class ExactKeySet(object):
+  """Remembers every key, memory grows with the number of keys."""
+
+  def __init__(self):
+    self.keys = set()
+    self.evictionCount = 0
+
+  def add(self, key):
+    """Returns True if the key has not been seen before."""
+    if key in self.keys:
+      return False
+
+    self.keys.add(key)
+    return True
+
+  def __len__(self):
+    return len(self.keys)
+
+  @property
+  def memoryFootprint(self):
+    return sys.getsizeof(self.keys)
+
+
+class LruKeySet(object):
+  """Remembers the capacity most recently seen keys."""
+
+  def __init__(self, capacity):
+    self.capacity = capacity
+    self.keys = OrderedDict()
+    self.evictionCount = 0
+
+  def add(self, key):
+    if key in self.keys:
+      # move the key to the end, it is the most recently used now
+      del self.keys[key]
+      self.keys[key] = None
+      return False
+
+    self.keys[key] = None
+
+    if len(self.keys) > self.capacity:
+      self.keys.popitem(last=False)
+      self.evictionCount += 1
+
+    return True
+
+  def __len__(self):
+    return len(self.keys)
+
+  @property
+  def memoryFootprint(self):
+    return sys.getsizeof(self.keys)
+
+
+class WindowKeySet(object):
+  """Forgets a key window seconds after it was first seen."""
+
+  def __init__(self, window, scheduler):
+    self.window = window
+    self.scheduler = scheduler
+    self.keys = {}
+    self.order = deque()
+    self.evictionCount = 0
+
+  def add(self, key):
+    now = self.scheduler.now()
+    self.trim(now - self.window)
+
+    if key in self.keys:
+      return False
+
+    self.keys[key] = now
+    self.order.append((now, key))
+
+    return True
+
+  def trim(self, deadline):
+    order = self.order
+
+    while len(order) > 0 and order[0][0] <= deadline:
+      del self.keys[order.popleft()[1]]
+      self.evictionCount += 1
+
+  def __len__(self):
+    return len(self.keys)
+
+  @property
+  def memoryFootprint(self):
+    return sys.getsizeof(self.keys) + sys.getsizeof(self.order)
+
+
+class BloomKeySet(object):
+  """Approximate key set backed by a scalable Bloom filter.
+
+  A key that was seen before is always recognized, a new key is taken
+  for a duplicate with a probability of at most errorRate. When a
+  filter is full a new one with twice the capacity and half the error
+  rate is added, so the overall error rate stays below errorRate."""
+
+  RATIO = 0.5
+
+  def __init__(self, errorRate=0.001, initialCapacity=1024):
+    self.errorRate = errorRate
+    self.filters = []
+    self.count = 0
+    self.evictionCount = 0
+    self.addFilter(initialCapacity, errorRate * (1 - BloomKeySet.RATIO))
+
+  def addFilter(self, capacity, errorRate):
+    hashCount = int(math.ceil(math.log(1.0 / errorRate, 2)))
+    bitCount = int(math.ceil(capacity * math.log(1.0 / errorRate) / (math.log(2) ** 2)))
+
+    self.current = BloomFilter(capacity, errorRate, hashCount, bitCount)
+    self.filters.append(self.current)
+
+  def add(self, key):
+    h1 = hash(key)
+    h2 = hash((key, h1)) | 1
+
+    for f in self.filters:
+      if f.contains(h1, h2):
+        return False
+
+    if self.current.count >= self.current.capacity:
+      self.addFilter(
+        self.current.capacity * 2,
+        self.current.errorRate * BloomKeySet.RATIO
+      )
+
+    self.current.add(h1, h2)
+    self.count += 1
+
+    return True
+
+  def __len__(self):
+    return self.count
+
+  @property
+  def memoryFootprint(self):
+    return sum(sys.getsizeof(f.bits) for f in self.filters)
+
+
+class BloomFilter(object):
+  def __init__(self, capacity, errorRate, hashCount, bitCount):
+    self.capacity = capacity
+    self.errorRate = errorRate
+    self.hashCount = hashCount
+    self.bitCount = bitCount
+    self.bits = bytearray((bitCount + 7) // 8)
+    self.count = 0
+
+  def positions(self, h1, h2):
+    m = self.bitCount
+
+    for i in range(self.hashCount):
+      yield (h1 + i * h2) % m
+
+  def contains(self, h1, h2):
+    bits = self.bits
+
+    for p in self.positions(h1, h2):
+      if not bits[p >> 3] & (1 << (p & 7)):
+        return False
+
+    return True
+
+  def add(self, h1, h2):
+    bits = self.bits
+
+    for p in self.positions(h1, h2):
+      bits[p >> 3] |= 1 << (p & 7)
+
+    self.count += 1
@@ -0,0 +1,108 @@
+from rx.disposable import Disposable
+from rx.observable import Producer
+import rx.linq.sink
+
+try:
+  import asyncio
+except ImportError:
+  asyncio = None
+
+
+class FromAsyncIterable(Producer):
+  """Iterates an async iterable in a task on loop. Values that are
+  ready without suspending are yielded at once, so the loop only
+  regains control when the iterator actually waits. Disposing the
+  subscription cancels the task."""
+
+  def __init__(self, iterable, loop):
+    self.iterable = iterable
+    self.loop = loop
+
+  def run(self, observer, cancel, setSink):
+    sink = self.Sink(self, observer, cancel)
+    setSink(sink)
+    return sink.run()
+
+  class Sink(rx.linq.sink.Sink):
+    def __init__(self, parent, observer, cancel):
+      super(FromAsyncIterable.Sink, self).__init__(observer, cancel)
+      self.parent = parent
+      self.task = None
+      self.step = None
+      self.isStopped = False
+      self.isFinished = False
+
+    def run(self):
+      self.parent.loop.call_soon_threadsafe(self.start)
+
+      return Disposable.create(self.stop)
+
+    def start(self):
+      if self.isStopped:
+        return
+
+      self.iterator = self.parent.iterable.__aiter__()
+      self.task = asyncio.ensure_future(self, loop=self.parent.loop)
+
+    def stop(self):
+      if self.isStopped:
+        return
+
+      self.isStopped = True
+
+      if not self.isFinished:
+        self.parent.loop.call_soon_threadsafe(self.cancelTask)
+
+    def cancelTask(self):
+      if self.task != None:
+        self.task.cancel()
+
+    # the sink is the awaitable the task runs, it delegates to the
+    # awaitable of every __anext__ like yield from would
+
+    def __await__(self):
+      return self
+
+    def __iter__(self):
+      return self
+
+    def __next__(self):
+      return self.send(None)
+
+    next = __next__
+
+    def send(self, value):
+      return self.resume(lambda step: step.send(value))
+
+    def throw(self, *exception):
+      return self.resume(lambda step: step.throw(*exception))
+
+    def resume(self, advance):
+      while True:
+        if self.step == None:
+          if self.isStopped:
+            raise StopIteration()
+
+          self.step = self.iterator.__anext__().__await__()
+          advance = lambda step: step.send(None)
+
+        try:
+          # suspends the task until the awaited future is done
+          return advance(self.step)
+        except StopIteration as e:
+          self.step = None
+          self.observer.onNext(e.value)
+        except StopAsyncIteration:
+          self.finish()
+          self.observer.onCompleted()
+          self.dispose()
+          raise StopIteration()
+        except Exception as e:
+          self.finish()
+          self.observer.onError(e)
+          self.dispose()
+          raise StopIteration()
+
+    def finish(self):
+      self.isFinished = True
+      self.step = None
@@ -0,0 +1,204 @@
+from rx.disposable import CompositeDisposable, Disposable, SerialDisposable
+from rx.exceptions import InvalidOperationException
+from rx.observable import Producer
+import rx.linq.sink
+import mmap
+import os
+
+
+class FromFile(Producer):
+  """Reads a file through mmap. The modes yield
+
+  - 'lines': every line as bytes including its line break, the lines of
+    one chunk are yielded together through onNextBatch
+  - 'chunks': a view of at most chunkSize bytes
+  - 'records': a view of every recordSize bytes
+
+  Views are memoryviews of the map, or buffers on Python 2. They stay
+  valid as long as they are referenced."""
+
+  def __init__(self, path, mode, chunkSize, offset, tail, pollInterval, recordSize, scheduler):
+    self.path = path
+    self.mode = mode
+    self.chunkSize = chunkSize
+    self.offset = offset
+    self.tail = tail
+    self.pollInterval = pollInterval
+    self.recordSize = recordSize
+    self.scheduler = scheduler
+
+  def run(self, observer, cancel, setSink):
+    sink = self.Sink(self, observer, cancel)
+    setSink(sink)
+    return sink.run()
+
+  class Sink(rx.linq.sink.ChunkedSink):
+    def __init__(self, parent, observer, cancel):
+      chunkSize = parent.chunkSize
+
+      if parent.mode == 'records':
+        chunkSize = max(chunkSize - chunkSize % parent.recordSize, parent.recordSize)
+
+      super(FromFile.Sink, self).__init__(observer, cancel, chunkSize, None)
+      self.parent = parent
+
+    def run(self):
+      self.file = None
+      self.map = None
+      self.view = None
+      self.size = 0
+      self.position = self.parent.offset
+
+      try:
+        self.file = open(self.parent.path, 'rb')
+        self.remap()
+      except Exception as e:
+        self.close()
+        self.observer.onError(e)
+        self.dispose()
+        return Disposable.empty()
+
+      self.turn = SerialDisposable()
+      self.pollTimer = SerialDisposable()
+      self.turn.disposable = self.runChunked(self.parent.scheduler)
+
+      return CompositeDisposable(self.turn, self.pollTimer, Disposable.create(self.close))
+
+    def close(self):
+      self.closeMap()
+
+      if self.file != None:
+        self.file.close()
+        self.file = None
+
+    def closeMap(self):
+      # yielded views keep the map alive, it is closed once the
+      # last of them is released
+      self.view = None
+      self.map = None
+
+    def remap(self):
+      size = os.fstat(self.file.fileno()).st_size
+
+      if size < self.position:
+        raise InvalidOperationException("File was truncated")
+
+      if size > self.size:
+        self.closeMap()
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size = size
+
+        try:
+          self.view = memoryview(self.map)
+        except TypeError:
+          self.view = None
+
+    def slice(self, start, end):
+      if self.view != None:
+        return self.view[start:end]
+      else:
+        return buffer(self.map, start, end - start)
+
+    def fill(self, values, count):
+      """Returns False if the rest of the file has been read."""
+      if self.position >= self.size:
+        self.remap()
+
+      mode = self.parent.mode
+
+      if mode == 'lines':
+        return self.fillLines(values, count)
+      elif mode == 'chunks':
+        end = min(self.position + count, self.size)
+
+        if end > self.position:
+          values.append(self.slice(self.position, end))
+          self.position = end
+      else:
+        return self.fillRecords(values, count)
+
+      return self.position < self.size
+
+    def fillLines(self, values, count):
+      start = self.position
+
+      if start >= self.size:
+        return False
+
+      end = min(start + count, self.size)
+      lineEnd = self.map.rfind(b'\n', start, end)
+
+      if lineEnd < 0:
+        # a line longer than a chunk
+        lineEnd = self.map.find(b'\n', end)
+
+      if lineEnd >= 0:
+        m = self.map
+        find = m.find
+        position = start
+
+        while position <= lineEnd:
+          end = find(b'\n', position, lineEnd + 1) + 1
+          values.append(m[position:end])
+          position = end
+
+        self.position = position
+
+        return self.position < self.size
+      elif not self.parent.tail:
+        values.append(self.map[start:self.size])
+        self.position = self.size
+
+      # in tail mode the last line is yielded once it is complete
+      return False
+
+    def fillRecords(self, values, count):
+      recordSize = self.parent.recordSize
+      n = min(count, self.size - self.position) // recordSize
+
+      for i in range(n):
+        start = self.position + i * recordSize
+        values.append(self.slice(start, start + recordSize))
+
+      self.position += n * recordSize
+
+      if self.size - self.position >= recordSize:
+        return True
+
+      if self.position < self.size and not self.parent.tail:
+        raise InvalidOperationException("File ends with a partial record")
+
+      # in tail mode the last record is yielded once it is complete
+      return False
+
+    def loopChunks(self, cancel):
+      # in tail mode the next pass replaces a finished one, disposing
+      # the subscription disposes the sink anyway
+      while not cancel.isDisposed and self.yieldChunk():
+        pass
+
+    def exhausted(self):
+      if self.parent.tail:
+        self.schedulePoll()
+      else:
+        super(FromFile.Sink, self).exhausted()
+
+    def schedulePoll(self):
+      self.polledSize = self.size
+      self.pollTimer.disposable = self.parent.scheduler.scheduleWithRelative(
+        self.parent.pollInterval,
+        self.poll
+      )
+
+    def poll(self):
+      try:
+        self.remap()
+      except Exception as e:
+        self.observer.onError(e)
+        self.dispose()
+        return
+
+      if self.size > self.polledSize:
+        self.turn.disposable = self.runChunked(self.parent.scheduler)
+      else:
+        self.schedulePoll()
@@ -0,0 +1,194 @@
+from rx.observable import Producer
+from rx.observer import Observer
+from rx.scheduler import IOLoopScheduler, Scheduler
+import rx.linq.sink
+from collections import deque
+from threading import RLock
+import errno
+import socket
+
+wouldBlock = (errno.EAGAIN, errno.EWOULDBLOCK)
+
+
+class FromSocket(Producer):
+  """Yields the chunks of at most bufferSize bytes received by sock
+  whenever the IOLoopScheduler finds it readable and completes when
+  the peer closes the connection. The socket is not closed."""
+
+  def __init__(self, sock, bufferSize, scheduler):
+    self.sock = sock
+    self.bufferSize = bufferSize
+    self.scheduler = scheduler
+
+  def run(self, observer, cancel, setSink):
+    sink = self.Sink(self, observer, cancel)
+    setSink(sink)
+    return sink.run()
+
+  class Sink(rx.linq.sink.Sink):
+    def __init__(self, parent, observer, cancel):
+      super(FromSocket.Sink, self).__init__(observer, cancel)
+      self.parent = parent
+
+    def run(self):
+      self.parent.sock.setblocking(False)
+      self.watch = self.parent.scheduler.watch(
+        self.parent.sock,
+        IOLoopScheduler.READ,
+        self.readable
+      )
+
+      return self.watch
+
+    def readable(self):
+      try:
+        data = self.parent.sock.recv(self.parent.bufferSize)
+      except socket.error as e:
+        if e.errno in wouldBlock:
+          return
+
+        self.observer.onError(e)
+        self.dispose()
+        return
+
+      if len(data) == 0:
+        self.observer.onCompleted()
+        self.dispose()
+      else:
+        self.observer.onNext(data)
+
+
+class SocketSink(Observer):
+  """Writes the received bytes to sock. Values are buffered and written
+  on the IOLoopScheduler whenever sock is writable, so onNext never
+  blocks. After onCompleted the buffer is flushed and the socket is shut
+  down for writing, or closed if closeOnCompleted is True. onError
+  closes the socket at once.
+
+  buffered is the number of bytes not written yet."""
+
+  def __init__(self, sock, scheduler=None, closeOnCompleted=False):
+    if scheduler == None:
+      scheduler = Scheduler.ioLoop
+
+    self.sock = sock
+    self.scheduler = scheduler
+    self.closeOnCompleted = closeOnCompleted
+    self.lock = RLock()
+    self.queue = deque()
+    self.buffered = 0
+    self.isStopped = False
+    self.isClosed = False
+    self.isFlushScheduled = False
+    self.writeWatch = None
+
+    sock.setblocking(False)
+
+  def onNext(self, value):
+    with self.lock:
+      if self.isStopped:
+        return
+
+      self.queue.append(value)
+      self.buffered += len(value)
+      self.scheduleFlush()
+
+  def onError(self, exception):
+    with self.lock:
+      if self.isStopped:
+        return
+
+      self.isStopped = True
+      self.queue.clear()
+      self.buffered = 0
+
+    self.scheduler.schedule(self.abort)
+
+  def onCompleted(self):
+    with self.lock:
+      if self.isStopped:
+        return
+
+      self.isStopped = True
+      self.scheduleFlush()
+
+  def scheduleFlush(self):
+    # a write watch flushes as soon as the socket is writable
+    if not self.isFlushScheduled and self.writeWatch == None:
+      self.isFlushScheduled = True
+      self.scheduler.schedule(self.flush)
+
+  def unwatch(self):
+    if self.writeWatch != None:
+      self.writeWatch.dispose()
+      self.writeWatch = None
+
+  def abort(self):
+    with self.lock:
+      self.unwatch()
+
+      if not self.isClosed:
+        self.isClosed = True
+        self.close()
+
+  def flush(self):
+    with self.lock:
+      self.isFlushScheduled = False
+
+      if self.isClosed:
+        return
+
+      queue = self.queue
+
+      while len(queue) > 0:
+        data = queue[0]
+
+        try:
+          n = self.sock.send(data)
+        except socket.error as e:
+          if e.errno not in wouldBlock:
+            queue.clear()
+            self.buffered = 0
+            self.isStopped = True
+            self.abort()
+            return
+
+          n = 0
+
+        self.buffered -= n
+
+        if n < len(data):
+          queue[0] = data[n:]
+
+          if self.writeWatch == None:
+            self.writeWatch = self.scheduler.watch(
+              self.sock,
+              IOLoopScheduler.WRITE,
+              self.flush
+            )
+
+          return
+
+        queue.popleft()
+
+      self.unwatch()
+
+      if self.isStopped:
+        self.finish()
+
+  def finish(self):
+    self.isClosed = True
+
+    if self.closeOnCompleted:
+      self.close()
+    else:
+      try:
+        self.sock.shutdown(socket.SHUT_WR)
+      except socket.error:
+        pass
+
+  def close(self):
+    # a closed file descriptor must not stay in the selector, it
+    # could be watched for reading by fromSocket
+    self.scheduler.unwatchAll(self.sock)
+    self.sock.close()
@@ -4,7 +4,7 @@ import rx.linq.sink
 
 
 class Generate(Producer):
-  def __init__(self, initialState, condition, iterate, resultSelector, timeSelector, isAbsolute, scheduler):
+  def __init__(self, initialState, condition, iterate, resultSelector, timeSelector, isAbsolute, scheduler, chunkSize=None, timeBudget=None):
     self.initialState = initialState
     self.condition = condition
     self.iterate = iterate
@@ -12,6 +12,8 @@ class Generate(Producer):
     self.timeSelector = timeSelector
     self.isAbsolute = isAbsolute
     self.scheduler = scheduler
+    self.chunkSize = chunkSize
+    self.timeBudget = timeBudget
 
   def run(self, observer, cancel, setSink):
     if self.isAbsolute and self.timeSelector != None:
@@ -124,73 +126,26 @@ class Generate(Producer):
         self.invokeRec
       )
 
-  class Sink(rx.linq.sink.Sink):
+  class Sink(rx.linq.sink.LazyChunkedSink):
     def __init__(self, parent, observer, cancel):
-      super(Generate.Sink, self).__init__(observer, cancel)
+      super(Generate.Sink, self).__init__(observer, cancel, parent.chunkSize, parent.timeBudget)
       self.parent = parent
 
     def run(self):
       self.state = self.parent.initialState
       self.first = True
 
-      scheduler = self.parent.scheduler
-      if scheduler.isLongRunning:
-        return scheduler.scheduleLongRunning(self.loop)
-      else:
-        return scheduler.scheduleRecursive(self.loopRec)
-
-    def loop(self, cancel):
-      while not cancel.isDisposed:
-        hasResult = False
-        result = None
-
-        try:
-          if self.first:
-            self.first = False
-          else:
-            self.state = self.parent.iterate(self.state)
-
-          hasResult = self.parent.condition(self.state)
-
-          if hasResult:
-            result = self.parent.resultSelector(self.state)
-        except Exception as e:
-          self.observer.onError(e)
-          self.dispose()
-          return
-
-        if hasResult:
-          self.observer.onNext(result)
-        else:
-          break
-
-      if not cancel.isDisposed:
-        self.observer.onCompleted()
-
-      self.dispose()
+      return self.runChunked(self.parent.scheduler)
 
-    def loopRec(self, recurse):
-      hasResult = False
-      result = None
+    def pull(self):
+      parent = self.parent
 
-      try:
-        if self.first:
-          self.first = False
-        else:
-          self.state = self.parent.iterate(self.state)
-
-        hasResult = self.parent.condition(self.state)
+      if self.first:
+        self.first = False
+      else:
+        self.state = parent.iterate(self.state)
 
-        if hasResult:
-          result = self.parent.resultSelector(self.state)
-      except Exception as e:
-        self.observer.onError(e)
-        self.dispose()
-        return
+      if not parent.condition(self.state):
+        raise StopIteration()
 
-      if hasResult:
-        self.observer.onNext(result)
-        recurse()
-      else:
-        self.observer.onCompleted()
-        self.dispose()
+      return parent.resultSelector(self.state)
@@ -1,99 +1,136 @@
 from rx.disposable import SingleAssignmentDisposable
 from rx.exceptions import DisposedException
 from rx.observer import Observer
-import rx.linq.sink
-from Queue import Empty, Queue
-from threading import Semaphore
+from collections import deque
+from threading import Condition, current_thread
 
 
 class GetIterator(Observer):
-  def __init__(self):
-    self.queue = Queue()
-    self.gate = Semaphore(0)
+  """Hands the values over to the iterating thread through a deque,
+  whose append and popleft are thread safe. The condition is only
+  used if the consumer waits for values or the producer waits for
+  space, so a busy iterator takes no lock per value. A waiting
+  consumer is notified once, values that arrive before it runs are
+  taken from the buffer without further notifications.
+
+  With maxBuffered the producer blocks while the buffer is full and
+  continues once the consumer took half of it. The thread that
+  subscribed is never blocked because it could be the consumer. An
+  iterator that is abandoned before the end must be disposed, or
+  closed, to release a blocked producer."""
+
+  def __init__(self, maxBuffered=None):
+    self.maxBuffered = maxBuffered
+    self.queue = deque()
+    self.condition = Condition()
+    self.consumerWaiting = False
+    self.producerWaiting = False
     self.subscription = SingleAssignmentDisposable()
     self.error = None
     self.done = False
     self.disposed = False
 
   def run(self, source):
+    self.owner = current_thread()
     # [OK] Use of unsafe Subscribe: non-pretentious exact mirror with the dual GetEnumerator method.
     self.subscription.disposable = source.subscribe(self)
     return self
 
   def onNext(self, value):
-    self.queue.put(value)
-    self.gate.release()
+    maxBuffered = self.maxBuffered
+
+    if maxBuffered != None and len(self.queue) >= maxBuffered and current_thread() is not self.owner:
+      with self.condition:
+        self.producerWaiting = True
+
+        while len(self.queue) >= maxBuffered and not self.disposed:
+          self.condition.wait()
+
+        self.producerWaiting = False
+
+    if self.disposed:
+      return
+
+    self.queue.append(value)
+
+    if self.consumerWaiting:
+      self.wakeConsumer()
+
+  def wakeConsumer(self):
+    with self.condition:
+      # the consumer takes everything buffered until it runs
+      self.consumerWaiting = False
+      self.condition.notify_all()
 
   def onError(self, exception):
     self.error = exception
-    self.subscription.dispose()
-    self.gate.release()
+    self.terminate()
 
   def onCompleted(self):
-    self.done = True
+    self.terminate()
+
+  def terminate(self):
+    with self.condition:
+      self.done = True
+      self.condition.notify_all()
+
     self.subscription.dispose()
-    self.gate.release()
 
   def __iter__(self):
     return self
 
   def __next__(self):
-    self.gate.acquire()
-
     if self.disposed:
       raise DisposedException()
 
+    queue = self.queue
+
     try:
-      return self.queue.get(True, 0)
-    except Empty:
-      pass
+      value = queue.popleft()
+    except IndexError:
+      with self.condition:
+        while not self.done and not self.disposed:
+          # set before the queue is checked, so a producer that appends
+          # after the check sees it and notifies
+          self.consumerWaiting = True
+
+          if len(queue) > 0:
+            break
+
+          self.condition.wait()
+
+        self.consumerWaiting = False
+
+      if self.disposed:
+        raise DisposedException()
 
-    if self.error != None:
-      raise self.error
+      if len(queue) == 0:
+        if self.error != None:
+          raise self.error
 
-    assert self.done
+        raise StopIteration()
 
-    self.gate.release()
+      value = queue.popleft()
 
-    raise StopIteration()
+    if self.producerWaiting:
+      self.wakeProducer()
+
+    return value
+
+  next = __next__
+
+  def wakeProducer(self):
+    if len(self.queue) <= self.maxBuffered // 2:
+      with self.condition:
+        self.condition.notify_all()
 
   def dispose(self):
     self.subscription.dispose()
-    self.disposed = True
-    self.gate.release()
-
-  class Sink(rx.linq.sink.Sink):
-    def __init__(self, parent, observer, cancel):
-      super(GetIterator.Sink, self).__init__(observer, cancel)
-      self.parent = parent
-      self.currentKey = None
-      self.hasCurrentKey = False
-
-    def onNext(self, value):
-      try:
-        key = self.parent.keySelector(value)
-      except Exception as e:
-        self.observer.onError(e)
-        self.dispose()
-      else:
-        equal = False
-
-        if self.hasCurrentKey:
-          try:
-            equal = self.currentKey == key
-          except Exception as e:
-            self.observer.onError(e)
-            self.dispose()
-
-        if not self.hasCurrentKey or not equal:
-          self.hasCurrentKey = True
-          self.currentKey = key
-          self.observer.onNext(value)
-
-    def onError(self, exception):
-      self.observer.onError(exception)
-      self.dispose()
-
-    def onCompleted(self):
-      self.observer.onCompleted()
-      self.dispose()
+
+    with self.condition:
+      self.disposed = True
+      self.queue.clear()
+      self.condition.notify_all()
+
+  def close(self):
+    self.dispose()
@@ -1,20 +1,30 @@
-from rx.disposable import CompositeDisposable, RefCountDisposable
+from rx.disposable import CompositeDisposable, Disposable, RefCountDisposable, SerialDisposable
 from rx.observable import GroupObservable, Producer
 from rx.subject import Subject
 import rx.linq.sink
+from collections import OrderedDict
+from threading import RLock
 
 
 class GroupBy(Producer):
-  def __init__(self, source, keySelector, elementSelector):
+  def __init__(self, source, keySelector, elementSelector, maxGroups=None, idleTimeout=None, scheduler=None):
     self.source = source
     self.keySelector = keySelector
     self.elementSelector = elementSelector
+    self.maxGroups = maxGroups
+    self.idleTimeout = idleTimeout
+    self.scheduler = scheduler
+    self.evictionCount = 0
 
   def run(self, observer, cancel, setSink):
     self.groupDisposable = CompositeDisposable()
     self.refCountDisposable = RefCountDisposable(self.groupDisposable)
 
-    sink = self.Sink(self, observer, cancel)
+    if self.maxGroups == None and self.idleTimeout == None:
+      sink = self.Sink(self, observer, cancel)
+    else:
+      sink = self.BoundedSink(self, observer, cancel)
+
     setSink(sink)
     self.groupDisposable.add(self.source.subscribeSafe(sink))
 
@@ -89,4 +99,126 @@ class GroupBy(Producer):
         x.onCompleted()
 
       self.observer.onCompleted()
-      self.dispose()
\ No newline at end of file
+      self.dispose()
+
+
+  class BoundedSink(rx.linq.sink.Sink):
+    """Keeps at most maxGroups groups and completes groups that did
+    not receive a value within idleTimeout. The groups are kept in
+    least recently used order, so the group to evict is always the
+    first one and a single timer for the first group suffices."""
+
+    def __init__(self, parent, observer, cancel):
+      super(GroupBy.BoundedSink, self).__init__(observer, cancel)
+      self.parent = parent
+      # key -> (writer, time of the last value)
+      self.map = OrderedDict()
+      self.gate = RLock()
+      self.timer = SerialDisposable()
+      self.isTimerArmed = False
+      self.parent.groupDisposable.add(self.timer)
+
+    def onNext(self, value):
+      key = None
+
+      try:
+        key = self.parent.keySelector(value)
+      except Exception as e:
+        self.onError(e)
+        return
+
+      fireNewMapEntry = False
+      evicted = []
+
+      with self.gate:
+        entry = self.map.pop(key, None)
+        now = self.parent.scheduler.now()
+
+        if entry == None:
+          writer = Subject()
+          fireNewMapEntry = True
+
+          if self.parent.maxGroups != None:
+            while len(self.map) >= self.parent.maxGroups:
+              evicted.append(self.map.popitem(last=False)[1][0])
+        else:
+          writer = entry[0]
+
+        self.map[key] = (writer, now)
+
+        if self.parent.idleTimeout != None and not self.isTimerArmed:
+          self.isTimerArmed = True
+          self.arm(self.parent.idleTimeout)
+
+      self.evict(evicted)
+
+      if fireNewMapEntry:
+        group = GroupObservable(key, writer, self.parent.refCountDisposable)
+        self.observer.onNext(group)
+
+      element = None
+
+      try:
+        element = self.parent.elementSelector(value)
+      except Exception as e:
+        self.onError(e)
+      else:
+        writer.onNext(element)
+
+    def arm(self, dueTime):
+      self.timer.disposable = self.parent.scheduler.scheduleWithRelative(dueTime, self.expire)
+
+    def expire(self):
+      evicted = []
+
+      with self.gate:
+        deadline = self.parent.scheduler.now() - self.parent.idleTimeout
+
+        while len(self.map) > 0:
+          key = next(iter(self.map))
+          writer, touched = self.map[key]
+
+          if touched > deadline:
+            self.arm(touched - deadline)
+            break
+
+          del self.map[key]
+          evicted.append(writer)
+        else:
+          self.isTimerArmed = False
+
+      self.evict(evicted)
+
+      return Disposable.empty()
+
+    def evict(self, writers):
+      if len(writers) == 0:
+        return
+
+      with self.gate:
+        self.parent.evictionCount += len(writers)
+
+      for writer in writers:
+        writer.onCompleted()
+
+    def takeWriters(self):
+      with self.gate:
+        writers = [entry[0] for entry in self.map.values()]
+        self.map.clear()
+        self.timer.dispose()
+
+      return writers
+
+    def onError(self, exception):
+      for x in self.takeWriters():
+        x.onError(exception)
+
+      self.observer.onError(exception)
+      self.dispose()
+
+    def onCompleted(self):
+      for x in self.takeWriters():
+        x.onCompleted()
+
+      self.observer.onCompleted()
+      self.dispose()
@@ -0,0 +1,161 @@
+from rx.disposable import CompositeDisposable, Disposable, RefCountDisposable, SerialDisposable, SingleAssignmentDisposable
+from rx.observable import Producer
+from rx.observer import Observer
+from rx.subject import Subject
+from .addRef import AddRef
+from .joinWithKey import KeyedWindow
+import rx.linq.sink
+from threading import RLock
+
+
+class GroupJoinWithKey(Producer):
+  def __init__(self, left, right, leftKeySelector, rightKeySelector, leftWindow, rightWindow, resultSelector, scheduler):
+    self.left = left
+    self.right = right
+    self.leftKeySelector = leftKeySelector
+    self.rightKeySelector = rightKeySelector
+    self.leftWindow = leftWindow
+    self.rightWindow = rightWindow
+    self.resultSelector = resultSelector
+    self.scheduler = scheduler
+
+  def run(self, observer, cancel, setSink):
+    sink = self.Sink(self, observer, cancel)
+    setSink(sink)
+    return sink.run()
+
+
+  class Sink(rx.linq.sink.Sink):
+    def __init__(self, parent, observer, cancel):
+      super(GroupJoinWithKey.Sink, self).__init__(observer, cancel)
+      self.parent = parent
+
+    def run(self):
+      self.gate = RLock()
+      self.timer = SerialDisposable()
+      self.dueTime = None
+      self.group = CompositeDisposable()
+      self.refCount = RefCountDisposable(self.group)
+
+      # the left window holds the subjects of the open left groups
+      self.leftWindow = KeyedWindow(self.parent.leftWindow)
+      self.rightWindow = KeyedWindow(self.parent.rightWindow)
+
+      leftSubscription = SingleAssignmentDisposable()
+      self.group.add(leftSubscription)
+
+      rightSubscription = SingleAssignmentDisposable()
+      self.group.add(rightSubscription)
+
+      self.group.add(self.timer)
+
+      leftSubscription.disposable = self.parent.left.subscribeSafe(self.Left(self))
+      rightSubscription.disposable = self.parent.right.subscribeSafe(self.Right(self))
+
+      return self.refCount
+
+    def expire(self, now):
+      for s in self.leftWindow.expire(now):
+        s.onCompleted()
+
+      self.rightWindow.expire(now)
+
+    def arm(self, now):
+      dueTimes = [t for t in (self.leftWindow.nextDueTime(), self.rightWindow.nextDueTime()) if t != None]
+
+      if len(dueTimes) == 0:
+        return
+
+      dueTime = min(dueTimes)
+
+      if dueTime != self.dueTime:
+        self.dueTime = dueTime
+        self.timer.disposable = self.parent.scheduler.scheduleWithRelative(dueTime - now, self.tick)
+
+    def tick(self):
+      with self.gate:
+        now = self.parent.scheduler.now()
+        self.dueTime = None
+        self.expire(now)
+        self.arm(now)
+
+      return Disposable.empty()
+
+    def onError(self, exception):
+      with self.gate:
+        for s in self.leftWindow.values():
+          s.onError(exception)
+
+        self.observer.onError(exception)
+        self.dispose()
+
+    class Left(Observer):
+      def __init__(self, parent):
+        self.parent = parent
+
+      def onNext(self, value):
+        try:
+          key = self.parent.parent.leftKeySelector(value)
+        except Exception as e:
+          self.parent.onError(e)
+          return
+
+        s = Subject()
+        window = AddRef(s, self.parent.refCount)
+
+        try:
+          result = self.parent.parent.resultSelector(value, window)
+        except Exception as e:
+          self.parent.onError(e)
+          return
+
+        with self.parent.gate:
+          now = self.parent.parent.scheduler.now()
+          self.parent.expire(now)
+          self.parent.leftWindow.add(key, s, now)
+
+          self.parent.observer.onNext(result)
+
+          for rightValue in self.parent.rightWindow.matches(key):
+            s.onNext(rightValue)
+
+          self.parent.arm(now)
+
+      def onError(self, exception):
+        self.parent.onError(exception)
+
+      def onCompleted(self):
+        with self.parent.gate:
+          self.parent.observer.onCompleted()
+          self.parent.dispose()
+    #end Left
+
+    class Right(Observer):
+      def __init__(self, parent):
+        self.parent = parent
+
+      def onNext(self, value):
+        try:
+          key = self.parent.parent.rightKeySelector(value)
+        except Exception as e:
+          self.parent.onError(e)
+          return
+
+        with self.parent.gate:
+          now = self.parent.parent.scheduler.now()
+          self.parent.expire(now)
+          self.parent.rightWindow.add(key, value, now)
+
+          for s in self.parent.leftWindow.matches(key):
+            s.onNext(value)
+
+          self.parent.arm(now)
+
+      def onError(self, exception):
+        self.parent.onError(exception)
+
+      def onCompleted(self):
+        pass
+    #end Right
+  #end Sink
+#end GroupJoinWithKey
@@ -7,7 +7,10 @@ from .whileOp import While
 from rx.observable import Observable
 from rx.scheduler import Scheduler
 
-import collections
+try:
+  from collections.abc import Iterable
+except ImportError:
+  from collections import Iterable
 
 
 ####################
@@ -36,7 +39,7 @@ def doWhile(condition, source):
 Observable.doWhile = doWhile
 
 def iterableFor(iterable, resultSelector):
-  assert isinstance(iterable, collections.Iterable)
+  assert isinstance(iterable, Iterable)
   assert callable(resultSelector)
 
   return For(iterable, resultSelector)
@@ -0,0 +1,240 @@
+from rx.disposable import CompositeDisposable, Disposable, SerialDisposable, SingleAssignmentDisposable
+from rx.observable import Producer
+from rx.observer import Observer
+import rx.linq.sink
+from collections import deque, OrderedDict
+from threading import RLock
+
+
+class KeyedWindow(object):
+  """Holds the values of one side of a join that are still inside
+  their window. Values are indexed by key, so a value from the other
+  side only visits its matching partners. Because all values of one
+  side share the same window length, they expire in arrival order and
+  a deque of due times is enough as time index."""
+
+  def __init__(self, window):
+    self.window = window
+    self.nextId = 0
+    self.count = 0
+    self.map = {}
+    self.expirations = deque()
+
+  def __len__(self):
+    return self.count
+
+  def add(self, key, value, now):
+    self.nextId += 1
+    self.count += 1
+
+    bucket = self.map.get(key)
+
+    if bucket == None:
+      bucket = OrderedDict()
+      self.map[key] = bucket
+
+    bucket[self.nextId] = value
+
+    if self.window != None:
+      self.expirations.append((now + self.window, key, self.nextId))
+
+  def matches(self, key):
+    bucket = self.map.get(key)
+
+    if bucket == None:
+      return ()
+    else:
+      return list(bucket.values())
+
+  def values(self):
+    return [value for bucket in self.map.values() for value in bucket.values()]
+
+  def nextDueTime(self):
+    if len(self.expirations) == 0:
+      return None
+    else:
+      return self.expirations[0][0]
+
+  def expire(self, now):
+    """Removes and returns all values whose window ended at now."""
+    expired = []
+    expirations = self.expirations
+
+    while len(expirations) > 0 and expirations[0][0] <= now:
+      _, key, resourceId = expirations.popleft()
+      bucket = self.map[key]
+      expired.append(bucket.pop(resourceId))
+      self.count -= 1
+
+      if len(bucket) == 0:
+        del self.map[key]
+
+    return expired
+
+
+class JoinWithKey(Producer):
+  def __init__(self, left, right, leftKeySelector, rightKeySelector, leftWindow, rightWindow, resultSelector, scheduler):
+    super(JoinWithKey, self).__init__()
+    self.left = left
+    self.right = right
+    self.leftKeySelector = leftKeySelector
+    self.rightKeySelector = rightKeySelector
+    self.leftWindow = leftWindow
+    self.rightWindow = rightWindow
+    self.resultSelector = resultSelector
+    self.scheduler = scheduler
+
+  def run(self, observer, cancel, setSink):
+    sink = self.Sink(self, observer, cancel)
+    setSink(sink)
+    return sink.run()
+
+  class Sink(rx.linq.sink.Sink):
+    def __init__(self, parent, observer, cancel):
+      super(JoinWithKey.Sink, self).__init__(observer, cancel)
+      self.parent = parent
+
+    def run(self):
+      self.gate = RLock()
+      self.timer = SerialDisposable()
+      self.dueTime = None
+
+      self.leftDone = False
+      self.leftWindow = KeyedWindow(self.parent.leftWindow)
+
+      self.rightDone = False
+      self.rightWindow = KeyedWindow(self.parent.rightWindow)
+
+      leftSubscription = SingleAssignmentDisposable()
+      rightSubscription = SingleAssignmentDisposable()
+
+      leftSubscription.disposable = self.parent.left.subscribeSafe(self.Left(self))
+      rightSubscription.disposable = self.parent.right.subscribeSafe(self.Right(self))
+
+      return CompositeDisposable(leftSubscription, rightSubscription, self.timer)
+
+    def expire(self, now):
+      """Drops all values whose window ended, returns True if
+      this completed the join."""
+      self.leftWindow.expire(now)
+      self.rightWindow.expire(now)
+
+      if self.leftDone and len(self.leftWindow) == 0 or self.rightDone and len(self.rightWindow) == 0:
+        self.observer.onCompleted()
+        self.dispose()
+        return True
+
+      return False
+
+    def arm(self, now):
+      dueTimes = [t for t in (self.leftWindow.nextDueTime(), self.rightWindow.nextDueTime()) if t != None]
+
+      if len(dueTimes) == 0:
+        return
+
+      dueTime = min(dueTimes)
+
+      if dueTime != self.dueTime:
+        self.dueTime = dueTime
+        self.timer.disposable = self.parent.scheduler.scheduleWithRelative(dueTime - now, self.tick)
+
+    def tick(self):
+      with self.gate:
+        now = self.parent.scheduler.now()
+        self.dueTime = None
+
+        if not self.expire(now):
+          self.arm(now)
+
+      return Disposable.empty()
+
+    def onError(self, exception):
+      with self.gate:
+        self.observer.onError(exception)
+        self.dispose()
+
+    class Left(Observer):
+      def __init__(self, parent):
+        self.parent = parent
+
+      def onNext(self, value):
+        try:
+          key = self.parent.parent.leftKeySelector(value)
+        except Exception as e:
+          self.parent.onError(e)
+          return
+
+        with self.parent.gate:
+          now = self.parent.parent.scheduler.now()
+
+          if self.parent.expire(now):
+            return
+
+          self.parent.leftWindow.add(key, value, now)
+
+          for rightValue in self.parent.rightWindow.matches(key):
+            try:
+              result = self.parent.parent.resultSelector(value, rightValue)
+            except Exception as e:
+              self.parent.onError(e)
+              return
+            else:
+              self.parent.observer.onNext(result)
+
+          self.parent.arm(now)
+
+      def onError(self, exception):
+        self.parent.onError(exception)
+
+      def onCompleted(self):
+        with self.parent.gate:
+          self.parent.leftDone = True
+
+          if self.parent.rightDone or len(self.parent.leftWindow) == 0:
+            self.parent.observer.onCompleted()
+            self.parent.dispose()
+    #end Left
+
+    class Right(Observer):
+      def __init__(self, parent):
+        self.parent = parent
+
+      def onNext(self, value):
+        try:
+          key = self.parent.parent.rightKeySelector(value)
+        except Exception as e:
+          self.parent.onError(e)
+          return
+
+        with self.parent.gate:
+          now = self.parent.parent.scheduler.now()
+
+          if self.parent.expire(now):
+            return
+
+          self.parent.rightWindow.add(key, value, now)
+
+          for leftValue in self.parent.leftWindow.matches(key):
+            try:
+              result = self.parent.parent.resultSelector(leftValue, value)
+            except Exception as e:
+              self.parent.onError(e)
+              return
+            else:
+              self.parent.observer.onNext(result)
+
+          self.parent.arm(now)
+
+      def onError(self, exception):
+        self.parent.onError(exception)
+
+      def onCompleted(self):
+        with self.parent.gate:
+          self.parent.rightDone = True
+
+          if self.parent.leftDone or len(self.parent.rightWindow) == 0:
+            self.parent.observer.onCompleted()
+            self.parent.dispose()
+    #end Right
+  #end Sink
+#end JoinWithKey
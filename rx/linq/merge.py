@@ -1,18 +1,30 @@
-from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
+from rx.disposable import CompositeDisposable, Disposable, SingleAssignmentDisposable
 from rx.observable import Producer
 from rx.observer import Observer
 import rx.linq.sink
-from threading import RLock
-from Queue import Queue
+from collections import deque
+from threading import Condition, Lock, RLock, current_thread
+
+try:
+  from Queue import Queue
+except ImportError:
+  from queue import Queue
 
 
 class Merge(Producer):
-  def __init__(self, sources, maxConcurrency):
+  def __init__(self, sources, maxConcurrency, drain=False, prefetch=None, batchSize=1):
     self.sources = sources
     self.maxConcurrency = maxConcurrency
+    self.drain = drain
+    self.prefetch = prefetch
+    self.batchSize = batchSize
 
   def run(self, observer, cancel, setSink):
-    if self.maxConcurrency > 0:
+    if self.drain:
+      sink = self.DrainSink(self, observer, cancel)
+      setSink(sink)
+      return sink.run()
+    elif self.maxConcurrency > 0:
       sink = self.ConcurrentSink(self, observer, cancel)
       setSink(sink)
       return sink.run()
@@ -167,3 +179,186 @@ class Merge(Producer):
             if self.parent.isStopped and self.parent.activeCount == 0:
               self.parent.observer.onCompleted()
               self.parent.dispose()
+
+
+  class DrainSink(rx.linq.sink.Sink):
+    """Inner observers only append to their own queue. The thread that
+    finds the sink idle becomes the drain owner and delivers the queued
+    values of all inners round robin, at most batchSize values of one
+    inner at a time, so producers never wait for a slow observer. An
+    inner with prefetch queued values blocks its producer until the
+    owner caught up."""
+
+    def __init__(self, parent, observer, cancel):
+      super(Merge.DrainSink, self).__init__(observer, cancel)
+      self.parent = parent
+
+    def run(self):
+      self.lock = Lock()
+      self.notFull = Condition(self.lock)
+      self.ready = deque()
+      self.pending = deque()
+      self.wip = 0
+      self.owner = None
+      self.isStopped = False
+      self.isDisposed = False
+      self.exception = None
+      self.activeCount = 0
+
+      self.group = CompositeDisposable()
+      self.group.add(Disposable.create(self.disposeQueues))
+      self.sourceSubscription = SingleAssignmentDisposable()
+      self.group.add(self.sourceSubscription)
+      self.sourceSubscription.disposable = self.parent.sources.subscribeSafe(self)
+
+      return self.group
+
+    def disposeQueues(self):
+      with self.lock:
+        self.isDisposed = True
+        self.ready.clear()
+        self.pending.clear()
+        self.notFull.notify_all()
+
+    def onNext(self, value):
+      with self.lock:
+        maxConcurrency = self.parent.maxConcurrency
+
+        if maxConcurrency > 0 and self.activeCount >= maxConcurrency:
+          self.pending.append(value)
+          return
+
+        self.activeCount += 1
+
+      self.subscribe(value)
+
+    def onError(self, exception):
+      with self.lock:
+        if self.exception == None:
+          self.exception = exception
+
+      self.drain()
+
+    def onCompleted(self):
+      with self.lock:
+        self.isStopped = True
+
+      self.sourceSubscription.dispose()
+      self.drain()
+
+    def subscribe(self, innerSource):
+      subscription = SingleAssignmentDisposable()
+      self.group.add(subscription)
+      subscription.disposable = innerSource.subscribeSafe(self.InnerObserver(self, subscription))
+
+    def innerCompleted(self, subscription):
+      self.group.remove(subscription)
+
+      with self.lock:
+        if len(self.pending) > 0:
+          innerSource = self.pending.popleft()
+        else:
+          innerSource = None
+          self.activeCount -= 1
+
+      if innerSource != None:
+        self.subscribe(innerSource)
+
+      self.drain()
+
+    def drain(self):
+      with self.lock:
+        self.wip += 1
+
+        if self.wip != 1:
+          return
+
+        self.owner = current_thread()
+
+      missed = 1
+      batchSize = self.parent.batchSize
+
+      while True:
+        while True:
+          with self.lock:
+            if self.isDisposed:
+              return
+
+            if self.exception != None:
+              exception = self.exception
+              break
+
+            if len(self.ready) == 0:
+              exception = None
+              break
+
+            inner = self.ready.popleft()
+            queue = inner.queue
+            batch = [queue.popleft() for _ in range(min(batchSize, len(queue)))]
+
+            if len(queue) > 0:
+              self.ready.append(inner)
+            else:
+              inner.isReady = False
+
+            if self.parent.prefetch != None:
+              self.notFull.notify_all()
+
+          observer = self.observer
+
+          for value in batch:
+            observer.onNext(value)
+
+        if exception != None:
+          self.observer.onError(exception)
+          self.dispose()
+          return
+
+        with self.lock:
+          isDone = self.isStopped and self.activeCount == 0 and len(self.ready) == 0
+
+        if isDone:
+          self.observer.onCompleted()
+          self.dispose()
+          return
+
+        with self.lock:
+          self.wip -= missed
+          missed = self.wip
+
+          if missed == 0:
+            self.owner = None
+            return
+
+    class InnerObserver(Observer):
+      def __init__(self, parent, subscription):
+        self.parent = parent
+        self.subscription = subscription
+        self.queue = deque()
+        self.isReady = False
+
+      def onNext(self, value):
+        parent = self.parent
+        prefetch = parent.parent.prefetch
+
+        with parent.lock:
+          if prefetch != None and parent.owner != current_thread():
+            while len(self.queue) >= prefetch and not parent.isDisposed:
+              parent.notFull.wait()
+
+          if parent.isDisposed:
+            return
+
+          self.queue.append(value)
+
+          if not self.isReady:
+            self.isReady = True
+            parent.ready.append(self)
+
+        parent.drain()
+
+      def onError(self, exception):
+        self.parent.onError(exception)
+
+      def onCompleted(self):
+        self.parent.innerCompleted(self.subscription)
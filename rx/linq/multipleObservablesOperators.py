@@ -12,11 +12,14 @@ from .zip import Zip
 from rx.observable import Observable
 from rx.scheduler import Scheduler
 
-import collections
+try:
+  from collections.abc import Iterable
+except ImportError:
+  from collections import Iterable
 
 def flattedSequence(items):
   for item in items:
-    isIterable = isinstance(item, collections.Iterable)
+    isIterable = isinstance(item, Iterable)
     isString = isinstance(item, str)
 
     if isinstance(item, Observable):
@@ -70,12 +73,14 @@ def concat(*sources):
   return Concat(flattedSequence(sources))
 Observable.concat = concat
 
-def merge(sourcesObservable, maxConcurrency=0):
-  if isinstance(sourcesObservable, Observable):
-    return Merge(sourcesObservable, maxConcurrency)
-  else:
+def merge(sourcesObservable, maxConcurrency=0, drain=False, prefetch=None, batchSize=1):
+  assert prefetch == None or prefetch > 0
+  assert batchSize > 0
+
+  if not isinstance(sourcesObservable, Observable):
     sourcesObservable = Observable.fromIterable(sourcesObservable)
-    return Merge(sourcesObservable, maxConcurrency)
+
+  return Merge(sourcesObservable, maxConcurrency, drain, prefetch, batchSize)
 
 Observable.merge = merge
 
@@ -111,7 +116,12 @@ Observable.takeUntil = takeUntil
 
 def zipOp(*sources, **kwargs):
   resultSelector = kwargs.pop('resultSelector', lambda *x: x)
+  maxQueued = kwargs.pop('maxQueued', None)
+  overflow = kwargs.pop('overflow', 'block')
   if kwargs:
     raise TypeError(kwargs)
-  return Zip(flattedSequence(sources), resultSelector)
+  assert maxQueued == None or maxQueued > 0
+  assert overflow in ('block', 'drop', 'dropOldest', 'error')
+
+  return Zip(flattedSequence(sources), resultSelector, maxQueued, overflow)
 Observable.zip = zipOp
@@ -3,49 +3,32 @@ import rx.linq.sink
 
 
 class Range(Producer):
-  def __init__(self, start, count, scheduler):
+  def __init__(self, start, count, scheduler, chunkSize, timeBudget):
     self.start = start
     self.count = count
     self.scheduler = scheduler
+    self.chunkSize = chunkSize
+    self.timeBudget = timeBudget
 
   def run(self, observer, cancel, setSink):
     sink = self.Sink(self, observer, cancel)
     setSink(sink)
     return sink.run()
 
-  class Sink(rx.linq.sink.Sink):
+  class Sink(rx.linq.sink.ChunkedSink):
     def __init__(self, parent, observer, cancel):
-      super(Range.Sink, self).__init__(observer, cancel)
+      super(Range.Sink, self).__init__(observer, cancel, parent.chunkSize, parent.timeBudget)
       self.parent = parent
+      self.index = 0
 
     def run(self):
-      scheduler = self.parent.scheduler
-
-      if scheduler.isLongRunning:
-        return scheduler.scheduleLongRunningWithState(
-          0,
-          self.loop
-        )
-      else:
-        return scheduler.scheduleRecursiveWithState(
-          0,
-          self.loopRec
-        )
-
-    def loop(self, i, cancel):
-      while not cancel.isDisposed and i < self.parent.count:
-        self.observer.onNext(self.parent.start + i)
-        i += 1
-
-      if not cancel.isDisposed:
-        self.observer.onCompleted()
-
-      self.dispose()
-
-    def loopRec(self, i, recurse):
-      if i < self.parent.count:
-        self.observer.onNext(self.parent.start + i)
-        recurse(i + 1)
-      else:
-        self.observer.onCompleted()
-        self.dispose()
\ No newline at end of file
+      return self.runChunked(self.parent.scheduler)
+
+    def fill(self, values, count):
+      start = self.parent.start
+      end = min(self.index + count, self.parent.count)
+
+      values.extend([start + i for i in range(self.index, end)])
+      self.index = end
+
+      return end < self.parent.count
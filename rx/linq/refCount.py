@@ -1,21 +1,74 @@
-from rx.disposable import Disposable
+from rx.disposable import Disposable, SerialDisposable
 from rx.observable import Producer
 import rx.linq.sink
 from threading import RLock
 
 
 class RefCount(Producer):
-  def __init__(self, source):
+  def __init__(self, source, gracePeriod=None, scheduler=None):
     self.source = source
+    self.gracePeriod = gracePeriod
+    self.scheduler = scheduler
     self.gate = RLock()
     self.count = 0
     self.connectableSubscription = None
+    self.pendingDisconnect = SerialDisposable()
+
+    # metrics
+    self.connectCount = 0
+    self.disconnectCount = 0
+    self.reuseCount = 0
 
   def run(self, observer, cancel, setSink):
     sink = self.Sink(self, observer, cancel)
     setSink(sink)
     return sink.run()
 
+  def acquire(self):
+    with self.gate:
+      self.count += 1
+
+      if self.count == 1:
+        if self.connectableSubscription == None:
+          self.connectableSubscription = self.source.connect()
+          self.connectCount += 1
+        else:
+          # a subscriber returned within the grace period
+          self.pendingDisconnect.disposable = Disposable.empty()
+          self.reuseCount += 1
+
+  def release(self):
+    with self.gate:
+      self.count -= 1
+
+      if self.count != 0:
+        return
+
+      if self.gracePeriod == None:
+        self.disconnect()
+      else:
+        connection = self.connectableSubscription
+
+        def scheduled():
+          with self.gate:
+            if self.count == 0 and self.connectableSubscription is connection:
+              self.disconnect()
+
+          return Disposable.empty()
+
+        self.pendingDisconnect.disposable = self.scheduler.scheduleWithRelative(
+          self.gracePeriod,
+          scheduled
+        )
+
+  def disconnect(self):
+    connection = self.connectableSubscription
+    self.connectableSubscription = None
+
+    if connection != None:
+      connection.dispose()
+      self.disconnectCount += 1
+
   class Sink(rx.linq.sink.Sink):
     def __init__(self, parent, observer, cancel):
       super(RefCount.Sink, self).__init__(observer, cancel)
@@ -24,20 +77,11 @@ class RefCount(Producer):
     def run(self):
       subscription = self.parent.source.subscribeSafe(self)
 
-      with self.parent.gate:
-        self.parent.count += 1
-
-        if self.parent.count == 1:
-          self.parent.connectableSubscription = self.parent.source.connect()
+      self.parent.acquire()
 
       def dispose():
         subscription.dispose()
-
-        with self.parent.gate:
-          self.parent.count -= 1
-
-          if self.parent.count == 0:
-            self.parent.connectableSubscription.dispose()
+        self.parent.release()
 
       return Disposable.create(dispose)
 
@@ -50,4 +94,4 @@ class RefCount(Producer):
 
     def onCompleted(self):
       self.observer.onCompleted()
-      self.dispose()
\ No newline at end of file
+      self.dispose()
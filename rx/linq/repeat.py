@@ -3,71 +3,35 @@ import rx.linq.sink
 
 
 class Repeat(Producer):
-  def __init__(self, value, repeatCount, scheduler):
+  def __init__(self, value, repeatCount, scheduler, chunkSize, timeBudget):
     self.value = value
     self.repeatCount = repeatCount
     self.scheduler = scheduler
+    self.chunkSize = chunkSize
+    self.timeBudget = timeBudget
 
   def run(self, observer, cancel, setSink):
     sink = self.Sink(self, observer, cancel)
     setSink(sink)
     return sink.run()
 
-  class Sink(rx.linq.sink.Sink):
+  class Sink(rx.linq.sink.ChunkedSink):
     def __init__(self, parent, observer, cancel):
-      super(Repeat.Sink, self).__init__(observer, cancel)
+      super(Repeat.Sink, self).__init__(observer, cancel, parent.chunkSize, parent.timeBudget)
       self.parent = parent
+      # None repeats indefinitely
+      self.remaining = parent.repeatCount
 
     def run(self):
-      if self.parent.scheduler.isLongRunning:
-        if self.parent.repeatCount == None:
-          self.parent.scheduler.scheduleLongRunning(self.loopInf)
-        else:
-          self.parent.scheduler.scheduleLongRunningWithState(
-            self.parent.repeatCount,
-            self.loop
-          )
-      else:
-        if self.parent.repeatCount == None:
-          self.parent.scheduler.scheduleRecursive(self.loopRecInf)
-        else:
-          self.parent.scheduler.scheduleRecursiveWithState(
-            self.parent.repeatCount,
-            self.loopRec
-          )
+      return self.runChunked(self.parent.scheduler)
 
-    def loop(self, n, cancel):
-      value = self.parent.value
+    def fill(self, values, count):
+      if self.remaining == None:
+        values.extend([self.parent.value] * count)
+        return True
 
-      while n > 0 and not cancel.isDisposed:
-        self.observer.onNext(value)
-        n -= 1
+      n = min(count, self.remaining)
+      values.extend([self.parent.value] * n)
+      self.remaining -= n
 
-      if not cancel.isDisposed:
-        self.observer.onCompleted()
-
-      self.dispose()
-
-    def loopInf(self, cancel):
-      value = self.parent.value
-
-      while not cancel.isDisposed:
-        self.observer.onNext(value)
-
-      self.dispose()
-
-    def loopRec(self, n, recurse):
-      if n > 0:
-        self.observer.onNext(self.parent.value)
-        n -= 1
-
-      if n == 0:
-        self.observer.onCompleted()
-        self.dispose()
-        return
-
-      recurse(n)
-
-    def loopRecInf(self, recurse):
-      self.observer.onNext(self.parent.value)
-      recurse()
+      return self.remaining > 0
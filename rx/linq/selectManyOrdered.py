@@ -0,0 +1,180 @@
+from rx.disposable import CompositeDisposable, Disposable, SingleAssignmentDisposable
+from rx.exceptions import QueueOverflowException
+from rx.observable import Producer
+from rx.observer import Observer
+import rx.linq.sink
+from collections import deque
+from threading import Condition, RLock, current_thread
+
+
+class SelectManyOrdered(Producer):
+  """Subscribes to up to maxConcurrency inner observables at once but
+  yields their values in the order of the source. The values of the
+  oldest inner are yielded immediately, all later inners buffer at most
+  prefetch values until they become the oldest. Completed inners that
+  still buffer values do not take a slot. The thread that subscribed
+  is never blocked because it could have to drive the oldest inner."""
+
+  def __init__(self, source, selector, maxConcurrency, prefetch, overflow):
+    self.source = source
+    self.selector = selector
+    self.maxConcurrency = maxConcurrency
+    self.prefetch = prefetch
+    self.overflow = overflow
+
+  def run(self, observer, cancel, setSink):
+    sink = self.Sink(self, observer, cancel)
+    setSink(sink)
+    return sink.run()
+
+  class Sink(rx.linq.sink.Sink):
+    def __init__(self, parent, observer, cancel):
+      super(SelectManyOrdered.Sink, self).__init__(observer, cancel)
+      self.parent = parent
+
+    def run(self):
+      self.gate = RLock()
+      self.notFull = Condition(self.gate)
+      # the subscribed inners in source order, the first one is yielding
+      self.inners = deque()
+      # the number of inners that did not complete yet
+      self.running = 0
+      # the inner observables waiting for a free slot
+      self.pending = deque()
+      self.isStopped = False
+      self.isDisposed = False
+      self.owner = current_thread()
+
+      self.group = CompositeDisposable()
+      self.group.add(Disposable.create(self.disposeBuffers))
+      self.sourceSubscription = SingleAssignmentDisposable()
+      self.group.add(self.sourceSubscription)
+      self.sourceSubscription.disposable = self.parent.source.subscribeSafe(self)
+
+      return self.group
+
+    def disposeBuffers(self):
+      with self.gate:
+        self.isDisposed = True
+
+        for inner in self.inners:
+          inner.queue.clear()
+
+        self.pending.clear()
+        self.notFull.notify_all()
+
+    def onNext(self, value):
+      try:
+        source = self.parent.selector(value)
+      except Exception as e:
+        self.onError(e)
+        return
+
+      with self.gate:
+        maxConcurrency = self.parent.maxConcurrency
+
+        if maxConcurrency > 0 and self.running >= maxConcurrency:
+          self.pending.append(source)
+          return
+
+        inner = self.Inner(self)
+        self.inners.append(inner)
+        self.running += 1
+
+      self.subscribeInner(inner, source)
+
+    def onError(self, exception):
+      with self.gate:
+        self.observer.onError(exception)
+        self.dispose()
+
+    def onCompleted(self):
+      with self.gate:
+        self.isStopped = True
+        self.sourceSubscription.dispose()
+        self.checkCompleted()
+
+    def subscribeInner(self, inner, source):
+      self.group.add(inner.subscription)
+      inner.subscription.disposable = source.subscribeSafe(inner)
+
+    def checkCompleted(self):
+      if self.isStopped and len(self.inners) == 0 and len(self.pending) == 0:
+        self.observer.onCompleted()
+        self.dispose()
+
+    def advance(self):
+      """Drops the completed inners at the front, yields the buffered
+      values of the new first inner and fills the free slots."""
+      started = []
+
+      with self.gate:
+        inners = self.inners
+
+        while len(inners) > 0 and inners[0].isDone:
+          inners.popleft()
+
+          if len(inners) > 0:
+            queue = inners[0].queue
+
+            while len(queue) > 0:
+              self.observer.onNext(queue.popleft())
+
+            self.notFull.notify_all()
+
+        maxConcurrency = self.parent.maxConcurrency
+
+        while len(self.pending) > 0 and (maxConcurrency <= 0 or self.running < maxConcurrency):
+          inner = self.Inner(self)
+          inners.append(inner)
+          self.running += 1
+          started.append((inner, self.pending.popleft()))
+
+        self.checkCompleted()
+
+      for inner, source in started:
+        self.subscribeInner(inner, source)
+
+    class Inner(Observer):
+      def __init__(self, parent):
+        self.parent = parent
+        self.queue = deque()
+        self.isDone = False
+        self.subscription = SingleAssignmentDisposable()
+
+      def isFirst(self):
+        return len(self.parent.inners) > 0 and self.parent.inners[0] is self
+
+      def onNext(self, value):
+        parent = self.parent
+        prefetch = parent.parent.prefetch
+
+        with parent.gate:
+          if not self.isFirst() and prefetch != None and len(self.queue) >= prefetch:
+            if parent.parent.overflow == 'block':
+              # the subscribing thread could have to produce the values
+              # of the first inner, so its values are buffered anyway
+              while current_thread() is not parent.owner and not self.isFirst() and len(self.queue) >= prefetch and not parent.isDisposed:
+                parent.notFull.wait()
+            else:
+              parent.onError(QueueOverflowException(prefetch))
+              return
+
+          if parent.isDisposed:
+            return
+
+          if self.isFirst():
+            parent.observer.onNext(value)
+          else:
+            self.queue.append(value)
+
+      def onError(self, exception):
+        self.parent.onError(exception)
+
+      def onCompleted(self):
+        with self.parent.gate:
+          self.isDone = True
+          self.parent.running -= 1
+
+        self.parent.group.remove(self.subscription)
+        self.parent.advance()
@@ -32,15 +32,24 @@ def asObservable(self):
     return AsObservable(self)
 Observable.asObservable = asObservable
 
-def bufferOp(self, count, skip=None):
+def bufferOp(self, count, skip=None, view=False, typecode=None):
   assert isinstance(self, Observable)
+  assert typecode == None or view
 
   if skip == None:
-    return Buffer(self, count, count)
-  else:
-    return Buffer(self, count, skip)
+    skip = count
+
+  return Buffer(self, count, skip, view=view, typecode=typecode)
 Observable.buffer = bufferOp
 
+def bufferArray(self, count, typecode='d', into='array'):
+  assert isinstance(self, Observable)
+  assert count > 0
+  assert into in ('array', 'ndarray', 'columns')
+
+  return Buffer(self, count, count, typecode=typecode, into=into)
+Observable.bufferArray = bufferArray
+
 def dematerialize(self):
   assert isinstance(self, Observable)
 
@@ -128,11 +137,12 @@ def skipLast(self, count):
   return SkipLastCount(self, count)
 Observable.skipLast = skipLast
 
-def skipLastWithTime(self, time, scheduler=Scheduler.timeBasedOperation):
+def skipLastWithTime(self, time, scheduler=Scheduler.timeBasedOperation, sampleEvery=1):
   assert isinstance(self, Observable)
   assert isinstance(scheduler, Scheduler)
+  assert sampleEvery >= 1
 
-  return SkipLastTime(self, time, scheduler)
+  return SkipLastTime(self, time, scheduler, sampleEvery)
 Observable.skipLastWithTime = skipLastWithTime
 
 def startWith(self, *values):
@@ -147,11 +157,12 @@ def takeLast(self, count, scheduler=Scheduler.timeBasedOperation):
   return TakeLastCount(self, count, scheduler)
 Observable.takeLast = takeLast
 
-def takeLastWithTime(self, time, scheduler=Scheduler.timeBasedOperation):
+def takeLastWithTime(self, time, scheduler=Scheduler.timeBasedOperation, sampleEvery=1):
   assert isinstance(self, Observable)
   assert isinstance(scheduler, Scheduler)
+  assert sampleEvery >= 1
 
-  return TakeLastTime(self, time, scheduler)
+  return TakeLastTime(self, time, scheduler, sampleEvery)
 Observable.takeLastWithTime = takeLastWithTime
 
 def takeLastBuffer(self, count):
@@ -160,11 +171,12 @@ def takeLastBuffer(self, count):
   return TakeLastBufferCount(self, count)
 Observable.takeLastBuffer = takeLastBuffer
 
-def takeLastBufferWithTime(self, time, scheduler=Scheduler.timeBasedOperation):
+def takeLastBufferWithTime(self, time, scheduler=Scheduler.timeBasedOperation, sampleEvery=1):
   assert isinstance(self, Observable)
   assert isinstance(scheduler, Scheduler)
+  assert sampleEvery >= 1
 
-  return TakeLastBufferTime(self, time, scheduler)
+  return TakeLastBufferTime(self, time, scheduler, sampleEvery)
 Observable.takeLastBufferWithTime = takeLastBufferWithTime
 
 def window(self, count, skip=None):
@@ -1,7 +1,8 @@
 from rx.concurrency import Atomic
-from rx.disposable import AsyncLock, Cancelable, Disposable, CompositeDisposable, SerialDisposable, SingleAssignmentDisposable
+from rx.disposable import AsyncLock, BooleanDisposable, Cancelable, Disposable, CompositeDisposable, SerialDisposable, SingleAssignmentDisposable
 from rx.observer import NoopObserver, Observer
 from rx.scheduler import Scheduler
+import time
 
 
 class Sink(Disposable):
@@ -40,6 +41,128 @@ class Sink(Disposable):
     return self.Forewarder(self)
 
 
+class ChunkedSink(Sink):
+  """Base class for sources that yield their values in chunks of
+  chunkSize values. On a scheduler without long running support one
+  turn yields chunks until timeBudget seconds are used up, or a single
+  chunk if timeBudget is None, and checks for cancellation between the
+  chunks. Chunks are passed to onNextBatch if the observer has it."""
+
+  def __init__(self, observer, cancel, chunkSize, timeBudget):
+    super(ChunkedSink, self).__init__(observer, cancel)
+    self.chunkSize = chunkSize
+    self.timeBudget = timeBudget
+
+  def fill(self, values, count):
+    """Appends at most count values to values and returns False
+    if the source has no more values. Values appended before an
+    exception is raised are yielded before the error."""
+    raise NotImplementedError()
+
+  def runChunked(self, scheduler):
+    if scheduler.isLongRunning:
+      return scheduler.scheduleLongRunning(self.loopChunks)
+    else:
+      self.flag = BooleanDisposable()
+      scheduler.scheduleRecursive(self.loopRecChunks)
+      return self.flag
+
+  def yieldChunk(self):
+    """Returns True if more values may follow."""
+    values = []
+
+    try:
+      hasMore = self.fill(values, self.chunkSize)
+    except Exception as e:
+      self.yieldValues(values)
+      self.observer.onError(e)
+      self.dispose()
+      return False
+
+    self.yieldValues(values)
+
+    if not hasMore:
+      self.exhausted()
+
+    return hasMore
+
+  def exhausted(self):
+    """Called once fill returned False, completes the observer."""
+    self.observer.onCompleted()
+    self.dispose()
+
+  def yieldValues(self, values):
+    if len(values) == 0:
+      return
+
+    observer = self.observer
+    onNextBatch = getattr(observer, 'onNextBatch', None)
+
+    if onNextBatch != None:
+      onNextBatch(self.untilDisposed(observer, values))
+    else:
+      for value in values:
+        self.observer.onNext(value)
+
+  def untilDisposed(self, observer, values):
+    # dispose replaces the observer, the rest of the batch is dropped
+    for value in values:
+      if self.observer is not observer:
+        return
+
+      yield value
+
+  def loopRecChunks(self, recurse):
+    timeBudget = self.timeBudget
+
+    if timeBudget != None:
+      deadline = time.time() + timeBudget
+
+    while not self.flag.isDisposed and self.yieldChunk():
+      if timeBudget == None or time.time() >= deadline:
+        recurse()
+        return
+
+  def loopChunks(self, cancel):
+    while not cancel.isDisposed and self.yieldChunk():
+      pass
+
+    if cancel.isDisposed:
+      self.dispose()
+
+
+class LazyChunkedSink(ChunkedSink):
+  """ChunkedSink for sources that must not be read ahead, like
+  iterators with side effects. Every value is yielded as soon as it was
+  pulled, only scheduling happens once per chunk of chunkSize values."""
+
+  def pull(self):
+    """Returns the next value or raises StopIteration."""
+    raise NotImplementedError()
+
+  def yieldChunk(self):
+    observer = self.observer
+
+    for _ in range(self.chunkSize):
+      # dispose replaces the observer, nothing more is pulled
+      if self.observer is not observer:
+        return False
+
+      try:
+        value = self.pull()
+      except StopIteration:
+        self.exhausted()
+        return False
+      except Exception as e:
+        observer.onError(e)
+        self.dispose()
+        return False
+
+      observer.onNext(value)
+
+    return True
+
+
 class TailRecursiveSink(Sink):
   def __init__(self, observer, cancel):
     super(TailRecursiveSink, self).__init__(observer, cancel)
@@ -184,6 +307,9 @@ class PushToPullSink(Cancelable, Observer):
   def tryMoveNext(self):
     raise NotImplementedError()
 
+  def __iter__(self):
+    return self
+
   def __next__(self):
     if not self.iteratorDone:
       if self.tryMoveNext():
@@ -194,6 +320,8 @@ class PushToPullSink(Cancelable, Observer):
 
     raise StopIteration()
 
+  next = __next__
+
   def dispose(self):
     if not self._isDisposed.exchange(True):
       self.subscription.dispose()
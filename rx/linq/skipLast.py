@@ -1,5 +1,5 @@
-from rx.internal import Struct
 from rx.observable import Producer
+from .takeLast import TimestampedQueue
 import rx.linq.sink
 from collections import deque
 
@@ -36,10 +36,11 @@ class SkipLastCount(Producer):
 
 
 class SkipLastTime(Producer):
-  def __init__(self, source, duration, scheduler):
+  def __init__(self, source, duration, scheduler, sampleEvery=1):
     self.source = source
     self.duration = duration
     self.scheduler = scheduler
+    self.sampleEvery = sampleEvery
 
   def run(self, observer, cancel, setSink):
     sink = self.Sink(self, observer, cancel)
@@ -50,28 +51,26 @@ class SkipLastTime(Producer):
     def __init__(self, parent, observer, cancel):
       super(SkipLastTime.Sink, self).__init__(observer, cancel)
       self.parent = parent
+      self.queue = TimestampedQueue(parent.sampleEvery)
 
     def run(self):
       self.startTime = self.parent.scheduler.now()
 
-      return self.parent.subscribeSafe(self)
+      return self.parent.source.subscribeSafe(self)
 
     def elapsed(self):
       return self.parent.scheduler.now() - self.startTime
 
-    def onNext(self, value):
-      now = self.elapsed()
-
-      self.queue.append(Struct(value=value,timeStamp=now))
+    def yieldExpired(self, now):
+      for value in self.queue.trim(now - self.parent.duration, True):
+        self.observer.onNext(value)
 
-      while len(self.queue) > 0:
-        current = self.queue.popleft()
+    def onNext(self, value):
+      if self.queue.append(value):
+        now = self.elapsed()
 
-        if now - current.timeStamp >= self.parent.duration:
-          self.observer.onNext(current.value)
-        else:
-          self.queue.appendleft(current)
-          break
+        self.queue.stamp(now)
+        self.yieldExpired(now)
 
     def onError(self, exception):
       self.observer.onError(exception)
@@ -80,14 +79,8 @@ class SkipLastTime(Producer):
     def onCompleted(self):
       now = self.elapsed()
 
-      while len(self.queue) > 0:
-        current = self.queue.popleft()
-
-        if now - current.timeStamp >= self.parent.duration:
-          self.observer.onNext(current.value)
-        else:
-          self.queue.appendleft(current)
-          break
+      self.queue.stamp(now)
+      self.yieldExpired(now)
 
       self.observer.onCompleted()
-      self.dispose()
\ No newline at end of file
+      self.dispose()
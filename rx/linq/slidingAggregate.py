@@ -0,0 +1,276 @@
+from rx.disposable import CompositeDisposable
+from rx.observable import Producer
+import rx.linq.sink
+from collections import deque
+from threading import RLock
+
+
+class SumAggregator(object):
+  def __init__(self):
+    self.sum = 0
+
+  def add(self, value):
+    self.sum += value
+
+  def remove(self, value):
+    self.sum -= value
+
+  def result(self):
+    return self.sum
+
+
+class CountAggregator(object):
+  def __init__(self):
+    self.count = 0
+
+  def add(self, value):
+    self.count += 1
+
+  def remove(self, value):
+    self.count -= 1
+
+  def result(self):
+    return self.count
+
+
+class MeanAggregator(object):
+  def __init__(self):
+    self.sum = 0
+    self.count = 0
+
+  def add(self, value):
+    self.sum += value
+    self.count += 1
+
+  def remove(self, value):
+    self.sum -= value
+    self.count -= 1
+
+  def result(self):
+    if self.count == 0:
+      return None
+
+    return self.sum / float(self.count)
+
+
+class VarianceAggregator(object):
+  """Population variance, maintained with Welford's update that
+  is run backwards for values leaving the window."""
+
+  def __init__(self):
+    self.count = 0
+    self.mean = 0.0
+    self.m2 = 0.0
+
+  def add(self, value):
+    self.count += 1
+    delta = value - self.mean
+    self.mean += delta / self.count
+    self.m2 += delta * (value - self.mean)
+
+  def remove(self, value):
+    self.count -= 1
+
+    if self.count == 0:
+      self.mean = 0.0
+      self.m2 = 0.0
+      return
+
+    delta = value - self.mean
+    self.mean -= delta / self.count
+    self.m2 -= delta * (value - self.mean)
+
+  def result(self):
+    if self.count == 0:
+      return None
+
+    return max(self.m2, 0.0) / self.count
+
+
+class MinAggregator(object):
+  """Keeps a monotonic deque of the values that can still become the
+  minimum. Equal values are kept, so removing the oldest value only has
+  to look at the head of the deque."""
+
+  def __init__(self):
+    self.candidates = deque()
+
+  def isDominated(self, candidate, value):
+    return candidate > value
+
+  def add(self, value):
+    candidates = self.candidates
+
+    while len(candidates) > 0 and self.isDominated(candidates[-1], value):
+      candidates.pop()
+
+    candidates.append(value)
+
+  def remove(self, value):
+    if len(self.candidates) > 0 and self.candidates[0] == value:
+      self.candidates.popleft()
+
+  def result(self):
+    if len(self.candidates) == 0:
+      return None
+
+    return self.candidates[0]
+
+
+class MaxAggregator(MinAggregator):
+  def isDominated(self, candidate, value):
+    return candidate < value
+
+
+aggregators = {
+  'sum': SumAggregator,
+  'count': CountAggregator,
+  'mean': MeanAggregator,
+  'variance': VarianceAggregator,
+  'min': MinAggregator,
+  'max': MaxAggregator,
+}
+
+
+class SlidingAggregate(Producer):
+  """Aggregates the values of a sliding window incrementally. Values
+  leave the window in arrival order, so every aggregator only has to
+  support adding the newest and removing the oldest value."""
+
+  def __init__(self, source, aggregatorFactory, count=None, skip=1, timeSpan=None, timeShift=None, scheduler=None):
+    self.source = source
+    self.aggregatorFactory = aggregatorFactory
+    self.count = count
+    self.skip = skip
+    self.timeSpan = timeSpan
+    self.timeShift = timeShift
+    self.scheduler = scheduler
+
+  def run(self, observer, cancel, setSink):
+    if self.timeSpan == None:
+      sink = self.CountSink(self, observer, cancel)
+      setSink(sink)
+      return self.source.subscribeSafe(sink)
+    else:
+      sink = self.TimeSink(self, observer, cancel)
+      setSink(sink)
+      return sink.run()
+
+
+  class CountSink(rx.linq.sink.Sink):
+    def __init__(self, parent, observer, cancel):
+      super(SlidingAggregate.CountSink, self).__init__(observer, cancel)
+      self.parent = parent
+      self.aggregator = parent.aggregatorFactory()
+      self.window = deque()
+      self.n = 0
+
+    def onNext(self, value):
+      window = self.window
+
+      try:
+        window.append(value)
+        self.aggregator.add(value)
+
+        if len(window) > self.parent.count:
+          self.aggregator.remove(window.popleft())
+
+        self.n += 1
+
+        if self.n < self.parent.skip:
+          return
+
+        self.n = 0
+        result = self.aggregator.result()
+      except Exception as e:
+        self.observer.onError(e)
+        self.dispose()
+      else:
+        self.observer.onNext(result)
+
+    def onError(self, exception):
+      self.observer.onError(exception)
+      self.dispose()
+
+    def onCompleted(self):
+      self.observer.onCompleted()
+      self.dispose()
+
+
+  class TimeSink(rx.linq.sink.Sink):
+    def __init__(self, parent, observer, cancel):
+      super(SlidingAggregate.TimeSink, self).__init__(observer, cancel)
+      self.parent = parent
+      self.aggregator = parent.aggregatorFactory()
+      self.times = deque()
+      self.values = deque()
+      self.gate = RLock()
+
+    def run(self):
+      subscription = self.parent.source.subscribeSafe(self)
+
+      if self.parent.timeShift == None:
+        return subscription
+
+      timer = self.parent.scheduler.scheduleRecursiveWithRelative(
+        self.parent.timeShift,
+        self.tickRec
+      )
+
+      return CompositeDisposable(subscription, timer)
+
+    def tickRec(self, continuation):
+      self.tick()
+      continuation(self.parent.timeShift)
+
+    def trim(self, now):
+      deadline = now - self.parent.timeSpan
+      times = self.times
+
+      while len(times) > 0 and times[0] <= deadline:
+        times.popleft()
+        self.aggregator.remove(self.values.popleft())
+
+    def tick(self):
+      with self.gate:
+        try:
+          self.trim(self.parent.scheduler.now())
+
+          if len(self.values) == 0:
+            return
+
+          result = self.aggregator.result()
+        except Exception as e:
+          self.observer.onError(e)
+          self.dispose()
+        else:
+          self.observer.onNext(result)
+
+    def onNext(self, value):
+      with self.gate:
+        try:
+          now = self.parent.scheduler.now()
+          self.times.append(now)
+          self.values.append(value)
+          self.aggregator.add(value)
+          self.trim(now)
+
+          if self.parent.timeShift != None:
+            return
+
+          result = self.aggregator.result()
+        except Exception as e:
+          self.observer.onError(e)
+          self.dispose()
+        else:
+          self.observer.onNext(result)
+
+    def onError(self, exception):
+      with self.gate:
+        self.observer.onError(exception)
+        self.dispose()
+
+    def onCompleted(self):
+      with self.gate:
+        self.observer.onCompleted()
+        self.dispose()
@@ -1,12 +1,15 @@
 from .defaultIfEmpty import DefaultIfEmpty
-from .distinct import Distinct
+from .distinct import Distinct, BloomKeySet, ExactKeySet, LruKeySet, WindowKeySet
 from .groupBy import GroupBy
 from .groupByUntil import GroupByUntil
 from .groupJoin import GroupJoin
+from .groupJoinWithKey import GroupJoinWithKey
 from .join import Join
+from .joinWithKey import JoinWithKey
 from .ofType import OfType
 from .select import Select
 from .selectMany import SelectMany
+from .selectManyOrdered import SelectManyOrdered
 from .skip import SkipCount, SkipTime
 from .skipWhile import SkipWhile
 from .take import TakeCount, TakeTime
@@ -28,19 +31,36 @@ def defaultIfEmpty(self, default=None):
   return DefaultIfEmpty(self, default)
 Observable.defaultIfEmpty = defaultIfEmpty
 
-def distinct(self, keySelector=identity):
+def distinct(self, keySelector=identity, mode='exact', capacity=None, window=None, errorRate=0.001, scheduler=Scheduler.timeBasedOperation):
   assert isinstance(self, Observable)
   assert callable(keySelector)
 
-  return Distinct(self, keySelector)
+  if mode == 'exact':
+    keySetFactory = ExactKeySet
+  elif mode == 'lru':
+    assert capacity > 0
+    keySetFactory = lambda: LruKeySet(capacity)
+  elif mode == 'window':
+    assert window > 0
+    assert isinstance(scheduler, Scheduler)
+    keySetFactory = lambda: WindowKeySet(window, scheduler)
+  elif mode == 'bloom':
+    assert 0 < errorRate < 1
+    keySetFactory = lambda: BloomKeySet(errorRate, capacity or 1024)
+  else:
+    raise ValueError("Unknown distinct mode: %s" % mode)
+
+  return Distinct(self, keySelector, keySetFactory)
 Observable.distinct = distinct
 
-def groupBy(self, keySelector=identity, elementSelector=identity):
+def groupBy(self, keySelector=identity, elementSelector=identity, maxGroups=None, idleTimeout=None, scheduler=Scheduler.timeBasedOperation):
   assert isinstance(self, Observable)
   assert callable(keySelector)
   assert callable(elementSelector)
+  assert maxGroups == None or maxGroups > 0
+  assert isinstance(scheduler, Scheduler)
 
-  return GroupBy(self, keySelector, elementSelector)
+  return GroupBy(self, keySelector, elementSelector, maxGroups, idleTimeout, scheduler)
 Observable.groupBy = groupBy
 
 def groupByUntil(self, keySelector, elementSelector, durationSelector):
@@ -62,6 +82,17 @@ def groupJoin(left, right, leftDurationSelector, rightDurationSelector, resultSe
   return GroupJoin(left, right, leftDurationSelector, rightDurationSelector, resultSelector)
 Observable.groupJoin = groupJoin
 
+def groupJoinWithKey(left, right, leftKeySelector, rightKeySelector, leftWindow, rightWindow, resultSelector, scheduler=Scheduler.timeBasedOperation):
+  assert isinstance(left, Observable)
+  assert isinstance(right, Observable)
+  assert callable(leftKeySelector)
+  assert callable(rightKeySelector)
+  assert callable(resultSelector)
+  assert isinstance(scheduler, Scheduler)
+
+  return GroupJoinWithKey(left, right, leftKeySelector, rightKeySelector, leftWindow, rightWindow, resultSelector, scheduler)
+Observable.groupJoinWithKey = groupJoinWithKey
+
 def join(left, right, leftDurationSelector, rightDurationSelector, resultSelector):
   assert isinstance(left, Observable)
   assert isinstance(right, Observable)
@@ -72,6 +103,17 @@ def join(left, right, leftDurationSelector, rightDurationSelector, resultSelecto
   return Join(left, right, leftDurationSelector, rightDurationSelector, resultSelector)
 Observable.join = join
 
+def joinWithKey(left, right, leftKeySelector, rightKeySelector, leftWindow, rightWindow, resultSelector, scheduler=Scheduler.timeBasedOperation):
+  assert isinstance(left, Observable)
+  assert isinstance(right, Observable)
+  assert callable(leftKeySelector)
+  assert callable(rightKeySelector)
+  assert callable(resultSelector)
+  assert isinstance(scheduler, Scheduler)
+
+  return JoinWithKey(left, right, leftKeySelector, rightKeySelector, leftWindow, rightWindow, resultSelector, scheduler)
+Observable.joinWithKey = joinWithKey
+
 def ofType(self, tpe):
   assert isinstance(self, Observable)
 
@@ -137,6 +179,19 @@ def selectManyEnumerate(self, onNext, onError=None, onCompleted=None):
   return SelectMany(self, on, oe, oc, True)
 Observable.selectManyEnumerate = selectManyEnumerate
 
+def selectManyOrdered(self, selector, maxConcurrency=0, prefetch=None, overflow='error'):
+  assert isinstance(self, Observable)
+  assert prefetch == None or prefetch > 0
+  assert overflow in ('block', 'error')
+
+  if not callable(selector):
+    assert isinstance(selector, Observable)
+    inner = selector
+    selector = lambda _: inner
+
+  return SelectManyOrdered(self, selector, maxConcurrency, prefetch, overflow)
+Observable.selectManyOrdered = selectManyOrdered
+
 def skip(self, count):
   assert isinstance(self, Observable)
 
@@ -1,7 +1,7 @@
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
-from rx.internal import Struct
 from rx.observable import Producer
 import rx.linq.sink
+from bisect import bisect_right
 from collections import deque
 
 
@@ -68,11 +68,87 @@ class TakeLastCount(Producer):
       self.dispose()
 
 
+class TimestampedQueue(object):
+  """Values and their timestamps in parallel lists. Values stamped with
+  the same time share one timestamp, expired values are dropped by
+  bisecting the timestamps and the lists are compacted once at least
+  half of them is dropped.
+
+  The clock only has to be read every sampleEvery values, the values in
+  between are stamped with the next reading."""
+
+  def __init__(self, sampleEvery=1):
+    self.sampleEvery = sampleEvery
+    self.values = []
+    self.head = 0
+    # the timestamp of each run of values and the index after its last
+    # value, the indices are offset by base
+    self.times = []
+    self.ends = []
+    self.timeHead = 0
+    self.base = 0
+    self.unstamped = 0
+
+  def __len__(self):
+    return len(self.values) - self.head
+
+  def append(self, value):
+    """Returns True if the clock should be read and passed to stamp."""
+    self.values.append(value)
+    self.unstamped += 1
+
+    return self.unstamped >= self.sampleEvery
+
+  def stamp(self, now):
+    if self.unstamped == 0:
+      return
+
+    self.unstamped = 0
+    end = self.base + len(self.values)
+
+    if len(self.times) > self.timeHead and self.times[-1] == now:
+      self.ends[-1] = end
+    else:
+      self.times.append(now)
+      self.ends.append(end)
+
+  def trim(self, cutoff, collect=False):
+    """Drops the values stamped at or before cutoff and returns them
+    as list if collect is True."""
+    i = bisect_right(self.times, cutoff, self.timeHead)
+
+    if i == self.timeHead:
+      return [] if collect else None
+
+    start = self.head
+    end = self.ends[i - 1] - self.base
+    self.timeHead = i
+    self.head = end
+
+    res = self.values[start:end] if collect else None
+
+    if self.head * 2 >= len(self.values):
+      del self.values[:self.head]
+      self.base += self.head
+      self.head = 0
+
+    if self.timeHead * 2 >= len(self.times):
+      del self.times[:self.timeHead]
+      del self.ends[:self.timeHead]
+      self.timeHead = 0
+
+    return res
+
+  def tolist(self):
+    return self.values[self.head:]
+
+
 class TakeLastTime(Producer):
-  def __init__(self, source, duration, scheduler):
+  def __init__(self, source, duration, scheduler, sampleEvery=1):
     self.source = source
     self.duration = duration
     self.scheduler = scheduler
+    self.sampleEvery = sampleEvery
 
   def run(self, observer, cancel, setSink):
     sink = self.Sink(self, observer, cancel)
@@ -83,32 +159,26 @@ class TakeLastTime(Producer):
     def __init__(self, parent, observer, cancel):
       super(TakeLastTime.Sink, self).__init__(observer, cancel)
       self.parent = parent
+      self.queue = TimestampedQueue(parent.sampleEvery)
 
     def run(self):
       self.subscription = SingleAssignmentDisposable()
-      self.loop = SingleAssignmentDisposable()
+      self.loopDisposable = SingleAssignmentDisposable()
 
       self.startTime = self.parent.scheduler.now()
       self.subscription.disposable = self.parent.source.subscribeSafe(self)
 
-      return CompositeDisposable(self.subscription, self.loop)
+      return CompositeDisposable(self.subscription, self.loopDisposable)
 
     def elapsed(self):
       return self.parent.scheduler.now() - self.startTime
 
-    def trim(self, now):
-      while len(self.queue) > 0:
-        current = self.queue.popleft()
-
-        if current.interval < self.parent.duration:
-          self.queue.appendleft(current)
-          break
-
     def onNext(self, value):
-      now = self.elapsed()
+      if self.queue.append(value):
+        now = self.elapsed()
 
-      self.queue.append(Struct(value=value,interval=now))
-      self.trim(now)
+        self.queue.stamp(now)
+        self.queue.trim(now - self.parent.duration)
 
     def onError(self, exception):
       self.observer.onError(exception)
@@ -118,17 +188,21 @@ class TakeLastTime(Producer):
       self.subscription.dispose()
 
       now = self.elapsed()
-      self.trim(now)
+      self.queue.stamp(now)
+      self.queue.trim(now - self.parent.duration)
+
+      self.remaining = deque(self.queue.tolist())
+      self.queue = None
 
       scheduler = self.parent.scheduler
       if scheduler.isLongRunning:
-        self.loop.disposable = scheduler.scheduleLongRunning(self.loop)
+        self.loopDisposable.disposable = scheduler.scheduleLongRunning(self.loop)
       else:
-        self.loop.disposable = scheduler.scheduleRecursive(self.loopRec)
+        self.loopDisposable.disposable = scheduler.scheduleRecursive(self.loopRec)
 
     def loopRec(self, recurse):
-      if len(self.queue) > 0:
-        self.observer.onNext(self.queue.popleft().value)
+      if len(self.remaining) > 0:
+        self.observer.onNext(self.remaining.popleft())
         recurse()
       else:
         self.observer.onCompleted()
@@ -136,10 +210,10 @@ class TakeLastTime(Producer):
 
     def loop(self, cancel):
       while not cancel.isDisposed:
-        if len(self.queue) == 0:
+        if len(self.remaining) == 0:
           self.observer.onCompleted()
           break
         else:
-          self.observer.onNext(self.queue.popleft().value)
+          self.observer.onNext(self.remaining.popleft())
 
-      self.dispose()
\ No newline at end of file
+      self.dispose()
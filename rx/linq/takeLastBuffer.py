@@ -1,6 +1,6 @@
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
-from rx.internal import Struct
 from rx.observable import Producer
+from .takeLast import TimestampedQueue
 import rx.linq.sink
 from collections import deque
 
@@ -48,10 +48,11 @@ class TakeLastBufferCount(Producer):
 
 
 class TakeLastBufferTime(Producer):
-  def __init__(self, source, duration, scheduler):
+  def __init__(self, source, duration, scheduler, sampleEvery=1):
     self.source = source
     self.duration = duration
     self.scheduler = scheduler
+    self.sampleEvery = sampleEvery
 
   def run(self, observer, cancel, setSink):
     sink = self.Sink(self, observer, cancel)
@@ -62,45 +63,33 @@ class TakeLastBufferTime(Producer):
     def __init__(self, parent, observer, cancel):
       super(TakeLastBufferTime.Sink, self).__init__(observer, cancel)
       self.parent = parent
+      self.queue = TimestampedQueue(parent.sampleEvery)
 
     def run(self):
-      self.subscription = SingleAssignmentDisposable()
-      self.loop = SingleAssignmentDisposable()
-
       self.startTime = self.parent.scheduler.now()
-      self.subscription.disposable = self.parent.source.subscribeSafe(self)
 
-      return CompositeDisposable(self.subscription, self.loop)
+      return self.parent.source.subscribeSafe(self)
 
     def elapsed(self):
       return self.parent.scheduler.now() - self.startTime
 
-    def trim(self, now):
-      while len(self.queue) > 0:
-        current = self.queue.popleft()
-
-        if current.interval < self.parent.duration:
-          self.queue.appendleft(current)
-          break
-
     def onNext(self, value):
-      now = self.elapsed()
+      if self.queue.append(value):
+        now = self.elapsed()
 
-      self.queue.append(Struct(value=value,interval=now))
-      self.trim(now)
+        self.queue.stamp(now)
+        self.queue.trim(now - self.parent.duration)
 
     def onError(self, exception):
       self.observer.onError(exception)
       self.dispose()
 
     def onCompleted(self):
-      self.subscription.dispose()
-
       now = self.elapsed()
-      self.trim(now)
 
-      res = list([x.value for x in self.queue])
+      self.queue.stamp(now)
+      self.queue.trim(now - self.parent.duration)
 
-      self.observer.onNext(res)
+      self.observer.onNext(self.queue.tolist())
       self.observer.onCompleted()
-      self.dispose()
\ No newline at end of file
+      self.dispose()
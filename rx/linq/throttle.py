@@ -1,15 +1,19 @@
 from rx.disposable import CompositeDisposable, Disposable, SerialDisposable, SingleAssignmentDisposable
 from rx.observable import Producer
 from rx.observer import Observer
+from rx.scheduler import Scheduler
 import rx.linq.sink
 from threading import RLock
 
 
 class ThrottleTime(Producer):
-  def __init__(self, source, dueTime, scheduler):
+  def __init__(self, source, dueTime, scheduler, leading=False, trailing=True, maxWait=None):
     self.source = source
     self.dueTime = dueTime
     self.scheduler = scheduler
+    self.leading = leading
+    self.trailing = trailing
+    self.maxWait = maxWait
 
   def run(self, observer, cancel, setSink):
     sink = self.Sink(self, observer, cancel)
@@ -17,6 +21,11 @@ class ThrottleTime(Producer):
     return sink.run()
 
   class Sink(rx.linq.sink.Sink):
+    """A value only moves the deadline forward. The timer is armed
+    once per burst of values, and when it fires before the deadline it
+    is armed again for the remaining time, so a burst costs a few timers
+    instead of one per value."""
+
     def __init__(self, parent, observer, cancel):
       super(ThrottleTime.Sink, self).__init__(observer, cancel)
       self.parent = parent
@@ -26,34 +35,76 @@ class ThrottleTime(Producer):
       self.value = None
       self.hasValue = False
       self.propagatorDisposable = SerialDisposable()
-      self.resourceId = 0
+      self.isArmed = False # while a burst of values is throttled
+      self.deadline = 0 # dueTime after the latest value
+      self.burstStart = None # first value since the last yield, for maxWait
 
       subscription = self.parent.source.subscribeSafe(self)
 
       return CompositeDisposable(subscription, self.propagatorDisposable)
 
-    def onNext(self, value):
-      currentId = 0
-
-      with self.gate:
-        self.hasValue = True
-        self.value = value
-        self.resourceId += 1
-        currentId = self.resourceId
+    def dueAt(self):
+      if self.parent.maxWait == None or self.burstStart == None:
+        return self.deadline
+      else:
+        return min(self.deadline, self.burstStart + self.parent.maxWait)
 
-      d = SingleAssignmentDisposable()
-      self.propagatorDisposable.disposable = d
-      d.disposable = self.parent.scheduler.scheduleWithRelativeAndState(
-        currentId,
-        self.parent.dueTime,
+    def arm(self, now):
+      self.propagatorDisposable.disposable = self.parent.scheduler.scheduleWithRelative(
+        Scheduler.normalize(self.dueAt() - now),
         self.propagate
       )
 
-    def propagate(self, scheduler, currentId):
+    def onNext(self, value):
       with self.gate:
-        if self.hasValue and self.resourceId == currentId:
-          self.observer.onNext(self.value)
-        self.hasValue = False
+        now = self.parent.scheduler.now()
+        self.deadline = now + self.parent.dueTime
+
+        if self.burstStart == None:
+          self.burstStart = now
+
+        if self.isArmed:
+          self.value = value
+          self.hasValue = True
+          return
+
+        self.isArmed = True
+
+        if self.parent.leading:
+          self.observer.onNext(value)
+          self.burstStart = None
+        else:
+          self.value = value
+          self.hasValue = True
+
+        self.arm(now)
+
+    def propagate(self):
+      with self.gate:
+        if not self.isArmed:
+          return Disposable.empty()
+
+        now = self.parent.scheduler.now()
+
+        if now < self.dueAt():
+          # the deadline moved while the timer was running
+          self.arm(now)
+          return Disposable.empty()
+
+        if self.hasValue:
+          self.hasValue = False
+
+          if self.parent.trailing:
+            self.observer.onNext(self.value)
+
+        self.value = None
+        self.burstStart = None
+
+        if now < self.deadline:
+          # maxWait elapsed but the burst goes on
+          self.arm(now)
+        else:
+          self.isArmed = False
 
       return Disposable.empty()
 
@@ -65,20 +116,20 @@ class ThrottleTime(Producer):
         self.dispose()
 
         self.hasValue = False
-        self.resourceId += 1
+        self.isArmed = False
 
     def onCompleted(self):
       self.propagatorDisposable.dispose()
 
       with self.gate:
-        if self.hasValue:
+        if self.hasValue and self.parent.trailing:
           self.observer.onNext(self.value)
 
         self.observer.onCompleted()
         self.dispose()
 
         self.hasValue = False
-        self.resourceId += 1
+        self.isArmed = False
 
 
 class ThrottleObservable(Producer):
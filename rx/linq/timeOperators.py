@@ -2,6 +2,7 @@ from .buffer import Buffer
 from .delay import DelayObservable, DelaySubscription, DelayTime
 from .generate import Generate
 from .sample import SampleWithObservable, SampleWithTime
+from .slidingAggregate import SlidingAggregate, aggregators
 from .throttle import ThrottleObservable, ThrottleTime
 from .timeInterval import TimeInterval
 from .timeout import TimeoutAbsolute, TimeoutRelative, TimeoutObservable
@@ -27,27 +28,31 @@ def bufferWithTime(self, timeSpan, timeShift=None, scheduler=Scheduler.timeBased
   return Buffer(self, timeSpan=timeSpan, timeShift=timeShift, scheduler=scheduler)
 Observable.bufferWithTime = bufferWithTime
 
-def bufferWithTimeAndCount(self, timeSpan, count, scheduler=Scheduler.timeBasedOperation):
+def bufferWithTimeAndCount(self, timeSpan, count, scheduler=Scheduler.timeBasedOperation, into='list', typecode=None):
   assert isinstance(self, Observable)
   assert isinstance(scheduler, Scheduler)
+  assert into in ('list', 'array', 'ndarray', 'columns')
+  assert typecode != None or into in ('list', 'columns')
 
   if count == None:
     count = timeSpan
-  return Buffer(self, timeSpan=timeSpan, count=count, scheduler=scheduler)
+  return Buffer(self, timeSpan=timeSpan, count=count, scheduler=scheduler, typecode=typecode, into=into)
 Observable.bufferWithTimeAndCount = bufferWithTimeAndCount
 
-def delayRelative(self, dueTime, scheduler=Scheduler.timeBasedOperation):
+def delayRelative(self, dueTime, scheduler=Scheduler.timeBasedOperation, maxQueued=None):
   assert isinstance(self, Observable)
   assert isinstance(scheduler, Scheduler)
+  assert maxQueued == None or maxQueued > 0
 
-  return DelayTime(self, dueTime, False, scheduler)
+  return DelayTime(self, dueTime, False, scheduler, maxQueued)
 Observable.delayRelative = delayRelative
 
-def delayAbsolute(self, dueTime, scheduler=Scheduler.timeBasedOperation):
+def delayAbsolute(self, dueTime, scheduler=Scheduler.timeBasedOperation, maxQueued=None):
   assert isinstance(self, Observable)
   assert isinstance(scheduler, Scheduler)
+  assert maxQueued == None or maxQueued > 0
 
-  return DelayTime(self, dueTime, True, scheduler)
+  return DelayTime(self, dueTime, True, scheduler, maxQueued)
 Observable.delayAbsolute = delayAbsolute
 
 def delayIndividual(self, delayDurationSelector, subscriptionDelayObservable=None):
@@ -114,11 +119,30 @@ def sampleWithObservable(self, sampler):
   return SampleWithObservable(self, sampler)
 Observable.sampleWithObservable = sampleWithObservable
 
-def throttle(self, dueTime, scheduler=Scheduler.timeBasedOperation):
+def slidingAggregate(self, aggregator, count=None, skip=1, timeSpan=None, timeShift=None, scheduler=Scheduler.timeBasedOperation):
   assert isinstance(self, Observable)
   assert isinstance(scheduler, Scheduler)
+  assert (count == None) != (timeSpan == None)
 
-  return ThrottleTime(self, dueTime, scheduler)
+  if aggregator in aggregators:
+    aggregator = aggregators[aggregator]
+
+  assert callable(aggregator)
+
+  if count != None:
+    assert count > 0
+    assert skip > 0
+
+  return SlidingAggregate(self, aggregator, count, skip, timeSpan, timeShift, scheduler)
+Observable.slidingAggregate = slidingAggregate
+
+def throttle(self, dueTime, scheduler=Scheduler.timeBasedOperation, leading=False, trailing=True, maxWait=None):
+  assert isinstance(self, Observable)
+  assert isinstance(scheduler, Scheduler)
+  assert leading or trailing
+  assert maxWait == None or maxWait > 0
+
+  return ThrottleTime(self, dueTime, scheduler, leading, trailing, maxWait)
 Observable.throttle = throttle
 
 def throttleIndividual(self, durationSelector):
@@ -159,18 +183,18 @@ def timeoutAbsolute(self, dueTime, other=None, scheduler=Scheduler.timeBasedOper
   return TimeoutAbsolute(self, dueTime, other, scheduler)
 Observable.timeoutAbsolute = timeoutAbsolute
 
-def timeoutIndividual(self, durationSelector, firstTimeout=None, other=None):
+def timeoutIndividual(self, durationSelector, firstTimeout=None, other=None, scheduler=Scheduler.timeBasedOperation):
   assert isinstance(self, Observable)
+  assert isinstance(scheduler, Scheduler)
 
   if firstTimeout == None:
     firstTimeout = Observable.never()
   if other == None:
     other = Observable.throw(TimeoutException())
 
-  assert isinstance(firstTimeout, Observable)
   assert isinstance(other, Observable)
 
-  return TimeoutObservable(self, firstTimeout, durationSelector, other)
+  return TimeoutObservable(self, firstTimeout, durationSelector, other, scheduler)
 Observable.timeoutIndividual = timeoutIndividual
 
 def timerRelative(dueTime, period=None, scheduler=Scheduler.timeBasedOperation):
@@ -1,8 +1,175 @@
 from rx.disposable import CompositeDisposable, Disposable, SerialDisposable, SingleAssignmentDisposable
-from rx.observable import Producer
+from rx.observable import Observable, Producer
 from rx.observer import Observer
+from rx.scheduler import Scheduler
 import rx.linq.sink
+from heapq import heapify, heappop, heappush
 from threading import RLock
+import itertools
+import weakref
+
+
+class Deadline(Disposable):
+  def __init__(self, index, due, action):
+    super(Deadline, self).__init__()
+    self.index = index
+    self.due = due
+    self.action = action
+    self.heapId = None # id of the live heap entry
+    self.heapDue = None
+    self.isDisposed = False
+
+  def reset(self, due):
+    self.index.reset(self, due)
+
+  def dispose(self):
+    self.index.remove(self)
+
+
+class DeadlineIndex(object):
+  """Shares one heap of deadlines and one timer between all timeouts
+  on a scheduler. Moving a deadline to a later time only updates the
+  deadline, an entry that comes up early is pushed again with its
+  current due time, so the heap sees one operation per expiry instead
+  of one per reset.
+
+  Entries of disposed or moved deadlines are stale, they are popped
+  once they reach the top of the heap and the heap is rebuilt without
+  them when they are the majority."""
+
+  indices = weakref.WeakKeyDictionary()
+  indicesLock = RLock()
+
+  @classmethod
+  def forScheduler(cls, scheduler):
+    with cls.indicesLock:
+      index = cls.indices.get(scheduler)
+
+      if index == None:
+        index = cls(scheduler)
+        cls.indices[scheduler] = index
+
+      return index
+
+  def __init__(self, scheduler):
+    self.scheduler = scheduler
+    self.heap = []
+    self.ids = itertools.count()
+    self.lock = RLock()
+    self.timer = SerialDisposable()
+    self.armedDue = None
+    self.staleCount = 0
+
+  def __len__(self):
+    return len(self.heap)
+
+  def add(self, due, action):
+    deadline = Deadline(self, due, action)
+    self.reset(deadline, due)
+    return deadline
+
+  def reset(self, deadline, due):
+    with self.lock:
+      if deadline.isDisposed:
+        return
+
+      deadline.due = due
+
+      if deadline.heapId != None and deadline.heapDue <= due:
+        return
+
+      self.push(deadline)
+
+      if self.armedDue == None or due < self.armedDue:
+        self.arm(self.scheduler.now())
+
+  def remove(self, deadline):
+    with self.lock:
+      if deadline.isDisposed:
+        return
+
+      deadline.isDisposed = True
+
+      if deadline.heapId == None:
+        return
+
+      deadline.heapId = None
+      self.staleCount += 1
+
+      if self.staleCount * 2 > len(self.heap):
+        self.compact()
+
+      self.popStale()
+
+      if len(self.heap) == 0 and self.armedDue != None:
+        self.arm(self.scheduler.now())
+
+  def isStale(self, entry):
+    return entry[2].heapId != entry[1]
+
+  def popStale(self):
+    heap = self.heap
+
+    while len(heap) > 0 and self.isStale(heap[0]):
+      heappop(heap)
+      self.staleCount -= 1
+
+  def compact(self):
+    self.heap = [entry for entry in self.heap if not self.isStale(entry)]
+    heapify(self.heap)
+    self.staleCount = 0
+
+  def push(self, deadline):
+    if deadline.heapId != None:
+      # the entry with the later due time stays in the heap
+      self.staleCount += 1
+
+    deadline.heapId = next(self.ids)
+    deadline.heapDue = deadline.due
+    heappush(self.heap, (deadline.due, deadline.heapId, deadline))
+
+  def arm(self, now):
+    self.popStale()
+
+    if len(self.heap) == 0:
+      self.armedDue = None
+      self.timer.disposable = Disposable.empty()
+      return
+
+    self.armedDue = self.heap[0][0]
+    self.timer.disposable = self.scheduler.scheduleWithRelative(
+      Scheduler.normalize(self.armedDue - now),
+      self.tick
+    )
+
+  def tick(self):
+    expired = []
+
+    with self.lock:
+      now = self.scheduler.now()
+      heap = self.heap
+
+      while len(heap) > 0 and heap[0][0] <= now:
+        entry = heappop(heap)
+        deadline = entry[2]
+
+        if self.isStale(entry):
+          self.staleCount -= 1
+          continue
+
+        deadline.heapId = None
+
+        if deadline.due > now:
+          self.push(deadline)
+        else:
+          expired.append(deadline)
+
+      self.arm(now)
+
+    for deadline in expired:
+      deadline.action()
+
+    return Disposable.empty()
 
 
 class TimeoutAbsolute(Producer):
@@ -31,7 +198,8 @@ class TimeoutAbsolute(Producer):
       self.gate = RLock()
       self.switched = False
 
-      timer = self.parent.scheduler.scheduleWithAbsolute(self.parent.dueTime, self.timeout)
+      index = DeadlineIndex.forScheduler(self.parent.scheduler)
+      timer = index.add(self.parent.dueTime, self.timeout)
 
       original.disposable = self.parent.source.subscribeSafe(self)
 
@@ -94,61 +262,61 @@ class TimeoutRelative(Producer):
 
     def run(self):
       self.subscription = SerialDisposable()
-      self.timer = SerialDisposable()
       original = SingleAssignmentDisposable()
 
       self.subscription.disposable = original
 
       self.gate = RLock()
-      self.currentId = 0
       self.switched = False
 
-      self.createTimer()
+      scheduler = self.parent.scheduler
+      self.deadline = DeadlineIndex.forScheduler(scheduler).add(
+        scheduler.now() + self.parent.dueTime,
+        self.timeout
+      )
 
       original.disposable = self.parent.source.subscribeSafe(self)
 
-      return CompositeDisposable(self.subscription, self.timer)
+      return CompositeDisposable(self.subscription, self.deadline)
 
-    def createTimer(self):
-      self.timer = self.parent.scheduler.scheduleWithRelativeAndState(
-        self.currentId,
-        self.parent.dueTime,
-        self.timeout
-      )
-
-    def timeout(self, scheduler, currentId):
+    def timeout(self):
       timerWins = False
 
       with self.gate:
-        self.switched = self.currentId == currentId
-        timerWins = self.switched
+        if self.switched:
+          return
+
+        if self.deadline.due > self.parent.scheduler.now():
+          # a value moved the deadline after the index expired it
+          self.deadline.reset(self.deadline.due)
+          return
+
+        self.switched = True
+        timerWins = True
 
       if timerWins:
         self.subscription.disposable = self.parent.other.subscribeSafe(self.getForewarder())
 
-      return Disposable.empty()
-
     def onNext(self, value):
       onNextWins = False
 
       with self.gate:
         onNextWins = not self.switched
         if onNextWins:
-          self.currentId += 1
+          self.deadline.reset(self.parent.scheduler.now() + self.parent.dueTime)
 
       if onNextWins:
         self.observer.onNext(value)
-        self.createTimer()
 
     def onError(self, exception):
       onErrorWins = False
 
       with self.gate:
         onErrorWins = not self.switched
-        if onErrorWins:
-          self.currentId += 1
+        self.switched = True
 
       if onErrorWins:
+        self.deadline.dispose()
         self.observer.onError(exception)
         self.dispose()
 
@@ -157,20 +325,21 @@ class TimeoutRelative(Producer):
 
       with self.gate:
         onCompletedWins = not self.switched
-        if onCompletedWins:
-          self.currentId += 1
+        self.switched = True
 
       if onCompletedWins:
+        self.deadline.dispose()
         self.observer.onCompleted()
         self.dispose()
 
 
 class TimeoutObservable(Producer):
-  def __init__(self, source, firstTimeout, timeoutSelector, other):
+  def __init__(self, source, firstTimeout, timeoutSelector, other, scheduler=None):
     self.source = source
     self.firstTimeout = firstTimeout
     self.timeoutSelector = timeoutSelector
     self.other = other
+    self.scheduler = scheduler
 
   def run(self, observer, cancel, setSink):
     sink = self.Sink(self, observer, cancel)
@@ -192,6 +361,8 @@ class TimeoutObservable(Producer):
       self.gate = RLock()
       self.currentId = 0
       self.switched = False
+      self.deadline = None
+      self.deadlineId = None
 
       self.setTimer(self.parent.firstTimeout)
 
@@ -233,10 +404,39 @@ class TimeoutObservable(Producer):
 
     def setTimer(self, timeout):
       myId = self.currentId
+
+      if not isinstance(timeout, Observable):
+        # a relative time, the timer is a deadline in the shared index
+        now = self.parent.scheduler.now()
+
+        with self.gate:
+          self.deadlineId = myId
+
+          # an Observable timeout disposed the previous deadline
+          if self.deadline == None or self.deadline.isDisposed:
+            self.deadline = DeadlineIndex.forScheduler(self.parent.scheduler).add(now + timeout, self.timeout)
+            self.timer.disposable = self.deadline
+          else:
+            self.deadline.reset(now + timeout)
+
+        return
+
       d = SingleAssignmentDisposable()
       self.timer.disposable = d
       d.disposable = timeout.subscribeSafe(self.Tau(self, myId, d))
 
+    def timeout(self):
+      with self.gate:
+        if self.deadline.due > self.parent.scheduler.now():
+          self.deadline.reset(self.deadline.due)
+          return
+
+        self.switched = self.currentId == self.deadlineId
+        timerWins = self.switched
+
+      if timerWins:
+        self.subscription.disposable = self.parent.other.subscribeSafe(self.getForewarder())
+
     class Tau(Observer):
       def __init__(self, parent, currentId, cancelSelf):
         self.parent = parent
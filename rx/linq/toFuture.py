@@ -0,0 +1,45 @@
+from rx.disposable import SingleAssignmentDisposable
+from rx.exceptions import InvalidOperationException
+from rx.observer import Observer
+
+
+class ToFuture(Observer):
+  """Resolves a future of loop with the last value of the sequence.
+  The future is resolved with a single call_soon_threadsafe once the
+  sequence ended, cancelling it disposes the subscription."""
+
+  def __init__(self, loop):
+    self.loop = loop
+    self.future = loop.create_future()
+    self.subscription = SingleAssignmentDisposable()
+    self.value = None
+    self.hasValue = False
+
+  def run(self, source):
+    self.future.add_done_callback(self.futureDone)
+    self.subscription.disposable = source.subscribe(self)
+    return self.future
+
+  def onNext(self, value):
+    self.value = value
+    self.hasValue = True
+
+  def onError(self, exception):
+    self.loop.call_soon_threadsafe(self.resolve, exception)
+
+  def onCompleted(self):
+    self.loop.call_soon_threadsafe(self.resolve, None)
+
+  def resolve(self, exception):
+    if self.future.done():
+      return
+
+    if exception != None:
+      self.future.set_exception(exception)
+    elif not self.hasValue:
+      self.future.set_exception(InvalidOperationException("No elements in observable"))
+    else:
+      self.future.set_result(self.value)
+
+  def futureDone(self, future):
+    self.subscription.dispose()
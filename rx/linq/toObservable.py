@@ -1,95 +1,131 @@
-from rx.disposable import BooleanDisposable, Disposable
-from rx.internal import Struct
+from rx.disposable import CompositeDisposable, Disposable
 from rx.observable import Producer
 import rx.linq.sink
+from collections import deque
+from threading import Condition, RLock, Thread
 
 
 class ToObservable(Producer):
-  def __init__(self, source, scheduler):
+  def __init__(self, source, scheduler, chunkSize, timeBudget):
     self.source = source
     self.scheduler = scheduler
+    self.chunkSize = chunkSize
+    self.timeBudget = timeBudget
 
   def run(self, observer, cancel, setSink):
     sink = self.Sink(self, observer, cancel)
     setSink(sink)
     return sink.run()
 
-  class Sink(rx.linq.sink.Sink):
+  class Sink(rx.linq.sink.LazyChunkedSink):
     def __init__(self, parent, observer, cancel):
-      super(ToObservable.Sink, self).__init__(observer, cancel)
+      super(ToObservable.Sink, self).__init__(observer, cancel, parent.chunkSize, parent.timeBudget)
       self.parent = parent
 
     def run(self):
-      it = None
-
       try:
-        it = iter(self.parent.source)
+        self.it = iter(self.parent.source)
       except Exception as e:
         self.observer.onError(e)
         self.dispose()
         return Disposable.empty()
 
-      scheduler = self.parent.scheduler
-      if scheduler.isLongRunning:
-        return scheduler.scheduleLongRunningWithState(it, self.loop)
-      else:
-        flag = BooleanDisposable()
-        scheduler.scheduleRecursiveWithState(Struct(flag=flag, it=it), self.loopRec)
-        return flag
+      return self.runChunked(self.parent.scheduler)
+
+    def pull(self):
+      return next(self.it)
+
 
-    def loopRec(self, state, recurse):
-      hasNext = False
-      ex = None
-      current = None
+class ReadAhead(Producer):
+  """Pulls the values of source on a dedicated thread into a queue of
+  at most prefetch values, so slow iterators run concurrently with the
+  observer. The queue is drained on scheduler like ToObservable."""
+
+  def __init__(self, source, scheduler, chunkSize, timeBudget, prefetch):
+    self.source = source
+    self.scheduler = scheduler
+    self.chunkSize = chunkSize
+    self.timeBudget = timeBudget
+    self.prefetch = prefetch
 
-      if state.flag.isDisposed:
-        return
+  def run(self, observer, cancel, setSink):
+    sink = self.Sink(self, observer, cancel)
+    setSink(sink)
+    return sink.run()
+
+  class Sink(rx.linq.sink.ChunkedSink):
+    def __init__(self, parent, observer, cancel):
+      super(ReadAhead.Sink, self).__init__(observer, cancel, parent.chunkSize, parent.timeBudget)
+      self.parent = parent
+
+    def run(self):
+      self.gate = RLock()
+      self.notEmpty = Condition(self.gate)
+      self.notFull = Condition(self.gate)
+      self.queue = deque()
+      self.isDone = False
+      self.isStopped = False
+      self.exception = None
+
+      producer = Thread(target=self.produce)
+      producer.daemon = True
+      producer.start()
+
+      return CompositeDisposable(
+        Disposable.create(self.stop),
+        self.runChunked(self.parent.scheduler)
+      )
+
+    def produce(self):
+      prefetch = self.parent.prefetch
 
       try:
-        current = next(state.it)
-      except StopIteration:
-        pass
+        for value in self.parent.source:
+          with self.gate:
+            while len(self.queue) >= prefetch and not self.isStopped:
+              self.notFull.wait()
+
+            if self.isStopped:
+              return
+
+            self.queue.append(value)
+            self.notEmpty.notify()
       except Exception as e:
-        ex = e
-      else:
-        hasNext = True
+        self.exception = e
+      finally:
+        with self.gate:
+          self.isDone = True
+          self.notEmpty.notify()
 
-      if ex != None:
-        self.observer.onError(ex)
-        self.dispose()
+    def stop(self):
+      with self.gate:
+        self.isStopped = True
+        self.queue.clear()
+        self.notFull.notify()
+        self.notEmpty.notify()
 
-      if not hasNext:
-        self.observer.onCompleted()
-        self.dispose()
-        return
+    def fill(self, values, count):
+      with self.gate:
+        queue = self.queue
 
-      self.observer.onNext(current)
-      recurse(state)
+        while len(queue) == 0 and not self.isDone and not self.isStopped:
+          self.notEmpty.wait()
 
-    def loop(self, it, cancel):
-      while not cancel.isDisposed:
-        hasNext = False
-        ex = None
-        current = None
+        n = min(count, len(queue))
 
-        try:
-          current = next(it)
-        except StopIteration:
-          pass
-        except Exception as e:
-          ex = e
-        else:
-          hasNext = True
+        for _ in range(n):
+          values.append(queue.popleft())
 
-        if ex != None:
-          self.observer.onError(ex)
-          break
+        if n > 0:
+          self.notFull.notify()
 
-        if not hasNext:
-          self.observer.onCompleted()
-          break
+        if self.isStopped:
+          return False
 
-        self.observer.onNext(current)
+        if len(queue) == 0 and self.isDone:
+          if self.exception != None:
+            raise self.exception
 
-      self.dispose()
+          return False
 
+        return True
@@ -1,15 +1,18 @@
 from rx.disposable import CompositeDisposable, Disposable, SingleAssignmentDisposable
+from rx.exceptions import QueueOverflowException
 from rx.observable import Producer
 from rx.observer import Observer
 import rx.linq.sink
 from collections import deque
-from threading import RLock
+from threading import Condition, RLock, current_thread
 
 
 class Zip(Producer):
-  def __init__(self, sources, resultSelector):
+  def __init__(self, sources, resultSelector, maxQueued=None, overflow='block'):
     self.sources = sources
     self.resultSelector = resultSelector
+    self.maxQueued = maxQueued
+    self.overflow = overflow
 
   def run(self, observer, cancel, setSink):
     sink = self.Sink(self, observer, cancel)
@@ -17,11 +20,15 @@ class Zip(Producer):
     return sink.run()
 
   class Sink(rx.linq.sink.Sink):
+    """Counts the non-empty queues and the completed sources, so
+    deciding whether a result can be yielded is O(1) per value."""
+
     def __init__(self, parent, observer, cancel):
       super(Zip.Sink, self).__init__(observer, cancel)
       self.parent = parent
 
     def run(self):
+      self.owner = current_thread()
       srcs = list(self.parent.sources)
 
       N = len(srcs)
@@ -30,6 +37,10 @@ class Zip(Producer):
       self.isDone = [False] * N
       self.subscriptions = [None] * N
       self.gate = RLock()
+      self.notFull = Condition(self.gate)
+      self.readyCount = 0
+      self.doneCount = 0
+      self.isStopped = False
 
       for i in range(0, N):
         self.queues[i] = deque()
@@ -46,26 +57,86 @@ class Zip(Producer):
       c = CompositeDisposable(self.subscriptions)
 
       def dispose():
-        for q in self.queues:
-          q.clear()
+        with self.gate:
+          self.isStopped = True
+
+          for q in self.queues:
+            q.clear()
+
+          self.notFull.notify_all()
 
       c.add(Disposable.create(dispose))
 
       return c
 
+    def enqueue(self, index, value):
+      """Returns False if the value was dropped."""
+      q = self.queues[index]
+      maxQueued = self.parent.maxQueued
+
+      if maxQueued != None and len(q) >= maxQueued:
+        overflow = self.parent.overflow
+
+        if overflow == 'block':
+          # the subscribing thread could have to produce the values the
+          # other queues wait for, so its values are queued anyway
+          if current_thread() is not self.owner:
+            while not self.isStopped and len(q) >= maxQueued:
+              self.notFull.wait()
+
+            if self.isStopped:
+              return False
+        elif overflow == 'drop':
+          return False
+        elif overflow == 'dropOldest':
+          q.popleft()
+
+          if len(q) == 0:
+            self.readyCount -= 1
+        else:
+          raise QueueOverflowException(maxQueued)
+
+      if len(q) == 0:
+        self.readyCount += 1
+
+      q.append(value)
+
+      return True
+
     def onNext(self, index, value):
       with self.gate:
-        self.queues[index].append(value)
+        if self.isStopped:
+          return
+
+        try:
+          if not self.enqueue(index, value):
+            return
+        except Exception as e:
+          self.onError(e)
+          return
+
+        N = len(self.queues)
+
+        if self.readyCount == N:
+          values = []
+
+          for q in self.queues:
+            values.append(q.popleft())
+
+            if len(q) == 0:
+              self.readyCount -= 1
+
+          if self.parent.maxQueued != None:
+            self.notFull.notify_all()
 
-        if all([len(q) > 0 for q in self.queues]):
           try:
-            res = self.parent.resultSelector(*map(lambda q: q.popleft(), self.queues))
+            res = self.parent.resultSelector(*values)
           except Exception as e:
             self.observer.onError(e)
             self.dispose()
           else:
             self.observer.onNext(res)
-        elif all(d for i, d in enumerate(self.isDone) if i != index):
+        elif self.doneCount == N - 1:
           self.observer.onCompleted()
           self.dispose()
 
@@ -76,9 +147,11 @@ class Zip(Producer):
 
     def onCompleted(self, index):
       with self.gate:
-        self.isDone[index] = True
+        if not self.isDone[index]:
+          self.isDone[index] = True
+          self.doneCount += 1
 
-        if all(self.isDone):
+        if self.doneCount == len(self.isDone):
           self.observer.onCompleted()
           self.dispose()
         else:
@@ -1,6 +1,6 @@
 from rx.disposable import Disposable, CompositeDisposable, SingleAssignmentDisposable
 from rx.internal import noop
-from rx.observer import Observer, AutoDetachObserver
+from rx.observer import Observer, AutoDetachObserver, WeakObserver
 from rx.scheduler import Scheduler
 from threading import RLock
 
@@ -21,6 +21,15 @@ class Observable(object):
 
     return self.subscribeCore(observer)
 
+  def subscribeWeak(self, observer):
+    assert isinstance(observer, Observer)
+
+    subscription = SingleAssignmentDisposable()
+    weakObserver = WeakObserver(observer, lambda _: subscription.dispose())
+    subscription.disposable = self.subscribe(weakObserver)
+
+    return subscription
+
   def subscribeCore(self, observer):
     raise NotImplementedError()
 
@@ -2,8 +2,13 @@ from rx.concurrency import Atomic
 from rx.disposable import Cancelable, Disposable, SingleAssignmentDisposable, SerialDisposable, CompositeDisposable
 from rx.internal import noop, defaultError
 from rx.notification import Notification
-from Queue import Empty, Queue
 from threading import RLock, Semaphore
+import weakref
+
+try:
+  from Queue import Empty, Queue
+except ImportError:
+  from queue import Empty, Queue
 
 class Observer(Disposable):
   """Represents the IObserver Interface.
@@ -50,6 +55,12 @@ class Observer(Disposable):
   def onNext(self, value):
     raise NotImplementedError()
 
+  def onNextBatch(self, values):
+    """Yields several values at once, observers that can handle
+    a batch cheaper than single values override this."""
+    for value in values:
+      self.onNext(value)
+
   def onError(self, exception):
     raise NotImplementedError()
 
@@ -74,6 +85,14 @@ class ObserverBase(Cancelable, Observer):
 
       self.onNextCore(value)
 
+  def onNextBatch(self, values):
+    with self.lock:
+      for value in values:
+        if self.isStopped.value:
+          return
+
+        self.onNextCore(value)
+
   def onError(self, exception):
     if not self.isStopped.exchange(True):
       self.onErrorCore(exception)
@@ -158,6 +177,27 @@ class AutoDetachObserver(ObserverBase):
       if not noError:
         self.dispose()
 
+  def onNextBatch(self, values):
+    noError = False
+
+    with self.lock:
+      if self.isStopped.value:
+        return
+
+      try:
+        self.observer.onNextBatch(self.untilStopped(values))
+        noError = True
+      finally:
+        if not noError:
+          self.dispose()
+
+  def untilStopped(self, values):
+    for value in values:
+      if self.isStopped.value:
+        return
+
+      yield value
+
   def onErrorCore(self, ex):
     try:
       self.observer.onError(ex)
@@ -319,7 +359,8 @@ class ScheduledObserver(ObserverBase):
       elif old == ScheduledObserver.FAULTED:
         return
       elif (
-          (old == ScheduledObserver.PENDING or old == ScheduledObserver.RUNNING) and
+          old == ScheduledObserver.PENDING or
+          old == ScheduledObserver.RUNNING and
           self.state.compareExchange(ScheduledObserver.PENDING, ScheduledObserver.RUNNING) == ScheduledObserver.RUNNING
         ):
         break
@@ -486,6 +527,53 @@ class ListObserver(Observer):
     return ListObserver(newObservers)
 
 
+class WeakObserver(Observer):
+  """Forwards all notifications to an observer that is only
+  weakly referenced. Once the observer has been garbage collected,
+  the next notification calls ``onCollected(self)`` instead."""
+
+  def __init__(self, observer, onCollected=noop):
+    super(WeakObserver, self).__init__()
+    self.ref = weakref.ref(observer)
+    self.onCollected = onCollected
+    self.isCollected = Atomic(False)
+
+  @property
+  def isAlive(self):
+    return self.ref() is not None
+
+  def onNext(self, value):
+    observer = self.ref()
+
+    if observer is None:
+      self.collect()
+    else:
+      observer.onNext(value)
+
+  def onError(self, exception):
+    observer = self.ref()
+
+    if observer is None:
+      self.collect()
+    else:
+      observer.onError(exception)
+
+  def onCompleted(self):
+    observer = self.ref()
+
+    if observer is None:
+      self.collect()
+    else:
+      observer.onCompleted()
+
+  def collect(self):
+    if not self.isCollected.exchange(True):
+      WeakObserver.reclaimedCount.inc()
+      self.onCollected(self)
+
+WeakObserver.reclaimedCount = Atomic(0)
+
+
 class NoopObserver(Observer):
   def onNext(self, value):
     pass
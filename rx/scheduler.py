@@ -4,9 +4,23 @@ from rx.internal import defaultNow, defaultSubComparer
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial as bind
-from Queue import Empty, PriorityQueue
 from threading import Thread, Timer, RLock
 from time import sleep
+import errno
+import heapq
+import itertools
+import select
+import socket
+
+try:
+  from Queue import Empty, PriorityQueue
+except ImportError:
+  from queue import Empty, PriorityQueue
+
+try:
+  import selectors
+except ImportError:
+  selectors = None
 
 
 class MetaScheduler(type):
@@ -43,12 +57,21 @@ class MetaScheduler(type):
   def asyncConversions(cls):
     return defaultScheduler
 
+  @property
+  def ioLoop(cls):
+    global ioLoopScheduler
+
+    with ioLoopLock:
+      if ioLoopScheduler == None:
+        ioLoopScheduler = IOLoopScheduler()
+
+    return ioLoopScheduler
+
 
-class Scheduler(object):
+class Scheduler(MetaScheduler('SchedulerBase', (object,), {})):
   """Provides a set of static properties to access commonly
   used Schedulers and implements all the scheduling methods that
   then use the overrides of the implementation."""
-  __metaclass__ = MetaScheduler
 
   @staticmethod
   def invokeAction(scheduler, action):
@@ -384,6 +407,7 @@ class DefaultScheduler(Scheduler):
         d.disposable = action(self, state)
 
     timer = Timer(dt, scheduled)
+    timer.start()
     cancel = Disposable.create(timer.cancel)
 
     return CompositeDisposable(d, cancel)
@@ -416,6 +440,253 @@ class DefaultScheduler(Scheduler):
     return cancel
 
 
+class PollSelector(object):
+  """The part of selectors.DefaultSelector used by IOLoopScheduler
+  for Pythons without the selectors module."""
+
+  def __init__(self):
+    self.poll = select.poll()
+    self.keys = {}
+
+  class Key(object):
+    def __init__(self, fd, events, data):
+      self.fd = fd
+      self.events = events
+      self.data = data
+
+  def register(self, fd, events, data=None):
+    self.keys[fd] = self.Key(fd, events, data)
+    self.poll.register(fd, self.pollEvents(events))
+
+  def modify(self, fd, events, data=None):
+    self.keys[fd] = self.Key(fd, events, data)
+    self.poll.modify(fd, self.pollEvents(events))
+
+  def unregister(self, fd):
+    del self.keys[fd]
+    self.poll.unregister(fd)
+
+  def pollEvents(self, events):
+    res = 0
+
+    if events & IOLoopScheduler.READ:
+      res |= select.POLLIN
+    if events & IOLoopScheduler.WRITE:
+      res |= select.POLLOUT
+
+    return res
+
+  def select(self, timeout=None):
+    if timeout != None:
+      timeout = max(timeout, 0) * 1000
+
+    res = []
+
+    for fd, pollEvents in self.poll.poll(timeout):
+      key = self.keys.get(fd)
+
+      if key == None:
+        continue
+
+      events = 0
+
+      if pollEvents & (select.POLLIN | select.POLLHUP | select.POLLERR):
+        events |= IOLoopScheduler.READ
+      if pollEvents & (select.POLLOUT | select.POLLHUP | select.POLLERR):
+        events |= IOLoopScheduler.WRITE
+
+      res.append((key, events & key.events))
+
+    return res
+
+
+class IOLoopScheduler(Scheduler):
+  """Represents a Scheduler that runs scheduled functions and the
+  callbacks of watched sockets on one thread that waits in a selector,
+  so one thread serves many connections. Selector changes are always
+  done on the loop thread."""
+
+  READ = 1
+  WRITE = 2
+
+  def __init__(self):
+    super(IOLoopScheduler, self).__init__()
+    self.lock = RLock()
+    self.timers = []
+    self.ids = itertools.count()
+    self.thread = None
+    self.isWaiting = False
+    # fileno: [None, readCallback, writeCallback], indexed by event
+    self.watched = {}
+
+    if selectors != None:
+      self.selector = selectors.DefaultSelector()
+    else:
+      self.selector = PollSelector()
+
+    self.wakeReader, self.wakeWriter = socket.socketpair()
+    self.wakeReader.setblocking(False)
+    self.wakeWriter.setblocking(False)
+    self.selector.register(self.wakeReader.fileno(), self.READ, None)
+
+  def isLoopThread(self):
+    return threading.current_thread() is self.thread
+
+  def _scheduleCore(self, state, action):
+    return self._scheduleRelativeCore(state, 0, action)
+
+  def _scheduleRelativeCore(self, state, dueTime, action):
+    si = ScheduledItem(self, state, action, self.now() + Scheduler.normalize(dueTime))
+
+    with self.lock:
+      heapq.heappush(self.timers, (si.dueTime, next(self.ids), si))
+
+      if self.thread == None:
+        self.startThread()
+      elif self.isWaiting and not self.isLoopThread():
+        self.isWaiting = False
+        self.wake()
+
+    return si.disposable
+
+  def _scheduleAbsoluteCore(self, state, dueTime, action):
+    return self.scheduleWithRelativeAndState(state, dueTime - self.now(), action)
+
+  def startThread(self):
+    self.thread = Thread(target=self.run)
+    self.thread.daemon = True
+    self.thread.start()
+
+  def wake(self):
+    try:
+      self.wakeWriter.send(b'x')
+    except socket.error as e:
+      # the wake up socket is full, the loop wakes up anyway
+      if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+        raise
+
+  def watch(self, fileobj, event, callback):
+    """Calls callback() on the loop thread whenever fileobj is ready
+    for event, READ or WRITE, until the returned disposable is disposed."""
+    fileno = fileobj.fileno()
+
+    def add():
+      self.updateWatch(fileno, event, callback)
+
+    def remove():
+      self.updateWatch(fileno, event, None)
+
+    self.onLoop(add)
+
+    return Disposable.create(lambda: self.onLoop(remove))
+
+  def unwatchAll(self, fileobj):
+    """Removes all watches of fileobj, must be called before
+    fileobj is closed."""
+    fileno = fileobj.fileno()
+
+    def remove():
+      if self.watched.pop(fileno, None) != None:
+        self.selector.unregister(fileno)
+
+    self.onLoop(remove)
+
+  def onLoop(self, action):
+    if self.isLoopThread():
+      action()
+    else:
+      self.schedule(action)
+
+  def updateWatch(self, fileno, event, callback):
+    entry = self.watched.get(fileno)
+    isNew = entry == None
+
+    if isNew:
+      if callback == None:
+        return
+
+      entry = [None, None, None]
+      self.watched[fileno] = entry
+
+    entry[event] = callback
+
+    events = 0
+
+    if entry[self.READ] != None:
+      events |= self.READ
+    if entry[self.WRITE] != None:
+      events |= self.WRITE
+
+    if events == 0:
+      del self.watched[fileno]
+      self.selector.unregister(fileno)
+    elif isNew:
+      self.selector.register(fileno, events, entry)
+    else:
+      self.selector.modify(fileno, events, entry)
+
+  def run(self):
+    try:
+      self.loop()
+    except BaseException:
+      # the error propagates like on the other schedulers, a new
+      # thread serves the remaining sockets and actions
+      with self.lock:
+        self.startThread()
+
+      raise
+
+  def loop(self):
+    while True:
+      with self.lock:
+        if len(self.timers) > 0:
+          timeout = max(self.timers[0][0] - self.now(), 0)
+        else:
+          timeout = None
+
+        self.isWaiting = timeout != 0
+
+      ready = self.selector.select(timeout)
+
+      with self.lock:
+        self.isWaiting = False
+
+      for key, events in ready:
+        entry = key.data
+
+        if entry == None:
+          self.drainWake()
+          continue
+
+        for event in (self.READ, self.WRITE):
+          callback = entry[event]
+
+          if events & event and callback != None:
+            callback()
+
+      self.runDue()
+
+  def drainWake(self):
+    try:
+      while self.wakeReader.recv(4096):
+        pass
+    except socket.error:
+      pass
+
+  def runDue(self):
+    now = self.now()
+
+    while True:
+      with self.lock:
+        if len(self.timers) == 0 or self.timers[0][0] > now:
+          return
+
+        si = heapq.heappop(self.timers)[2]
+
+      if not si.isCancelled():
+        si.invoke()
+
+
 class VirtualTimeScheduler(Scheduler):
   """Creates a new virtual time scheduler with the
   specified initial clock value and absolute time comparer."""
@@ -488,9 +759,10 @@ class VirtualTimeScheduler(Scheduler):
 
       while self.isEnabled:
         next = self.getNext()
-        nextIsTooLate = until != None and self.comparer(next.dueTime, until) > 0
 
-        if next == None or nextIsTooLate:
+        if next == None:
+          self.isEnabled = False
+        elif until != None and self.comparer(next.dueTime, until) > 0:
           self.queue.put(next)
           self.isEnabled = False
         else:
@@ -511,7 +783,8 @@ class VirtualTimeScheduler(Scheduler):
     if dueToClock == 0:
       return
 
-    self.start(time)
+    VirtualTimeScheduler.start(self, time)
+    self.clock = time
 
   def advanceBy(self, time):
     return self.advanceTo(self.add(self.clock, time))
@@ -726,4 +999,6 @@ class ScheduledItem(object):
 immediateScheduler = ImmediateScheduler()
 currentThreadScheduler = CurrentThreadScheduler()
 defaultScheduler = DefaultScheduler()
+ioLoopScheduler = None
+ioLoopLock = RLock()
 
@@ -2,19 +2,56 @@ from rx.concurrency import Atomic
 from rx.disposable import Disposable
 from rx.internal import errorIfDisposed, Struct
 from rx.observable import Observable
-from rx.observer import DisposedObserver, DoneObserver, NoopObserver, ListObserver, Observer, ScheduledObserver
+from rx.observer import DisposedObserver, DoneObserver, NoopObserver, ListObserver, Observer, ScheduledObserver, WeakObserver
 from rx.scheduler import currentThreadScheduler
+from collections import deque
 import sys
-from threading import RLock
+from threading import Lock, RLock
 
 
-class Subject(Observable, Observer):
-  def __init__(self):
+class WeakSubscriptions(object):
+  """Mixin for subjects that can hold their observers through weak
+  references. Observers that have been garbage collected are removed
+  on the next notification or by :meth:`sweep`."""
+
+  def initWeak(self, weak):
+    self.weak = weak
+    self.reclaimedCount = Atomic(0)
+
+  def wrapObserver(self, observer):
+    if self.weak:
+      return WeakObserver(observer, self.reclaim)
+    else:
+      return observer
+
+  def reclaim(self, weakObserver):
+    self.reclaimedCount.inc()
+    self.unsubscribe(weakObserver)
+
+  def currentObservers(self):
+    raise NotImplementedError()
+
+  def sweep(self):
+    for observer in self.currentObservers():
+      if isinstance(observer, WeakObserver) and not observer.isAlive:
+        observer.collect()
+
+  def sweepOn(self, scheduler, interval):
+    def action(continuation):
+      self.sweep()
+      continuation(interval)
+
+    return scheduler.scheduleRecursiveWithRelative(interval, action)
+
+
+class Subject(Observable, Observer, WeakSubscriptions):
+  def __init__(self, weak=False):
     super(Subject, self).__init__()
     self.isDisposed = False
     self.isStopped = False
     self.exception = None
     self.observer = Atomic(NoopObserver.instance)
+    self.initWeak(weak)
 
   def onCompleted(self):
     old = None
@@ -54,12 +91,16 @@ class Subject(Observable, Observer):
     self.observer.value.onNext(value)
 
   class Subscription(Disposable):
-    def __init__(self, subject, observer):
+    def __init__(self, subject, observer, target=None):
       self.subject = subject
       self.observer = Atomic(observer)
+      # a weakly subscribed observer lives at least as long as its
+      # subscription, callbacks are wrapped in an observer nobody else holds
+      self.target = target
 
     def dispose(self):
       old = self.observer.exchange(None)
+      self.target = None
 
       if old != None:
         self.subject.unsubscribe(old)
@@ -68,6 +109,8 @@ class Subject(Observable, Observer):
   def subscribeCore(self, observer):
     old = None
     new = None
+    target = observer
+    observer = self.wrapObserver(observer)
 
     while True:
       old = self.observer.value
@@ -96,7 +139,7 @@ class Subject(Observable, Observer):
       if old is current:
         break
 
-    return self.Subscription(self, observer)
+    return self.Subscription(self, observer, target)
 
   def unsubscribe(self, observer):
     old = None
@@ -120,6 +163,16 @@ class Subject(Observable, Observer):
       if old is current:
         return
 
+  def currentObservers(self):
+    current = self.observer.value
+
+    if isinstance(current, ListObserver):
+      return current.observers
+    elif current is NoopObserver.instance or isinstance(current, (DisposedObserver, DoneObserver)):
+      return ()
+    else:
+      return (current,)
+
   def dispose(self):
     self.observer.exchange(NoopObserver.instance)
 
@@ -158,6 +211,84 @@ class AnonymousSubject(Observable, Observer):
     return self.observable.subscribe(observer)
 
 
+class ConcurrentSubject(Observable, Observer):
+  """Represents a subject that accepts concurrent onNext calls from
+  many producer threads. Producers only append to a queue, the thread
+  that finds the subject idle drains the queue and delivers all
+  notifications to the observers one after the other."""
+
+  def __init__(self):
+    super(ConcurrentSubject, self).__init__()
+    self.subject = Subject()
+    self.queue = deque()
+    self.isStopped = False
+    self.exception = None
+    self.isTerminated = False
+    # held by the thread that drains the queue
+    self.drainLock = Lock()
+
+  def onCompleted(self):
+    if not self.isStopped:
+      self.isStopped = True
+      self.drain()
+
+  def onError(self, exception):
+    if not self.isStopped:
+      self.exception = exception
+      self.isStopped = True
+      self.drain()
+
+  def onNext(self, value):
+    if not self.isStopped:
+      # deque.append is atomic, producers never wait for the drain
+      self.queue.append(value)
+      self.drain()
+
+  def drain(self):
+    queue = self.queue
+
+    while True:
+      # a thread that finds the subject busy leaves its value to the
+      # draining thread without waiting
+      if not self.drainLock.acquire(False):
+        return
+
+      try:
+        observer = self.subject.observer.value
+
+        while True:
+          try:
+            value = queue.popleft()
+          except IndexError:
+            break
+
+          observer.onNext(value)
+
+        if self.isStopped and not self.isTerminated:
+          # onNext calls that passed the check before the subject
+          # stopped are muted by the terminated subject.
+          self.isTerminated = True
+
+          if self.exception != None:
+            self.subject.onError(self.exception)
+          else:
+            self.subject.onCompleted()
+      finally:
+        self.drainLock.release()
+
+      # notifications that arrived while the lock was released are
+      # drained by this thread
+      if len(queue) == 0 and (self.isTerminated or not self.isStopped):
+        return
+
+  def subscribeCore(self, observer):
+    return self.subject.subscribeCore(observer)
+
+  def dispose(self):
+    self.subject.dispose()
+    self.queue.clear()
+
+
 class AsyncSubject(Observable, Observer):
   def __init__(self):
     super(AsyncSubject, self).__init__()
@@ -261,8 +392,8 @@ class AsyncSubject(Observable, Observer):
       self.value = None
 
 
-class BehaviorSubject(Observable, Observer):
-  def __init__(self, value):
+class BehaviorSubject(Observable, Observer, WeakSubscriptions):
+  def __init__(self, value, weak=False):
     super(BehaviorSubject, self).__init__()
 
     self.value = value
@@ -271,6 +402,7 @@ class BehaviorSubject(Observable, Observer):
     self.isStopped = False
     self.exception = None
     self.gate = RLock()
+    self.initWeak(weak)
 
   @property
   def hasObservers(self):
@@ -323,6 +455,8 @@ class BehaviorSubject(Observable, Observer):
 
   def subscribeCore(self, observer):
     ex = None
+    target = observer
+    observer = self.wrapObserver(observer)
 
     with self.gate:
       errorIfDisposed(self)
@@ -330,7 +464,7 @@ class BehaviorSubject(Observable, Observer):
       if not self.isStopped:
         self.observers.append(observer)
         observer.onNext(self.value)
-        return Subject.Subscription(self, observer)
+        return Subject.Subscription(self, observer, target)
 
       ex = self.exception
 
@@ -346,6 +480,10 @@ class BehaviorSubject(Observable, Observer):
       if observer in self.observers:
         self.observers.remove(observer)
 
+  def currentObservers(self):
+    with self.gate:
+      return list(self.observers)
+
   def dispose(self):
     with self.gate:
       self.isDisposed = True
@@ -0,0 +1,47 @@
+import unittest
+
+from rx.disposable import Disposable, CompositeDisposable
+from rx.internal import Struct
+
+
+class TestCompositeDisposable(unittest.TestCase):
+  def createDisposables(self, state, count):
+    def dispose():
+      state.disposed += 1
+
+    return [Disposable.create(dispose) for _ in range(count)]
+
+  def test_add_remove_contains(self):
+    state = Struct(disposed=0)
+    a, b, c = self.createDisposables(state, 3)
+
+    group = CompositeDisposable(a, b)
+    group.add(c)
+
+    self.assertEqual(3, group.length, "group should contain three disposables")
+    self.assertTrue(group.contains(b), "group should contain b")
+
+    self.assertTrue(group.remove(b), "remove should find b")
+    self.assertFalse(group.contains(b), "group should not contain b after remove")
+    self.assertFalse(group.remove(b), "remove should not find b twice")
+    self.assertEqual(1, state.disposed, "remove should dispose b")
+    self.assertEqual(2, group.length, "group should contain two disposables")
+
+  def test_dispose_all(self):
+    state = Struct(disposed=0)
+    disposables = self.createDisposables(state, 100)
+
+    group = CompositeDisposable(disposables)
+
+    for d in disposables[::2]:
+      group.remove(d)
+
+    group.dispose()
+
+    self.assertEqual(100, state.disposed, "dispose should dispose all remaining disposables")
+    self.assertEqual(0, group.length, "group should be empty after dispose")
+
+    late = self.createDisposables(state, 1)[0]
+    group.add(late)
+
+    self.assertEqual(101, state.disposed, "add after dispose should dispose immediately")
@@ -1,14 +1,33 @@
 import unittest
 
 from rx.disposable import Disposable
+from rx.exceptions import DisposedException
 from rx.internal import Struct
 from rx.observable import Observable
-from rx.scheduler import Scheduler
+from rx.observer import Observer
+from rx.linq.cached import ObservableCache
+from rx.linq.distinct import BloomKeySet
+from rx.linq.fromSocket import SocketSink
+from rx.linq.timeout import DeadlineIndex
+from rx.scheduler import HistoricalScheduler, IOLoopScheduler, Scheduler
 from rx.subject import Subject
 
 from test.reactive import OnNext, OnError, OnCompleted, TestScheduler, ReactiveTest
 
+from array import array
+from collections import deque
 import concurrent.futures
+import os
+import socket
+import tempfile
+import time
+from threading import Event, Thread, current_thread
+import threading
+
+try:
+  import asyncio
+except ImportError:
+  asyncio = None
 
 class TestAggregation(ReactiveTest):
   def test_aggregate(self):
@@ -251,6 +270,73 @@ class TestAggregation(ReactiveTest):
 
 
 class TestBinding(ReactiveTest):
+  def test_cached(self):
+    sched = HistoricalScheduler()
+    cache = ObservableCache(maxEntries=2, ttl=10, scheduler=sched)
+    state = Struct(count=0)
+
+    def factory():
+      state.count += 1
+      return Observable.returnValue(state.count)
+
+    a = Observable.cached('a', factory, cache=cache)
+
+    self.assertIs(a, Observable.cached('a', factory, cache=cache), "same key should share the observable")
+    self.assertEqual([1, 1], [a.first(), a.first()], "result should be computed once")
+    self.assertEqual(1, state.count, "factory should be called once")
+
+    sched.advanceTo(10)
+
+    self.assertEqual(2, Observable.cached('a', factory, cache=cache).first(), "expired entry should be recomputed")
+
+    Observable.cached('b', factory, cache=cache)
+    Observable.cached('c', factory, cache=cache)
+
+    self.assertEqual(2, len(cache), "cache should be bounded by maxEntries")
+    self.assertEqual(2, cache.evictionCount, "expiry and size should evict")
+
+    self.assertRaises(AssertionError, Observable.cached, 'a', factory, maxEntries=2)
+
+    cache = ObservableCache(ttl=10)
+
+    self.assertEqual(5, Observable.cached('a', factory, cache=cache).first(), "cache should use the default scheduler")
+
+  def test_cached_disconnects(self):
+    sched = HistoricalScheduler()
+    cache = ObservableCache(maxEntries=1, ttl=10, scheduler=sched)
+    subscriptions = Struct(active=0)
+
+    def factory():
+      def subscribe(observer):
+        subscriptions.active += 1
+
+        def dispose():
+          subscriptions.active -= 1
+
+        return dispose
+
+      return Observable.create(subscribe)
+
+    a = Observable.cached('a', factory, cache=cache)
+    completed = []
+    a.subscribe(onComplete=lambda: completed.append('a'))
+    self.assertEqual(1, subscriptions.active, "entry should subscribe to its source")
+
+    Observable.cached('b', factory, cache=cache).subscribe()
+    self.assertEqual(1, subscriptions.active, "evicted entry should unsubscribe from its source")
+    self.assertEqual(['a'], completed, "subscribers of an evicted entry should complete")
+
+    d = a.subscribe()
+    self.assertEqual(1, subscriptions.active, "a later subscription should go to a new entry")
+    self.assertIsNot(a, Observable.cached('a', factory, cache=cache), "the new entry should be cached")
+    d.dispose()
+
+    sched.advanceTo(10)
+    cache.sweep()
+
+    self.assertEqual(0, len(cache), "sweep should remove expired entries")
+    self.assertEqual(0, subscriptions.active, "expired entry should unsubscribe from its source")
+
   def test_multicast(self):
     sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5)
 
@@ -371,6 +457,37 @@ class TestBinding(ReactiveTest):
 
     self.assertEqual(0, state.count, "there should be no subscription")
 
+  def test_ref_count_grace_period(self):
+    sched = HistoricalScheduler()
+    state = Struct(count=0)
+
+    def dispose():
+      state.count -= 1
+
+    def subscribe(observer):
+      state.count += 1
+      return Disposable.create(dispose)
+
+    o = Observable.create(subscribe).publish().refCount(10, sched)
+
+    d = o.subscribe(lambda x: None)
+    d.dispose()
+
+    self.assertEqual(1, state.count, "connection should be kept during the grace period")
+
+    sched.advanceTo(5)
+    d = o.subscribe(lambda x: None)
+    d.dispose()
+
+    sched.advanceTo(14)
+    self.assertEqual(1, state.count, "resubscribing should reuse the connection")
+
+    sched.advanceTo(20)
+    self.assertEqual(0, state.count, "connection should be disposed after the grace period")
+    self.assertEqual(1, o.connectCount, "there should be one connect")
+    self.assertEqual(1, o.disconnectCount, "there should be one disconnect")
+    self.assertEqual(1, o.reuseCount, "there should be one reuse")
+
   def test_replay(self):
     sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5)
 
@@ -411,6 +528,50 @@ class TestBlocking(ReactiveTest):
 
     self.assertSequenceEqual(values, a, "collected array should be [5]*4", list)
 
+  def test_collect_parallel(self):
+    s = Subject()
+    it = iter(s.collectParallel(None, lambda: 0, lambda acc, val: acc + val, lambda a, b: a + b))
+
+    def produce():
+      for i in range(1000):
+        s.onNext(i)
+
+    threads = [Thread(target=produce) for i in range(4)]
+
+    for t in threads:
+      t.start()
+
+    total = next(it)
+
+    for t in threads:
+      t.join()
+
+    s.onCompleted()
+
+    for acc in it:
+      total += acc
+
+    self.assertEqual(4 * sum(range(1000)), total, "collectParallel should combine the collectors of all threads")
+
+    o = Observable.fromIterable(range(10))
+    a = list(o.collectParallel(lambda x: x % 3, list, lambda acc, val: acc + [val], lambda a, b: a + b))
+
+    self.assertSequenceEqual(list(range(10)), sorted(sum(a, [])), "collectParallel should collect every value once", list)
+
+    s = Subject()
+    it = iter(s.collectParallel(None, lambda: 0, lambda acc, val: acc + val, lambda a, b: a + b))
+    total = 0
+
+    for i in range(20):
+      t = Thread(target=s.onNext, args=(i,))
+      t.start()
+      t.join()
+
+      total += next(it)
+
+    self.assertEqual(sum(range(20)), total, "collectParallel should collect the values of every thread")
+    self.assertEqual(0, len(it.partitions), "combined partitions should be dropped")
+
   def test_first(self):
     o = Observable.fromIterable([3, 2, 1])
     a = o.first(lambda x: x == 2)
@@ -452,6 +613,43 @@ class TestBlocking(ReactiveTest):
     self.assertSequenceEqual(values, state.acc, "accumulator should equal values", list)
     self.assertEqual(2, state.index, "last index set should be 2")
 
+  @unittest.skipIf(asyncio == None, "asyncio is not available")
+  def test_get_async_iterator(self):
+    loop = asyncio.new_event_loop()
+    s = Subject()
+    it = s.getAsyncIterator(maxBuffered=4, loop=loop)
+
+    def produce():
+      for i in range(100):
+        s.onNext(i)
+
+      s.onCompleted()
+
+    t = Thread(target=produce)
+    t.start()
+
+    values = []
+
+    try:
+      while True:
+        values.append(loop.run_until_complete(it.__anext__()))
+    except StopAsyncIteration:
+      pass
+
+    t.join()
+
+    self.assertSequenceEqual(list(range(100)), values, "getAsyncIterator should yield all values in order", list)
+
+    f = Observable.fromIterable([3, 2, 1]).toFuture(loop)
+
+    self.assertEqual(1, loop.run_until_complete(f), "toFuture should resolve to the last value")
+
+    f = Observable.throw(Exception("Test")).toFuture(loop)
+
+    self.assertRaises(Exception, loop.run_until_complete, f)
+
+    loop.close()
+
   def test_get_iterator(self):
     values = [3, 2, 1]
     o = Observable.fromIterable(values)
@@ -459,6 +657,84 @@ class TestBlocking(ReactiveTest):
 
     self.assertSequenceEqual(values, a, "getIterator should return values", list)
 
+  def test_get_iterator_max_buffered(self):
+    s = Subject()
+    it = s.getIterator(maxBuffered=4)
+    produced = [0]
+
+    def produce():
+      for i in range(100):
+        s.onNext(i)
+        produced[0] += 1
+
+      s.onCompleted()
+
+    t = Thread(target=produce)
+    t.start()
+
+    first = next(it)
+    t.join(0.1)
+
+    self.assertTrue(t.is_alive(), "getIterator should block the producer if the buffer is full")
+    self.assertLessEqual(produced[0], 5, "getIterator should buffer at most 'maxBuffered' values")
+
+    rest = list(it)
+    t.join()
+
+    self.assertSequenceEqual(list(range(100)), [first] + rest, "getIterator should yield all values in order", list)
+
+  def test_get_iterator_close(self):
+    s = Subject()
+    produced = [0]
+
+    def produce():
+      for i in range(100):
+        s.onNext(i)
+        produced[0] += 1
+
+    t = Thread(target=produce)
+
+    with s.getIterator(maxBuffered=4) as it:
+      t.start()
+
+      for value in it:
+        if value == 1:
+          break
+
+    t.join(1)
+
+    self.assertFalse(t.is_alive(), "disposing the iterator should release the producer")
+    self.assertEqual(100, produced[0], "values after dispose should be dropped")
+    self.assertRaises(DisposedException, next, it)
+
+  def test_get_iterator_wakeup(self):
+    s = Subject()
+    it = s.getIterator()
+    self.addCleanup(it.dispose)
+
+    class RacingQueue(deque):
+      race = True
+
+      def __len__(self):
+        n = deque.__len__(self)
+
+        if n == 0 and self.race:
+          # a value arrives after the consumer found the queue empty
+          self.race = False
+          Thread(target=s.onNext, args=(1,)).start()
+          time.sleep(0.05)
+
+        return n
+
+    it.queue = RacingQueue()
+    values = []
+
+    t = Thread(target=lambda: values.append(next(it)))
+    t.start()
+    t.join(5)
+
+    self.assertEqual([1], values, "getIterator should not miss a value that arrives while it starts waiting")
+
   def test_last(self):
     o = Observable.fromIterable([3, 2, 1])
     a = o.last()
@@ -627,6 +903,64 @@ class TestCreation(ReactiveTest):
       "range should range over values"
     )
 
+  def test_range_chunked(self):
+    class BatchObserver(Observer):
+      def __init__(self):
+        self.batches = []
+        self.completed = False
+
+      def onNextBatch(self, values):
+        self.batches.append(list(values))
+
+      def onCompleted(self):
+        self.completed = True
+
+    observer = BatchObserver()
+    Observable.range(0, 10, Scheduler.currentThread, chunkSize=4).subscribe(observer)
+
+    self.assertEqual([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]], observer.batches, "range should yield chunks to onNextBatch")
+    self.assertTrue(observer.completed, "range should complete after the last chunk")
+
+    sched = TestScheduler()
+
+    o = sched.start(
+      lambda: Observable.range(0, 1000, sched, chunkSize=4).take(5)
+    )
+
+    self.assertHasValues(o, [
+        (200, 0),
+        (200, 1),
+        (200, 2),
+        (200, 3),
+        (200, 4),
+      ],
+      200,
+      "range should stop yielding a chunk when the subscription is disposed"
+    )
+
+    def values():
+      yield 1
+      yield 2
+      raise Exception("iterator failed")
+
+    sched = TestScheduler()
+
+    o = sched.start(
+      lambda: Observable.fromIterable(values(), sched, chunkSize=4)
+    )
+
+    self.assertEqual(
+      [(200, OnNext(1)), (200, OnNext(2))],
+      o.messages[:2],
+      "fromIterable should yield the values of a chunk before an error"
+    )
+    self.assertHasError(
+      o,
+      "iterator failed",
+      200,
+      "fromIterable should yield the error after the values"
+    )
+
   def test_repeat_value(self):
     sched = TestScheduler()
 
@@ -726,6 +1060,59 @@ class TestCreation(ReactiveTest):
       "using should subscribe to the created observable"
     )
 
+  @unittest.skipIf(asyncio == None, "asyncio is not available")
+  def test_from_async_iterable(self):
+    loop = asyncio.new_event_loop()
+    it = Observable.range(0, 300).getAsyncIterator(loop=loop)
+
+    f = Observable.fromAsyncIterable(it, loop).toList().toFuture(loop)
+
+    self.assertSequenceEqual(
+      list(range(300)),
+      loop.run_until_complete(f),
+      "fromAsyncIterable should yield all values of the async iterable",
+      list
+    )
+
+    it = Observable.throw(Exception("Test")).getAsyncIterator(loop=loop)
+    f = Observable.fromAsyncIterable(it, loop).toFuture(loop)
+
+    self.assertRaises(Exception, loop.run_until_complete, f)
+
+    s = Subject()
+    it = s.getAsyncIterator(loop=loop)
+    f = Observable.fromAsyncIterable(it, loop).toList().toFuture(loop)
+
+    for i in range(3):
+      loop.call_later(0.01 * (i + 1), s.onNext, i)
+
+    loop.call_later(0.05, s.onCompleted)
+
+    self.assertSequenceEqual(
+      [0, 1, 2],
+      loop.run_until_complete(f),
+      "fromAsyncIterable should wait for values that are not ready",
+      list
+    )
+
+    s = Subject()
+    it = s.getAsyncIterator(loop=loop)
+    values = []
+    d = Observable.fromAsyncIterable(it, loop).subscribe(values.append)
+    loop.run_until_complete(asyncio.sleep(0.01))
+
+    self.assertTrue(it.consumerWaiting, "fromAsyncIterable should wait for the next value")
+
+    d.dispose()
+    loop.run_until_complete(asyncio.sleep(0.01))
+    s.onNext(1)
+    loop.run_until_complete(asyncio.sleep(0.01))
+
+    self.assertEqual([], values, "disposing fromAsyncIterable should cancel its task")
+    self.assertTrue(it.waiter == None or it.waiter.cancelled(), "the awaited value should be cancelled")
+
+    loop.close()
+
   def test_from_future(self):
     sched = TestScheduler()
     f = concurrent.futures.Future()
@@ -760,6 +1147,231 @@ class TestCreation(ReactiveTest):
       "fromIterable should yield all values"
     )
 
+  def test_from_iterable_prefetch(self):
+    threads = set()
+
+    def values():
+      for i in range(10):
+        threads.add(current_thread())
+        yield i
+
+      raise Exception("cursor closed")
+
+    sched = TestScheduler()
+
+    o = sched.start(
+      lambda: Observable.fromIterable(values(), sched, prefetch=3)
+    )
+
+    self.assertEqual(
+      [(200, OnNext(i)) for i in range(10)],
+      o.messages[:10],
+      "fromIterable should yield all values read ahead"
+    )
+    self.assertHasError(
+      o,
+      "cursor closed",
+      200,
+      "fromIterable should yield the error of the iterator after the values"
+    )
+    self.assertNotIn(current_thread(), threads, "fromIterable should read ahead on a dedicated thread")
+
+  def test_from_file(self):
+    fd, path = tempfile.mkstemp()
+    os.write(fd, b"ab\ncd\nefghijklmn\nop")
+    os.close(fd)
+    self.addCleanup(os.remove, path)
+
+    sched = TestScheduler()
+
+    o = sched.start(
+      lambda: Observable.fromFile(path, chunkSize=8, scheduler=sched)
+    )
+
+    self.assertHasValues(o, [
+        (200, b"ab\n"),
+        (200, b"cd\n"),
+        (200, b"efghijklmn\n"),
+        (200, b"op"),
+      ],
+      200,
+      "fromFile should yield the lines of the file"
+    )
+
+    sched = TestScheduler()
+
+    o = sched.start(
+      lambda: Observable.fromFile(path, 'chunks', chunkSize=8, offset=3, scheduler=sched).select(bytes)
+    )
+
+    self.assertHasValues(o, [
+        (200, b"cd\nefghi"),
+        (200, b"jklmn\nop"),
+      ],
+      200,
+      "fromFile should yield views of the file beginning at offset"
+    )
+
+    views = []
+    Observable.fromFile(path, 'chunks', chunkSize=8, scheduler=Scheduler.currentThread).subscribe(views.append)
+
+    self.assertEqual(
+      [b"ab\ncd\nef", b"ghijklmn", b"\nop"],
+      [bytes(view) for view in views],
+      "fromFile views should stay valid after completion"
+    )
+
+    sched = TestScheduler()
+
+    o = sched.start(
+      lambda: Observable.fromFile(path, 'records', recordSize=6, scheduler=sched).select(bytes)
+    )
+
+    self.assertEqual(
+      [(200, OnNext(b"ab\ncd\n")), (200, OnNext(b"efghij")), (200, OnNext(b"klmn\no"))],
+      o.messages[:3],
+      "fromFile should yield every record"
+    )
+    self.assertHasError(
+      o,
+      "Invalid operation: File ends with a partial record",
+      200,
+      "fromFile should yield an error for a partial record"
+    )
+
+    sched = TestScheduler()
+
+    def append():
+      with open(path, 'ab') as f:
+        f.write(b"q\nrs\n")
+
+    sched.scheduleAbsolute(300, append)
+
+    o = sched.start(
+      lambda: Observable.fromFile(path, offset=6, tail=True, pollInterval=50, scheduler=sched)
+    )
+
+    self.assertHasValues(o, [
+        (200, b"efghijklmn\n"),
+        (300, b"opq\n"),
+        (300, b"rs\n"),
+      ],
+      None,
+      "fromFile should follow a growing file in tail mode"
+    )
+
+    lines = []
+    received = Event()
+
+    def onNext(line):
+      lines.append(line)
+
+      if line == b"tu\n":
+        received.set()
+
+    subscription = Observable.fromFile(path, offset=6, tail=True, pollInterval=0.01).subscribe(onNext)
+    self.addCleanup(subscription.dispose)
+
+    time.sleep(0.05)
+
+    with open(path, 'ab') as f:
+      f.write(b"tu\n")
+
+    self.assertTrue(received.wait(5), "fromFile should follow a growing file on the default scheduler")
+    self.assertEqual([b"efghijklmn\n", b"opq\n", b"rs\n", b"tu\n"], lines, "fromFile should yield every line once")
+
+  def test_from_socket(self):
+    pairs = [socket.socketpair() for _ in range(20)]
+    received = [[] for _ in pairs]
+    done = Event()
+    completed = [0]
+
+    def onCompleted():
+      completed[0] += 1
+
+      if completed[0] == len(pairs):
+        done.set()
+
+    for (a, b), values in zip(pairs, received):
+      self.addCleanup(a.close)
+      self.addCleanup(b.close)
+      Observable.fromSocket(a).subscribe(values.append, onComplete=onCompleted)
+
+    for i, (a, b) in enumerate(pairs):
+      b.sendall(b"connection %d" % i)
+      b.shutdown(socket.SHUT_WR)
+
+    self.assertTrue(done.wait(5), "fromSocket should complete when the peer closes")
+    self.assertEqual(
+      [b"connection %d" % i for i in range(len(pairs))],
+      [b"".join(values) for values in received],
+      "fromSocket should yield the received bytes of every connection"
+    )
+
+  def test_socket_sink(self):
+    a, b = socket.socketpair()
+    self.addCleanup(a.close)
+    self.addCleanup(b.close)
+
+    sink = SocketSink(a)
+    data = [bytes(bytearray([i]) * 100000) for i in range(10)]
+
+    # more than the socket buffer, so the sink has to wait until it is writable
+    Observable.fromIterable(data, Scheduler.currentThread).subscribe(sink)
+
+    b.settimeout(5)
+    received = []
+
+    while True:
+      chunk = b.recv(65536)
+
+      if len(chunk) == 0:
+        break
+
+      received.append(chunk)
+
+    self.assertEqual(b"".join(data), b"".join(received), "SocketSink should write all values in order")
+    self.assertEqual(0, sink.buffered, "SocketSink should flush its buffer before shutting down")
+
+  def test_socket_sink_abort(self):
+    a, b = socket.socketpair()
+    self.addCleanup(b.close)
+
+    scheduler = IOLoopScheduler()
+    Observable.fromSocket(a, scheduler=scheduler).subscribe(lambda data: None)
+
+    sink = SocketSink(a, scheduler)
+    sink.onError(Exception('abort'))
+
+    aborted = Event()
+    scheduler.schedule(aborted.set)
+
+    self.assertTrue(aborted.wait(5), "the loop should keep running after abort")
+    self.assertEqual(-1, a.fileno(), "onError should close the socket")
+    self.assertEqual({}, scheduler.watched, "abort should remove the read watch of fromSocket too")
+
+  def test_io_loop_error(self):
+    scheduler = IOLoopScheduler()
+    errors = []
+    done = Event()
+
+    def fail():
+      raise Exception('fail')
+
+    excepthook = getattr(threading, 'excepthook', None)
+
+    if excepthook != None:
+      threading.excepthook = lambda args: errors.append(args.exc_value)
+      self.addCleanup(setattr, threading, 'excepthook', excepthook)
+
+    scheduler.schedule(fail)
+    scheduler.scheduleWithRelative(0.01, done.set)
+
+    self.assertTrue(done.wait(5), "a new loop thread should run the remaining actions")
+
+    if excepthook != None:
+      self.assertEqual(['fail'], [str(e) for e in errors], "the error should propagate out of the loop thread")
+
   def test_from_event(self):
     sched = TestScheduler()
     state = Struct(
@@ -1127,23 +1739,86 @@ class TestMultiple(ReactiveTest):
       "merge should yield all values in order"
     )
 
-  def test_on_error_resume_next(self):
+  def test_merge_drain(self):
     sched = TestScheduler()
-    ex = Exception("Test Exception")
-    os = [
-      sched.createHotObservable((210, OnError(ex))),
-      sched.createHotObservable((220, OnError(ex))),
-      sched.createHotObservable((230, OnNext(2)), (240, OnCompleted())),
-    ]
-
-    o = sched.start(
-      lambda: Observable.onErrorResumeNext(os)
+    o1 = sched.createHotObservable(
+      (230, OnNext(4)),
+      (270, OnCompleted())
     )
-
-    self.assertHasValues(o, [
-        (230, 2),
-      ],
-      240,
+    o2 = sched.createHotObservable(
+      (250, OnNext(5)),
+      (260, OnCompleted())
+    )
+    o3 = sched.createHotObservable(
+      (240, OnNext(6)),
+      (250, OnCompleted())
+    )
+    o4 = sched.createHotObservable(
+      (205, OnNext(o1)),
+      (215, OnNext(o2)),
+      (225, OnNext(o3)),
+      (240, OnCompleted())
+    )
+
+    o = sched.start(
+      lambda: o4.merge(drain=True)
+    )
+
+    self.assertHasValues(o, [
+        (230, 4),
+        (240, 6),
+        (250, 5),
+      ],
+      270,
+      "merge with drain should yield all values in order"
+    )
+
+    subjects = [Subject() for _ in range(8)]
+    values = []
+    done = Event()
+
+    Observable.fromIterable(subjects, Scheduler.immediate).merge(drain=True, prefetch=4).subscribe(values.append, onComplete=done.set)
+
+    def produce(index, subject):
+      for i in range(500):
+        subject.onNext((index, i))
+
+      subject.onCompleted()
+
+    threads = [Thread(target=produce, args=(i, s)) for i, s in enumerate(subjects)]
+
+    for t in threads:
+      t.start()
+    for t in threads:
+      t.join()
+
+    self.assertTrue(done.wait(10), "merge with drain should complete")
+    self.assertEqual(8 * 500, len(values), "merge with drain should yield all values")
+
+    for index in range(8):
+      self.assertEqual(
+        list(range(500)),
+        [i for j, i in values if j == index],
+        "merge with drain should keep the order of every inner"
+      )
+
+  def test_on_error_resume_next(self):
+    sched = TestScheduler()
+    ex = Exception("Test Exception")
+    os = [
+      sched.createHotObservable((210, OnError(ex))),
+      sched.createHotObservable((220, OnError(ex))),
+      sched.createHotObservable((230, OnNext(2)), (240, OnCompleted())),
+    ]
+
+    o = sched.start(
+      lambda: Observable.onErrorResumeNext(os)
+    )
+
+    self.assertHasValues(o, [
+        (230, 2),
+      ],
+      240,
       "onErrorResumeNext should yield all values in order"
     )
 
@@ -1247,6 +1922,94 @@ class TestMultiple(ReactiveTest):
       "zip should yield tuples of next values of all observables"
     )
 
+  def test_zip_bounded(self):
+    def create(sched):
+      o1 = sched.createHotObservable(
+        (210, OnNext(1)),
+        (220, OnNext(2)),
+        (230, OnNext(3)),
+        (250, OnCompleted())
+      )
+      o2 = sched.createHotObservable(
+        (240, OnNext(10)),
+        (260, OnCompleted())
+      )
+      return o1, o2
+
+    sched = TestScheduler()
+    o1, o2 = create(sched)
+
+    o = sched.start(
+      lambda: o1.zip(o2, maxQueued=1, overflow='drop')
+    )
+
+    self.assertHasValues(o, [
+        (240, (1, 10)),
+      ],
+      260,
+      "zip should drop new values if the queue is full"
+    )
+
+    sched = TestScheduler()
+    o1, o2 = create(sched)
+
+    o = sched.start(
+      lambda: o1.zip(o2, maxQueued=1, overflow='dropOldest')
+    )
+
+    self.assertHasValues(o, [
+        (240, (3, 10)),
+      ],
+      260,
+      "zip should drop the oldest value if the queue is full"
+    )
+
+    sched = TestScheduler()
+    o1, o2 = create(sched)
+
+    o = sched.start(
+      lambda: o1.zip(o2, maxQueued=1, overflow='error')
+    )
+
+    self.assertHasError(
+      o,
+      "Queue exceeded its capacity of 1",
+      220,
+      "zip should yield an error if the queue is full"
+    )
+
+  def test_zip_bounded_block(self):
+    a = []
+    o = Observable.zip(Observable.range(0, 100), Observable.range(0, 100), maxQueued=10)
+    o.subscribe(a.append)
+
+    self.assertEqual([(i, i) for i in range(100)], a, "zip should not block the subscribing thread")
+
+    s1 = Subject()
+    s2 = Subject()
+    a = []
+    s1.zip(s2, maxQueued=2).subscribe(a.append)
+    produced = [0]
+
+    def produce():
+      for i in range(10):
+        s1.onNext(i)
+        produced[0] += 1
+
+    t = Thread(target=produce)
+    t.start()
+    t.join(0.1)
+
+    self.assertTrue(t.is_alive(), "zip should block a producer on another thread if its queue is full")
+    self.assertEqual(2, produced[0], "zip should queue at most 'maxQueued' values")
+
+    for i in range(10):
+      s2.onNext(i)
+
+    t.join()
+
+    self.assertEqual([(i, i) for i in range(10)], a, "zip should continue once the queue has room")
+
 
 class TestSingle(ReactiveTest):
   def test_as_observable(self):
@@ -1273,6 +2036,76 @@ class TestSingle(ReactiveTest):
       "buffer should buffer values with count"
     )
 
+  def test_buffer_array(self):
+    sched, xs, messages = self.simpleHot(1, 2, 3)
+
+    o = sched.start(
+      lambda: xs.bufferArray(2, 'i')
+    )
+
+    self.assertHasValues(o, [
+        (220, array('i', [1, 2])),
+        (240, array('i', [3])),
+      ],
+      240,
+      "bufferArray should collect the values in arrays"
+    )
+
+    sched, xs, messages = self.simpleHot((1, 1.5), (2, 2.5), (3, 3.5))
+
+    o = sched.start(
+      lambda: xs.bufferArray(2, 'id', into='columns')
+    )
+
+    self.assertHasValues(o, [
+        (220, (array('i', [1, 2]), array('d', [1.5, 2.5]))),
+        (240, (array('i', [3]), array('d', [3.5]))),
+      ],
+      240,
+      "bufferArray should collect records in columns"
+    )
+
+  def test_buffer_view(self):
+    sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5)
+    views = []
+
+    o = sched.start(
+      lambda: xs.buffer(3, 1, view=True).do(views.append).select(lambda view: view.tolist())
+    )
+
+    self.assertHasValues(o, [
+        (230, [1, 2, 3]),
+        (240, [2, 3, 4]),
+        (250, [3, 4, 5]),
+        (260, [4, 5]),
+        (260, [5]),
+      ],
+      260,
+      "buffer with view should yield views of overlapping buffers"
+    )
+
+    self.assertFalse(views[0].isValid, "buffer view should be invalid after it was overwritten")
+    self.assertEqual([3, 4, 5], views[2], "the last buffer view should stay valid")
+
+    sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5)
+
+    o = sched.start(
+      lambda: xs.buffer(3, 1, view=True, typecode='i').select(
+        lambda view: array('i', bytes(view.memoryview())).tolist()
+      )
+    )
+
+    self.assertHasValues(o, [
+        (230, [1, 2, 3]),
+        (240, [2, 3, 4]),
+        (250, [3, 4, 5]),
+        (260, [4, 5]),
+        (260, [5]),
+      ],
+      260,
+      "buffer view memoryview should expose the values of the buffer"
+    )
+
   def test_dematerialize(self):
     ex = Exception("Test Exception")
     sched = TestScheduler()
@@ -1557,6 +2390,57 @@ class TestStandardSequence(ReactiveTest):
       "defaultIfEmpty should yield default value on empty"
     )
 
+  def test_distinct_lru(self):
+    sched, xs, messages = self.simpleHot(1, 2, 1, 3, 2, 1)
+
+    xs = xs.distinct(mode='lru', capacity=2)
+    stats = []
+
+    def check():
+      stats.append([keySet.evictionCount for keySet in xs.keySets])
+
+    sched.scheduleAbsolute(215, check)
+    sched.scheduleAbsolute(265, check)
+    xs.subscribe()
+    o = sched.start(lambda: xs)
+
+    self.assertHasValues(o, [
+        (210, 1),
+        (220, 2),
+        (240, 3),
+        (250, 2),
+        (260, 1),
+      ],
+      270,
+      "distinct should forget the least recently seen keys"
+    )
+    self.assertEqual([[0, 0], [3, 3]], stats, "every subscription should have its own key set")
+    self.assertEqual([], xs.keySets, "the key sets of ended subscriptions should be released")
+
+  def test_distinct_window(self):
+    sched, xs, messages = self.simpleHot(1, 2, 1, 1)
+
+    o = sched.start(lambda: xs.distinct(mode='window', window=20, scheduler=sched))
+
+    self.assertHasValues(o, [
+        (210, 1),
+        (220, 2),
+        (230, 1),
+      ],
+      250,
+      "distinct should forget keys after the window"
+    )
+
+  def test_distinct_bloom(self):
+    values = list(range(5000)) * 2
+    keySet = BloomKeySet(0.01, 100)
+
+    isNew = [keySet.add(v) for v in values]
+
+    self.assertFalse(any(isNew[5000:]), "seen keys should always be recognized")
+    self.assertGreater(sum(isNew), 4900, "false positive rate should be bounded")
+    self.assertGreater(len(keySet.filters), 1, "the filter should have grown")
+
   def test_group_by(self):
     sched, xs, messages = self.simpleHot(
       {'k': 1, 'v': 1},
@@ -1583,6 +2467,66 @@ class TestStandardSequence(ReactiveTest):
       "groupBy should group values"
     )
 
+  def test_group_by_bounded(self):
+    sched, xs, messages = self.simpleHot(
+      {'k': 1, 'v': 1},
+      {'k': 2, 'v': 2},
+      {'k': 3, 'v': 3},
+      {'k': 1, 'v': 4}
+    )
+
+    o = sched.start(
+      lambda: xs.groupBy(
+        lambda x: x['k'],
+        lambda x: x['v'],
+        maxGroups=2
+      ).selectMany(
+        lambda subject: subject.toList().select(
+          lambda values: {'k': subject.key, 'v': values}
+        )
+      )
+    )
+
+    self.assertHasValues(o, [
+        (230, {'k': 1, 'v': [1]}),
+        (240, {'k': 2, 'v': [2]}),
+        (250, {'k': 3, 'v': [3]}),
+        (250, {'k': 1, 'v': [4]})
+      ],
+      250,
+      "groupBy should complete the least recently used group"
+    )
+
+  def test_group_by_idle(self):
+    sched, xs, messages = self.simpleHot(
+      {'k': 1, 'v': 1},
+      {'k': 2, 'v': 2},
+      {'k': 2, 'v': 3},
+      {'k': 1, 'v': 4}
+    )
+
+    o = sched.start(
+      lambda: xs.groupBy(
+        lambda x: x['k'],
+        lambda x: x['v'],
+        idleTimeout=15,
+        scheduler=sched
+      ).selectMany(
+        lambda subject: subject.toList().select(
+          lambda values: {'k': subject.key, 'v': values}
+        )
+      )
+    )
+
+    self.assertHasValues(o, [
+        (225, {'k': 1, 'v': [1]}),
+        (245, {'k': 2, 'v': [2, 3]}),
+        (250, {'k': 1, 'v': [4]})
+      ],
+      250,
+      "groupBy should complete idle groups"
+    )
+
   def test_group_by_until(self):
     sched, xs, messages = self.simpleHot(
       {'k': 1, 'v': 1},
@@ -1674,6 +2618,74 @@ class TestStandardSequence(ReactiveTest):
       "groupJoin should yield tuples according to selector function"
     )
 
+  def test_join_with_key(self):
+    sched = TestScheduler()
+    o1 = sched.createHotObservable(
+      (210, OnNext(('a', 1))),
+      (240, OnNext(('b', 2))),
+      (270, OnCompleted())
+    )
+    o2 = sched.createHotObservable(
+      (220, OnNext(('a', 6))),
+      (230, OnNext(('b', 7))),
+      (245, OnNext(('a', 8))),
+      (260, OnCompleted())
+    )
+
+    o = sched.start(
+      lambda: o1.joinWithKey(
+        o2,
+        lambda x: x[0],
+        lambda x: x[0],
+        30,
+        15,
+        lambda left, right: (left[1], right[1]),
+        sched
+      )
+    )
+
+    self.assertHasValues(o, [
+        (220, (1, 6)),
+        (240, (2, 7)),
+      ],
+      260,
+      "joinWithKey should only join matching keys within the windows"
+    )
+
+  def test_group_join_with_key(self):
+    sched = TestScheduler()
+    o1 = sched.createHotObservable(
+      (210, OnNext(('a', 1))),
+      (240, OnNext(('b', 2))),
+      (250, OnCompleted())
+    )
+    o2 = sched.createHotObservable(
+      (220, OnNext(('a', 6))),
+      (230, OnNext(('b', 7))),
+      (245, OnNext(('a', 8))),
+      (260, OnCompleted())
+    )
+
+    o = sched.start(
+      lambda: o1.groupJoinWithKey(
+        o2,
+        lambda x: x[0],
+        lambda x: x[0],
+        100,
+        100,
+        lambda left, window: window.toList().select(lambda values: (left[1], [v[1] for v in values])),
+        sched
+      ).merge()
+    )
+
+    self.assertHasValues(o, [
+        (310, (1, [6, 8])),
+        (340, (2, [7])),
+      ],
+      340,
+      "groupJoinWithKey should group matching keys until the window ends"
+    )
+
   def test_of_type(self):
     sched = TestScheduler()
     xs = sched.createHotObservable(
@@ -1768,6 +2780,119 @@ class TestStandardSequence(ReactiveTest):
       "selectMany should subscribe to the observable given as parameter"
     )
 
+  def test_select_many_ordered(self):
+    def create(sched):
+      inners = {
+        'a': sched.createHotObservable(
+          (250, OnNext('a1')),
+          (270, OnNext('a2')),
+          (280, OnCompleted())
+        ),
+        'b': sched.createHotObservable(
+          (225, OnNext('b1')),
+          (260, OnNext('b2')),
+          (265, OnCompleted())
+        ),
+        'c': sched.createHotObservable(
+          (285, OnNext('c1')),
+          (290, OnCompleted())
+        ),
+      }
+      xs = sched.createHotObservable(
+        (210, OnNext('a')),
+        (220, OnNext('b')),
+        (230, OnNext('c')),
+        (240, OnCompleted())
+      )
+      return xs, inners
+
+    sched = TestScheduler()
+    xs, inners = create(sched)
+
+    o = sched.start(
+      lambda: xs.selectManyOrdered(lambda x: inners[x], maxConcurrency=2)
+    )
+
+    self.assertHasValues(o, [
+        (250, 'a1'),
+        (270, 'a2'),
+        (280, 'b1'),
+        (280, 'b2'),
+        (285, 'c1'),
+      ],
+      290,
+      "selectManyOrdered should yield the values in source order"
+    )
+
+    sched = TestScheduler()
+    xs, inners = create(sched)
+
+    o = sched.start(
+      lambda: xs.selectManyOrdered(lambda x: inners[x], maxConcurrency=2, prefetch=1)
+    )
+
+    self.assertHasError(
+      o,
+      "Queue exceeded its capacity of 1",
+      260,
+      "selectManyOrdered should yield an error if an inner buffered too many values"
+    )
+
+  def test_select_many_ordered_block(self):
+    src = Subject()
+    a = Subject()
+    c = Subject()
+    values = []
+
+    def selector(x):
+      if x == 'a':
+        return a
+      elif x == 'c':
+        return c
+      else:
+        return Observable.fromIterable(range(10), scheduler=Scheduler.immediate)
+
+    src.selectManyOrdered(selector, maxConcurrency=2, prefetch=2, overflow='block').subscribe(values.append)
+
+    src.onNext('a')
+    src.onNext('b')
+    src.onNext('c')
+
+    self.assertEqual(1, len(c.currentObservers()), "a completed inner should not take a slot")
+
+    a.onNext('a1')
+    a.onCompleted()
+    c.onNext('c1')
+
+    self.assertEqual(['a1'] + list(range(10)) + ['c1'], values, "the subscribing thread should not be blocked")
+
+    src = Subject()
+    a = Subject()
+    b = Subject()
+    values = []
+
+    src.selectManyOrdered(lambda x: a if x == 'a' else b, prefetch=2, overflow='block').subscribe(values.append)
+    src.onNext('a')
+    src.onNext('b')
+
+    def produce():
+      for i in range(5):
+        b.onNext(i)
+
+      b.onCompleted()
+
+    t = Thread(target=produce)
+    t.start()
+    t.join(0.1)
+
+    self.assertTrue(t.is_alive(), "selectManyOrdered should block a producer of a full inner")
+
+    a.onCompleted()
+    t.join(5)
+
+    self.assertFalse(t.is_alive(), "the producer should continue once its inner is the oldest")
+    self.assertEqual(list(range(5)), values, "selectManyOrdered should yield all values in order")
+
   def test_skip(self):
     sched, xs, messages = self.simpleHot(1, 2, 3, 4)
 
@@ -1905,7 +3030,7 @@ class TestTime(ReactiveTest):
 
   def test_buffer_with_time_and_count(self):
     sched = TestScheduler()
-    xs = sched.createHotObservable(
+    messages = [
       (190, OnNext(1)),
       (210, OnNext(2)),
       (220, OnNext(3)),
@@ -1913,7 +3038,8 @@ class TestTime(ReactiveTest):
       (230, OnNext(5)),
       (260, OnNext(6)),
       (270, OnCompleted())
-    )
+    ]
+    xs = sched.createHotObservable(*messages)
 
     o = sched.start(
       lambda: xs.bufferWithTimeAndCount(30, 3, sched)
@@ -1928,6 +3054,22 @@ class TestTime(ReactiveTest):
       "bufferWithTime should buffer correctly"
     )
 
+    sched = TestScheduler()
+    xs = sched.createHotObservable(*messages)
+
+    o = sched.start(
+      lambda: xs.bufferWithTimeAndCount(30, 3, sched, into='array', typecode='i')
+    )
+
+    self.assertHasValues(o, [
+        (225, array('i', [2, 3, 4])),
+        (255, array('i', [5])),
+        (270, array('i', [6])),
+      ],
+      270,
+      "bufferWithTimeAndCount should collect the values in arrays"
+    )
+
   def test_delay_relative(self):
     sched, xs, messages = self.simpleHot(1)
 
@@ -1957,6 +3099,20 @@ class TestTime(ReactiveTest):
       "delayRelative should delay values"
     )
 
+  def test_delay_max_queued(self):
+    sched, xs, messages = self.simpleHot(1, 2, 3, 4)
+
+    o = sched.start(
+      lambda: xs.delayRelative(25, sched, maxQueued=2)
+    )
+
+    self.assertHasError(
+      o,
+      "Queue exceeded its capacity of 2",
+      230,
+      "delayRelative should yield an error if too many values are waiting"
+    )
+
   def test_delay_individual(self):
     sched, xs, messages = self.simpleHot(1, 2)
 
@@ -2097,6 +3253,106 @@ class TestTime(ReactiveTest):
       "sampleWithTime take the next previouse every 'interval' seconds"
     )
 
+  def test_sliding_aggregate(self):
+    sched, xs, messages = self.simpleHot(3, 1, 4, 1, 5)
+
+    o = sched.start(
+      lambda: xs.slidingAggregate('max', count=3)
+    )
+
+    self.assertHasValues(o, [
+        (210, 3),
+        (220, 3),
+        (230, 4),
+        (240, 4),
+        (250, 5),
+      ],
+      260,
+      "slidingAggregate should yield the maximum of the last 'count' values"
+    )
+
+    sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5)
+
+    o = sched.start(
+      lambda: xs.slidingAggregate('mean', count=2, skip=2)
+    )
+
+    self.assertHasValues(o, [
+        (220, 1.5),
+        (240, 3.5),
+      ],
+      260,
+      "slidingAggregate should yield every 'skip' values"
+    )
+
+    sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5)
+
+    o = sched.start(
+      lambda: xs.slidingAggregate('variance', count=2)
+    )
+
+    self.assertHasValues(o, [
+        (210, 0.0),
+        (220, 0.25),
+        (230, 0.25),
+        (240, 0.25),
+        (250, 0.25),
+      ],
+      260,
+      "slidingAggregate should remove values from the variance"
+    )
+
+  def test_sliding_aggregate_with_time(self):
+    sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5)
+
+    o = sched.start(
+      lambda: xs.slidingAggregate('sum', timeSpan=25, scheduler=sched)
+    )
+
+    self.assertHasValues(o, [
+        (210, 1),
+        (220, 3),
+        (230, 6),
+        (240, 9),
+        (250, 12),
+      ],
+      260,
+      "slidingAggregate should sum the values of the last 'timeSpan'"
+    )
+
+    sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5)
+
+    o = sched.start(
+      lambda: xs.slidingAggregate('sum', timeSpan=25, timeShift=12, scheduler=sched)
+    )
+
+    self.assertHasValues(o, [
+        (212, 1),
+        (224, 3),
+        (236, 5),
+        (248, 7),
+      ],
+      260,
+      "slidingAggregate should yield the aggregate every 'timeShift'"
+    )
+
+    s = Subject()
+    results = []
+    ticked = Event()
+
+    def onNext(value):
+      results.append(value)
+      ticked.set()
+
+    d = s.slidingAggregate('count', timeSpan=10, timeShift=0.05).subscribe(onNext)
+    s.onNext(1)
+    s.onNext(2)
+    ticked.wait(5)
+    d.dispose()
+
+    self.assertTrue(ticked.is_set(), "slidingAggregate should tick on the default scheduler")
+    self.assertEqual(2, results[0], "slidingAggregate should yield the aggregate of the window")
+
   def test_sample_with_observable(self):
     sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5)
     ys = sched.createHotObservable(
@@ -2119,6 +3375,51 @@ class TestTime(ReactiveTest):
       "sampleWithObservable take the previouse value on every onNext"
     )
 
+  def test_skip_last_with_time(self):
+    sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5, 6)
+
+    o = sched.start(
+      lambda: xs.skipLastWithTime(25, sched)
+    )
+
+    self.assertHasValues(o, [
+        (240, 1),
+        (250, 2),
+        (260, 3),
+        (270, 4),
+      ],
+      270,
+      "skipLastWithTime should yield values once they are older than 'time'"
+    )
+
+  def test_take_last_with_time(self):
+    sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5, 6)
+
+    o = sched.start(
+      lambda: xs.takeLastWithTime(25, sched)
+    )
+
+    self.assertHasValues(o, [
+        (270, 5),
+        (270, 6),
+      ],
+      270,
+      "takeLastWithTime should yield the values of the last 'time'"
+    )
+
+    sched, xs, messages = self.simpleHot(1, 2, 3, 4, 5, 6)
+
+    o = sched.start(
+      lambda: xs.takeLastBufferWithTime(35, sched, sampleEvery=2)
+    )
+
+    self.assertHasValues(o, [
+        (270, [3, 4, 5, 6]),
+      ],
+      270,
+      "takeLastBufferWithTime should stamp values with the next clock reading"
+    )
+
   def test_throttle(self):
     sched = TestScheduler()
     xs = sched.createHotObservable(
@@ -2142,6 +3443,44 @@ class TestTime(ReactiveTest):
       "throttle should wait at least 'interval' befor yielding the most recent value"
     )
 
+  def test_throttle_leading_and_max_wait(self):
+    messages = [
+      (210, OnNext(1)),
+      (220, OnNext(2)),
+      (230, OnNext(3)),
+      (240, OnNext(4)),
+      (280, OnCompleted())
+    ]
+
+    sched = TestScheduler()
+    xs = sched.createHotObservable(*messages)
+
+    o = sched.start(
+      lambda: xs.throttle(15, sched, leading=True, trailing=False)
+    )
+
+    self.assertHasValues(o, [
+        (210, 1),
+      ],
+      280,
+      "throttle should yield the first value of a burst if leading"
+    )
+
+    sched = TestScheduler()
+    xs = sched.createHotObservable(*messages)
+
+    o = sched.start(
+      lambda: xs.throttle(15, sched, maxWait=25)
+    )
+
+    self.assertHasValues(o, [
+        (235, 3),
+        (255, 4),
+      ],
+      280,
+      "throttle should yield at least every 'maxWait'"
+    )
+
   def test_throttle_individual(self):
     sched = TestScheduler()
     xs = sched.createHotObservable(
@@ -2254,6 +3593,82 @@ class TestTime(ReactiveTest):
       "timeoutIndividual should time out after individual time"
     )
 
+  def test_timeout_relative_reset(self):
+    sched = TestScheduler()
+    xs = sched.createHotObservable(
+      (210, OnNext(10)),
+      (230, OnNext(20)),
+      (240, OnNext(30)),
+      (270, OnCompleted())
+    )
+
+    o = sched.start(
+      lambda: xs.timeoutRelative(15, scheduler=sched)
+    )
+
+    self.assertHasError(
+      o,
+      "Operation timed out",
+      225,
+      "timeoutRelative should restart the timeout on every value"
+    )
+
+    sched = TestScheduler()
+    xs = sched.createHotObservable(
+      (210, OnNext(10)),
+      (230, OnNext(20)),
+      (240, OnNext(30)),
+      (270, OnCompleted())
+    )
+
+    o = sched.start(
+      lambda: xs.timeoutIndividual(lambda x: 25, 15, scheduler=sched)
+    )
+
+    self.assertHasError(
+      o,
+      "Operation timed out",
+      265,
+      "timeoutIndividual should accept relative times"
+    )
+
+    sched = TestScheduler()
+    xs = sched.createHotObservable(
+      (210, OnNext(10)),
+      (230, OnNext(20)),
+      (240, OnNext(30)),
+      (270, OnCompleted())
+    )
+
+    ys = sched.createColdObservable(
+      (100, OnNext(0))
+    )
+
+    o = sched.start(
+      lambda: xs.timeoutIndividual(lambda x: ys if x == 10 else 20, 15, scheduler=sched)
+    )
+
+    self.assertHasError(
+      o,
+      "Operation timed out",
+      260,
+      "timeoutIndividual should switch between relative times and observables"
+    )
+
+  def test_timeout_deadline_index(self):
+    index = DeadlineIndex(TestScheduler())
+    deadlines = [index.add(1000 + i, lambda: None) for i in range(100)]
+
+    for deadline in deadlines[:60]:
+      deadline.dispose()
+
+    self.assertLessEqual(len(index), 50, "disposed deadlines should be removed once they are the majority")
+
+    for deadline in deadlines[60:]:
+      deadline.dispose()
+
+    self.assertEqual(0, len(index), "disposed deadlines should be removed")
+
   def test_timer_relative_1(self):
     sched = TestScheduler()
 
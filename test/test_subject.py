@@ -0,0 +1,156 @@
+import unittest
+
+from rx.internal import Struct
+from rx.observable import Observable
+from rx.observer import Observer
+from rx.scheduler import HistoricalScheduler
+from rx.subject import BehaviorSubject, ConcurrentSubject, Subject
+
+import gc
+from threading import Thread
+
+
+class TestConcurrentSubject(unittest.TestCase):
+  def test_concurrent_producers(self):
+    producers = 8
+    count = 1000
+    state = Struct(values=[], busy=False, overlapped=False, completed=False)
+
+    def onNext(value):
+      if state.busy:
+        state.overlapped = True
+
+      state.busy = True
+      state.values.append(value)
+      state.busy = False
+
+    def onCompleted():
+      state.completed = True
+
+    subject = ConcurrentSubject()
+    subject.subscribe(onNext, None, onCompleted)
+
+    def produce(offset):
+      for i in range(count):
+        subject.onNext(offset + i)
+
+    threads = [Thread(target=produce, args=(p * count,)) for p in range(producers)]
+
+    for t in threads:
+      t.start()
+    for t in threads:
+      t.join()
+
+    subject.onCompleted()
+    subject.onNext(-1)
+
+    self.assertFalse(state.overlapped, "observer should never be called concurrently")
+    self.assertEqual(list(range(producers * count)), sorted(state.values), "all values should be delivered once")
+    self.assertTrue(state.completed, "onCompleted should be delivered")
+
+  def test_observer_error(self):
+    values = []
+    state = Struct(completed=False)
+
+    def onNext(value):
+      if value == 2:
+        raise Exception('boom')
+
+      values.append(value)
+
+    def onCompleted():
+      state.completed = True
+
+    subject = ConcurrentSubject()
+    subject.subscribe(onNext, None, onCompleted)
+
+    subject.onNext(1)
+    self.assertRaises(Exception, subject.onNext, 2)
+
+    # the failed drain must not leave the subject busy
+    subject.onNext(3)
+    subject.onCompleted()
+
+    self.assertEqual([1, 3], values, "values after the failure should be delivered")
+    self.assertTrue(state.completed, "onCompleted should be delivered")
+
+
+class TestWeakSubscriptions(unittest.TestCase):
+  def createObserver(self, values):
+    return Observer.create(values.append)
+
+  def test_weak_subject(self):
+    values = []
+    subject = Subject(weak=True)
+
+    kept = self.createObserver(values)
+    subject.subscribe(kept)
+    subject.subscribe(self.createObserver(values))
+    gc.collect()
+
+    subject.onNext(1)
+    subject.onNext(2)
+
+    self.assertEqual([1, 2], values, "only the referenced observer should receive values")
+    self.assertEqual(1, subject.reclaimedCount.value, "collected observer should be reclaimed once")
+    self.assertEqual(1, len(subject.currentObservers()), "collected observer should be removed")
+
+  def test_weak_subject_callbacks(self):
+    plain = []
+    selected = []
+    subject = Subject(weak=True)
+
+    d1 = subject.subscribe(plain.append)
+    d2 = subject.select(lambda x: x * 10).subscribe(selected.append)
+    subject.subscribe(lambda x: None)
+    gc.collect()
+
+    subject.onNext(1)
+
+    self.assertEqual([1], plain, "a callback should be kept alive by its subscription")
+    self.assertEqual([10], selected, "a query should be kept alive by its subscription")
+    self.assertEqual(1, subject.reclaimedCount.value, "a callback without subscription should be reclaimed")
+
+    d1.dispose()
+    d2.dispose()
+    subject.onNext(2)
+
+    self.assertEqual([1], plain, "disposed callback should not receive values")
+
+    values = []
+    subject = BehaviorSubject(0, weak=True)
+    d = subject.subscribe(values.append)
+    gc.collect()
+
+    subject.onNext(1)
+
+    self.assertEqual([0, 1], values, "a callback should be kept alive by its subscription")
+
+  def test_weak_behavior_subject_sweep(self):
+    values = []
+    scheduler = HistoricalScheduler()
+    subject = BehaviorSubject(0, weak=True)
+    subject.subscribe(self.createObserver(values))
+    subject.sweepOn(scheduler, 10)
+
+    gc.collect()
+    scheduler.advanceTo(10)
+
+    self.assertEqual([0], values, "observer should receive the initial value")
+    self.assertEqual(1, subject.reclaimedCount.value, "sweep should reclaim the collected observer")
+    self.assertFalse(subject.hasObservers, "sweep should remove the collected observer")
+
+  def test_subscribe_weak(self):
+    values = []
+    subject = Subject()
+
+    observer = self.createObserver(values)
+    subject.subscribeWeak(observer)
+    subject.onNext(1)
+
+    del observer
+    gc.collect()
+    subject.onNext(2)
+
+    self.assertEqual([1], values, "values should stop after the observer was collected")
+    self.assertEqual(0, len(subject.currentObservers()), "collected observer should be unsubscribed")